@@ -1,5 +1,5 @@
 import streamlit as st
-import pandas as pd
+
 
 # Sayfa yapılandırması
 st.set_page_config(
@@ -26,15 +26,6 @@ Bu platform, kalp hastalığı verilerini analiz etmenize, görselleştirmenize
 - **Hakkında**: Proje ve veri seti hakkında detaylı bilgi alabilirsiniz.
 """)
 
-# Veri setini yükleme
-@st.cache_data
-def load_data():
-    data = pd.read_csv('heart_cleaned.csv')
-    return data
-
-# Veri setini yükle
-df = load_data()
-
 # Hızlı erişim kartları
 st.header("Hızlı Erişim")
 
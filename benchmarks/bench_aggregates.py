@@ -0,0 +1,79 @@
+"""
+Veri görselleştirme sayfasındaki gruplama tablolarının ham veri çerçevesinden
+(pd.cut + pd.crosstab) ve toplam küpünden (core.aggregates) hesaplanmasının karşılaştırması.
+
+Küpün bir kez hesaplanma süresi ayrıca raporlanır. Betik önce iki yolun aynı
+tabloları ürettiğini doğrular.
+
+Kullanım:
+    python benchmarks/bench_aggregates.py --rows 1000 100000 1000000 10000000
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from core.aggregates import DIMENSIONS, build_cube  # noqa: E402
+from core.data import TARGET_COLUMN, load_data  # noqa: E402
+
+# Sayfadaki çok değişkenli grafiklerin boyut çiftleri
+CHARTS = [
+    ('YaşGrubu', 'Cinsiyet'),
+    ('GöğüsAğrısıTürü', 'EgzersizAnginası'),
+    ('KolesterolGrubu', 'KanBasıncıGrubu'),
+    ('YaşGrubuGeniş', 'KalpHızıGrubu'),
+]
+
+
+def _labels(df, name):
+    dim = DIMENSIONS[name]
+    if hasattr(dim, 'edges'):
+        return pd.cut(df[dim.column], bins=list(dim.edges), labels=list(dim.labels))
+    return pd.Categorical(df[dim.column].map(dict(dim.values)), categories=list(dim.labels))
+
+
+def crosstab(df, dims):
+    return pd.crosstab([_labels(df, dim) for dim in dims], df[TARGET_COLUMN])
+
+
+def _median_ms(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    base = load_data()
+    cube = build_cube(base)
+    for dims in CHARTS:
+        if not np.array_equal(crosstab(base, dims).to_numpy(), cube.table(*dims).to_numpy()):
+            raise SystemExit(f"{dims}: küp dilimi pd.crosstab ile aynı değil")
+
+    print(f"{'Satır':>12}{'crosstab ms':>14}{'küp dilimi ms':>16}{'küp oluşturma ms':>19}")
+    for rows in args.rows:
+        df = base.iloc[np.random.default_rng(0).integers(0, len(base), size=rows)].reset_index(drop=True)
+        raw_ms = _median_ms(lambda: [crosstab(df, dims) for dims in CHARTS], args.repeat) / len(CHARTS)
+        build_ms = _median_ms(lambda: build_cube(df), 1)
+        cube = build_cube(df)
+        slice_ms = _median_ms(lambda: [cube.table(*dims) for dims in CHARTS], args.repeat) / len(CHARTS)
+        print(f"{rows:>12,}{raw_ms:>14.2f}{slice_ms:>16.2f}{build_ms:>19.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Veri setinin CSV'den (pd.read_csv) ve sütunlu kopyadan (core.data.load_data) yüklenmesinin
+karşılaştırması: yükleme süresi ve yüklemeden sonra sürecin yerleşik belleği (RSS).
+
+Her ölçüm temiz bir alt süreçte yapılır. --rows verilirse heart_cleaned.csv satırları
+yeniden örneklenerek o boyutta sentetik bir CSV üretilir.
+
+Kullanım:
+    python benchmarks/bench_data_load.py
+    python benchmarks/bench_data_load.py --rows 1000000 10000000
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_MEASURE = r"""
+import json, sys, time
+sys.path.insert(0, sys.argv[1])
+import numpy as np, pandas as pd
+from core.data import load_data
+
+def rss_mb():
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) / 1024
+    return float('nan')
+
+mode, path, directory = sys.argv[2:5]
+before = rss_mb()
+start = time.perf_counter()
+if mode == 'csv':
+    df = pd.read_csv(path)
+else:
+    df = load_data(path, directory)
+seconds = time.perf_counter() - start
+# Sayfaların yaptığı gibi tüm sütunlara bir kez dokunulur
+checksum = float(sum(np.asarray(df[col], dtype=np.float64).sum() for col in df.columns))
+print(json.dumps({'seconds': seconds, 'rss_mb': rss_mb() - before, 'checksum': checksum}))
+"""
+
+
+def _measure(mode, path, directory):
+    output = subprocess.run(
+        [sys.executable, '-c', _MEASURE, ROOT, mode, path, directory],
+        cwd=ROOT, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def _synthetic_csv(rows, destination, seed=0):
+    df = pd.read_csv(os.path.join(ROOT, 'heart_cleaned.csv'))
+    sample = df.iloc[np.random.default_rng(seed).integers(0, len(df), size=rows)]
+    sample.to_csv(destination, index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, nargs='*', default=[],
+                        help="Sentetik veri boyutları (verilmezse yalnızca heart_cleaned.csv)")
+    args = parser.parse_args()
+
+    print(f"{'Satır':>12}{'CSV ms':>12}{'sütunlu ms':>12}{'hızlanma':>10}{'CSV RSS MB':>12}{'sütunlu RSS MB':>16}")
+    with tempfile.TemporaryDirectory() as tmp:
+        sources = [(None, os.path.join(ROOT, 'heart_cleaned.csv'))]
+        for rows in args.rows:
+            path = os.path.join(tmp, f"heart_{rows}.csv")
+            _synthetic_csv(rows, path)
+            sources.append((rows, path))
+
+        for rows, path in sources:
+            directory = os.path.join(tmp, 'columnar')
+            # İlk çağrı sütunlu kopyayı oluşturur; ölçüm ikinci (sıcak olmayan) süreçte yapılır
+            _measure('columnar', path, directory)
+
+            csv = _measure('csv', path, directory)
+            columnar = _measure('columnar', path, directory)
+            if csv['checksum'] != columnar['checksum']:
+                raise SystemExit(f"{path}: CSV ve sütunlu kopya farklı değerler içeriyor")
+
+            n_rows = rows if rows is not None else len(pd.read_csv(path, usecols=[0]))
+            print(f"{n_rows:>12,}{csv['seconds'] * 1000:>12.1f}{columnar['seconds'] * 1000:>12.1f}"
+                  f"{csv['seconds'] / columnar['seconds']:>9.1f}x{csv['rss_mb']:>12.1f}{columnar['rss_mb']:>16.1f}")
+
+
+if __name__ == '__main__':
+    main()
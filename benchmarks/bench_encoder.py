@@ -0,0 +1,86 @@
+"""
+FeatureEncoder ile preprocess_data karşılaştırması.
+
+Önce iki yolun aynı sütunları ve aynı değerleri ürettiği doğrulanır (veri setinin
+tamamı toplu olarak, ayrıca her satır tek tek), ardından 1, 1.000 ve 1.000.000
+satır için süreler ölçülür.
+
+Kullanım:
+    python benchmarks/bench_encoder.py
+    python benchmarks/bench_encoder.py --sizes 1 1000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from core.models import load_split  # noqa: E402
+from core.preprocessing import RAW_FEATURES, FeatureEncoder, preprocess_data  # noqa: E402
+from core.data import DATA_PATH  # noqa: E402
+
+
+def check_identical(encoder, df):
+    reference = preprocess_data(df, is_training=False, reference_columns=encoder.feature_names)
+    assert reference.columns.tolist() == encoder.feature_names
+
+    batch = encoder.encode_batch(df)
+    np.testing.assert_array_equal(batch, reference.to_numpy(dtype=np.float64))
+
+    # Tek satırlık yol (sayfadaki form) hem sözlük hem de NumPy satırıyla
+    raw = df[RAW_FEATURES].to_numpy(dtype=np.float64)
+    for i in range(len(df)):
+        expected = preprocess_data(df.iloc[[i]], is_training=False, reference_columns=encoder.feature_names)
+        expected = expected.to_numpy(dtype=np.float64)[0]
+        np.testing.assert_array_equal(encoder.encode(raw[i]), expected)
+        np.testing.assert_array_equal(encoder.encode(df.iloc[i].to_dict()), expected)
+
+
+def _time(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 1_000, 1_000_000])
+    parser.add_argument('--skip-check', action='store_true')
+    args = parser.parse_args()
+
+    df = pd.read_csv(DATA_PATH)[RAW_FEATURES]
+    encoder = FeatureEncoder(load_split().feature_names)
+
+    if not args.skip_check:
+        check_identical(encoder, df)
+        print(f"Doğrulama: {len(df)} satır, {encoder.n_features} sütun birebir aynı.")
+
+    rng = np.random.default_rng(0)
+    print(f"{'satır':>10}{'preprocess_data (ms)':>22}{'encoder (ms)':>15}{'hızlanma':>10}")
+    for n in args.sizes:
+        sample = df.iloc[rng.integers(0, len(df), size=n)].reset_index(drop=True)
+        repeat = 50 if n <= 1_000 else 3
+        if n == 1:
+            record = sample.iloc[0].to_dict()
+            out = np.empty(encoder.n_features)
+            encode = lambda: encoder.encode(record, out=out)  # noqa: E731
+        else:
+            raw = sample.to_numpy(dtype=np.float64)
+            encode = lambda: encoder.encode_batch(raw)  # noqa: E731
+        pandas_time = _time(lambda: preprocess_data(sample, is_training=False,
+                                                    reference_columns=encoder.feature_names), repeat)
+        encoder_time = _time(encode, repeat)
+        print(f"{n:>10}{pandas_time * 1000:>22.3f}{encoder_time * 1000:>15.3f}{pandas_time / encoder_time:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
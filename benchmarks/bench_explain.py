@@ -0,0 +1,109 @@
+"""
+Hasta başına risk faktörlerinin (core.explain) hesaplanma süresi.
+
+Her model için test setindeki hastalar tek tek (sayfadaki gibi) ve toplu olarak
+açıklanır. Rastgele Orman için karşılaştırma olarak aynı ağaç yolu katkıları
+forest.decision_path göstergesi ve düğüm başına katkı matrisiyle de hesaplanır.
+Betik önce katkıların toplamının modelin tahminine eşit olduğunu ve iki ağaç yolu
+hesabının aynı sonucu verdiğini doğrular.
+
+Kullanım:
+    python benchmarks/bench_explain.py --patients 200
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from core.explain import LINEAR, OCCLUSION, TREE_PATH, _group_matrix, explain  # noqa: E402
+from core.models import MODEL_OPTIONS, get_trained_model, load_split  # noqa: E402
+
+
+def decision_path_contributions(trained, X):
+    """decision_path üzerinden ağaç yolu katkıları (karşılaştırma için)."""
+    from scipy import sparse
+
+    forest = trained.model
+    positive = list(forest.classes_).index(1)
+    rows, cols, data = [], [], []
+    offset = 0
+    for estimator in forest.estimators_:
+        tree = estimator.tree_
+        proba = tree.value[:, 0, positive] / tree.value[:, 0, :].sum(axis=1)
+        internal = np.flatnonzero(tree.children_left >= 0)
+        for children in (tree.children_left[internal], tree.children_right[internal]):
+            rows.append(children + offset)
+            cols.append(tree.feature[internal])
+            data.append(proba[children] - proba[internal])
+        offset += tree.node_count
+    node_feature = sparse.csr_matrix(
+        (np.concatenate(data) / len(forest.estimators_), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(offset, X.shape[1]))
+    groups = _group_matrix(trained)
+
+    def contributions(rows):
+        indicator, _ = forest.decision_path(rows)
+        return (indicator @ node_feature) @ groups
+    return contributions
+
+
+def _per_patient_ms(fn, X):
+    fn(X[:1])
+    times = []
+    for i in range(len(X)):
+        start = time.perf_counter()
+        fn(X[i:i + 1])
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000, np.percentile(times, 95) * 1000
+
+
+def _batch_ms(fn, X, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(X)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--patients', type=int, default=200, help="Tek tek açıklanan hasta sayısı")
+    args = parser.parse_args()
+
+    X_test = load_split().raw_test
+    print(f"{'Model / yöntem':<44}{'hasta p50 ms':>13}{'hasta p95 ms':>13}{'toplu ms':>10}  (test seti: {len(X_test)} hasta)")
+    for model_option in MODEL_OPTIONS:
+        trained = get_trained_model(model_option)
+        X = trained.encode(X_test)
+
+        attribution = explain(trained, X)
+        if attribution.method == LINEAR:
+            expected = trained.model.decision_function(X)
+        else:
+            expected = trained.model.predict_proba(X)[:, 1]
+        if attribution.method != OCCLUSION and not np.allclose(attribution.prediction, expected, atol=1e-9):
+            raise SystemExit(f"{model_option}: katkıların toplamı tahmine eşit değil")
+
+        p50, p95 = _per_patient_ms(lambda rows: explain(trained, rows), X[:args.patients])
+        batch = _batch_ms(lambda rows: explain(trained, rows), X)
+        print(f"{model_option + ' / ' + attribution.method:<44}{p50:>13.2f}{p95:>13.2f}{batch:>10.1f}")
+
+        if attribution.method == TREE_PATH:
+            reference = decision_path_contributions(trained, X)
+            if not np.allclose(reference(X), attribution.contributions, atol=1e-9):
+                raise SystemExit("decision_path katkıları yaprak tablosuyla aynı değil")
+            p50, p95 = _per_patient_ms(reference, X[:args.patients])
+            batch = _batch_ms(reference, X)
+            print(f"{model_option + ' / decision_path':<44}{p50:>13.2f}{p95:>13.2f}{batch:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
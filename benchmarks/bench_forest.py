@@ -0,0 +1,74 @@
+"""
+Derlenmiş orman tahmincisinin (core.forest) scikit-learn ile karşılaştırılması.
+
+Uygulamanın Rastgele Orman modeli kullanılır. Betik önce derlenmiş yolun test setinde ve
+rastgele (test dağılımının dışına düşen, eksik değer içeren) girdilerde
+RandomForestClassifier.predict_proba ile bit düzeyinde aynı olasılıkları verdiğini
+doğrular, ardından satır sayısına göre medyan gecikmeyi ölçer. "otomatik" sütunu
+core.forest.predict_proba'nın (FLAT_MAX_ROWS eşiğiyle seçilen yol) süresidir.
+
+Kullanım:
+    python benchmarks/bench_forest.py --rows 1 10 100 1000 10000 --repeat 20
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from core import forest  # noqa: E402
+from core.models import get_trained_model, load_split  # noqa: E402
+
+
+def _median_ms(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, nargs='*', default=[1, 10, 100, 1_000, 10_000])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    trained = get_trained_model("Rastgele Orman")
+    model = trained.model
+    start = time.perf_counter()
+    flat = forest.compile_forest(model)
+    compile_ms = (time.perf_counter() - start) * 1000
+    print(f"Derleme: {compile_ms:.1f} ms, {len(flat.roots)} ağaç, {len(flat.feature):,} düğüm, "
+          f"en büyük derinlik {flat.depth}")
+
+    # Test seti ve test setinin çevresinden yeniden örneklenmiş, %1'i eksik satırlar
+    rng = np.random.default_rng(0)
+    X_test = trained.transform(load_split().X_test)
+    X_random = X_test[rng.integers(0, len(X_test), size=max(args.rows))] + rng.normal(
+        0.0, 0.5, size=(max(args.rows), X_test.shape[1]))
+    X_missing = X_random.copy()
+    X_missing[rng.random(X_missing.shape) < 0.01] = np.nan
+    for name, X in [('test seti', X_test), ('rastgele', X_random), ('eksik değerli', X_missing)]:
+        max_diff = np.abs(flat.predict_proba(X) - model.predict_proba(X)).max()
+        print(f"{name}: {len(X):,} satır, maks |Δp| = {max_diff:g}")
+
+    print(f"\n{'Satır':>8}{'sklearn ms':>12}{'derlenmiş ms':>14}{'otomatik ms':>13}{'hızlanma':>10}")
+    for rows in args.rows:
+        X = X_random[:rows]
+        repeat = args.repeat if rows <= 1_000 else max(3, args.repeat // 4)
+        sklearn_ms = _median_ms(lambda: model.predict_proba(X), repeat)
+        flat_ms = _median_ms(lambda: flat.predict_proba(X), repeat)
+        auto_ms = _median_ms(lambda: forest.predict_proba(model, X), repeat)
+        print(f"{rows:>8,}{sklearn_ms:>12.2f}{flat_ms:>14.2f}{auto_ms:>13.2f}{sklearn_ms / auto_ms:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Sayfa başına içe aktarma (import) süresi profili.
+
+Her sayfa yeni bir süreçte `python -X importtime` ile Streamlit'in bare kipinde bir kez
+çalıştırılır. Streamlit'in kendi içe aktarma süresi ayrı tutulur; sayfanın çalışması
+sırasında içe aktarılan üst düzey paketlerin toplam süresi ve en ağır paketler raporlanır.
+Ham importtime çıktısı --log-dir verilirse sayfa başına bir dosyaya yazılır
+(ör. `tuna` ile incelenebilir).
+
+Kullanım:
+    python benchmarks/bench_importtime.py
+    python benchmarks/bench_importtime.py --log-dir /tmp/importtime
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAGES = [
+    'Home.py',
+    'pages/1_Veri_Görselleştirme.py',
+    'pages/2_Tahmin_Modeli.py',
+    'pages/3_Tanıtım.py',
+    'pages/4_Model_Karşılaştırma.py',
+]
+
+HEAVY = ['matplotlib', 'seaborn', 'sklearn', 'scipy', 'joblib', 'PIL']
+
+MARKER = '--- sayfa ---'
+
+_RUN_PAGE = r"""
+import logging, os, runpy, sys, warnings
+sys.path.insert(0, os.getcwd())
+import streamlit
+from streamlit.runtime.scriptrunner_utils.exceptions import StopException
+logging.disable(logging.WARNING)
+warnings.simplefilter('ignore')
+print(MARKER, file=sys.stderr, flush=True)
+try:
+    runpy.run_path(sys.argv[1], run_name='__main__')
+except StopException:
+    pass
+heavy = [name for name in HEAVY if name in sys.modules]
+print('HEAVY ' + ','.join(heavy), file=sys.stderr, flush=True)
+""".replace('MARKER', repr(MARKER)).replace('HEAVY = ', '').replace('in HEAVY', f'in {HEAVY!r}')
+
+_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def profile_page(page, log_dir=None):
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _RUN_PAGE, page],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
+        name = os.path.splitext(os.path.basename(page))[0]
+        with open(os.path.join(log_dir, f"{name}.log"), 'w', encoding='utf-8') as f:
+            f.write(result.stderr)
+
+    streamlit_us, page_us, packages, heavy = 0, 0, {}, []
+    after_marker = False
+    for line in result.stderr.splitlines():
+        if line.startswith(MARKER):
+            after_marker = True
+            continue
+        if line.startswith('HEAVY '):
+            heavy = [name for name in line[6:].split(',') if name]
+            continue
+        match = _LINE.match(line)
+        # Yalnızca üst düzey içe aktarmalar (girinti 1) toplanır; alt modüller zaten bunlara dahildir
+        if not match or len(match.group(3)) != 1:
+            continue
+        cumulative, name = int(match.group(2)), match.group(4)
+        if after_marker:
+            page_us += cumulative
+            package = name.split('.')[0]
+            packages[package] = packages.get(package, 0) + cumulative
+        else:
+            streamlit_us += cumulative
+    top = sorted(packages.items(), key=lambda item: -item[1])[:4]
+    return streamlit_us / 1000, page_us / 1000, top, heavy
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--log-dir', help="Ham importtime çıktılarının yazılacağı klasör")
+    args = parser.parse_args()
+
+    print(f"{'Sayfa':<34}{'streamlit ms':>13}{'sayfa ms':>10}  ağır paketler / en pahalı içe aktarmalar")
+    for page in PAGES:
+        streamlit_ms, page_ms, top, heavy = profile_page(page, args.log_dir)
+        top_text = ', '.join(f"{name} {us / 1000:.0f}" for name, us in top)
+        print(f"{os.path.basename(page):<34}{streamlit_ms:>13.0f}{page_ms:>10.0f}  "
+              f"[{', '.join(heavy) or '-'}] {top_text}")
+
+
+if __name__ == '__main__':
+    main()
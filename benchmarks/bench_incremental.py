@@ -0,0 +1,151 @@
+"""
+Artımlı güncellemenin (core.incremental) tam yeniden eğitimle karşılaştırılması.
+
+1. Maliyet: heart_cleaned.csv satırları yeniden örneklenerek üretilen N satırlık geçmiş
+   için tam yeniden eğitim (StandardScaler + train_model) süresi ile N satır görmüş bir
+   modele --batch yeni satır katmanın süresi. Tam eğitim --max-full-rows (orman için
+   --max-forest-rows) üzerindeki boyutlarda bellek/süre nedeniyle atlanır.
+   SGD modeli geçmişi parça parça okuyarak kurulur (ilk akış süresi ayrıca yazılır).
+   Orman için ilk ağaçlar geçmişin ilk parçasıyla eğitilir, kalan satırlar yalnızca
+   rezervuara yazılır; güncelleme maliyeti yalnızca rezervuar boyutuna ve ağaç sayısına
+   bağlıdır.
+2. Doğruluk: uygulamanın eğitim seti --initial oranında bir ilk eğitim ve --parity-batch
+   satırlık güncellemelerle modele katılır; test doğruluğu ve ROC AUC tam eğitimle
+   karşılaştırılır.
+
+Kullanım:
+    python benchmarks/bench_incremental.py --rows 1000 10000 100000 1000000 10000000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from core.incremental import CHUNK_ROWS, IncrementalModel  # noqa: E402
+from core.models import DEFAULT_PARAMS, fit_trained_model, load_split, train_model  # noqa: E402
+
+MODELS = ["Lojistik Regresyon", "Rastgele Orman"]
+
+
+class Resampler:
+    """heart_cleaned.csv'nin kodlanmış satırlarından yerine koyarak örnekleme."""
+
+    def __init__(self, seed=0):
+        split = load_split()
+        self.X = np.concatenate([split.X_train.to_numpy(np.float64), split.X_test.to_numpy(np.float64)])
+        self.y = np.concatenate([split.y_train.to_numpy(), split.y_test.to_numpy()])
+        self.rng = np.random.default_rng(seed)
+
+    def sample(self, rows):
+        index = self.rng.integers(0, len(self.y), size=rows)
+        return self.X[index], self.y[index]
+
+    def chunks(self, rows, chunk_rows=CHUNK_ROWS):
+        for start in range(0, rows, chunk_rows):
+            yield self.sample(min(chunk_rows, rows - start))
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def full_refit(model_option, X, y):
+    from sklearn.preprocessing import StandardScaler
+
+    def fit():
+        scaler = StandardScaler()
+        return train_model(model_option, scaler.fit_transform(X), y)
+    return _timed(fit)[1]
+
+
+def incremental_state(model_option, rows, data):
+    """rows satır görmüş artımlı model ve onu kurmanın süresi."""
+    model = IncrementalModel(model_option)
+    start = time.perf_counter()
+    if model.is_forest:
+        capacity = model.params['reservoir_rows']
+        model.partial_fit(*data.sample(min(rows, capacity)))
+        # Kalan geçmiş ağaç eklenmeden rezervuara yazılır
+        for X, y in data.chunks(rows - min(rows, capacity)):
+            model._add_to_reservoir(X, y)
+            model.n_seen += len(y)
+    else:
+        for X, y in data.chunks(rows):
+            model.partial_fit(X, y)
+    return model, time.perf_counter() - start
+
+
+def cost_table(args, data):
+    print(f"{'Model':<22}{'Geçmiş':>12}{'tam eğitim s':>14}{'ilk akış s':>12}"
+          f"{f'+{args.batch} satır ms':>18}{'oran':>10}")
+    for model_option in MODELS:
+        limit = args.max_forest_rows if model_option == "Rastgele Orman" else args.max_full_rows
+        for rows in args.rows:
+            full = float('nan')
+            if rows <= limit:
+                X, y = data.sample(rows)
+                full = full_refit(model_option, X, y)
+                del X, y
+
+            model, build = incremental_state(model_option, rows, data)
+            batch = data.sample(args.batch)
+            update = min(_timed(lambda: model.partial_fit(*batch))[1] for _ in range(args.repeat))
+            ratio = f"{full / update:>9.0f}x" if full == full else f"{'—':>10}"
+            full_text = f"{full:>14.2f}" if full == full else f"{'—':>14}"
+            build_text = f"{build:>12.2f}" if not model.is_forest else f"{'—':>12}"
+            print(f"{model_option:<22}{rows:>12,}{full_text}{build_text}{update * 1000:>18.1f}{ratio}")
+
+
+def parity_table(args):
+    from sklearn.metrics import roc_auc_score
+
+    split = load_split()
+    X_train, y_train = split.X_train.to_numpy(np.float64), split.y_train.to_numpy()
+    X_test, y_test = split.X_test.to_numpy(np.float64), split.y_test.to_numpy()
+    initial = int(len(y_train) * args.initial)
+
+    print(f"\n{'Model':<22}{'tam doğruluk':>14}{'artımlı doğruluk':>18}{'tam AUC':>10}{'artımlı AUC':>13}"
+          f"{'güncelleme':>12}")
+    for model_option in MODELS:
+        full = fit_trained_model(model_option, DEFAULT_PARAMS[model_option])
+        full_proba = full.predict_proba(full.transform(X_test))[:, 1]
+
+        model = IncrementalModel(model_option)
+        model.partial_fit(X_train[:initial], y_train[:initial])
+        for start in range(initial, len(y_train), args.parity_batch):
+            model.partial_fit(X_train[start:start + args.parity_batch], y_train[start:start + args.parity_batch])
+        proba = model.predict_proba(X_test)[:, 1]
+
+        print(f"{model_option:<22}{full.metrics['accuracy']:>14.4f}{np.mean((proba >= 0.5) == y_test):>18.4f}"
+              f"{roc_auc_score(y_test, full_proba):>10.4f}{roc_auc_score(y_test, proba):>13.4f}"
+              f"{model.n_updates - 1:>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, nargs='*', default=[1_000, 10_000, 100_000, 1_000_000],
+                        help="Geçmişin satır sayıları")
+    parser.add_argument('--batch', type=int, default=1000, help="Güncellemede eklenen satır sayısı")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--max-full-rows', type=int, default=1_000_000)
+    parser.add_argument('--max-forest-rows', type=int, default=100_000)
+    parser.add_argument('--parity-batch', type=int, default=50, help="Doğruluk testinde güncelleme boyutu")
+    parser.add_argument('--initial', type=float, default=0.5, help="Doğruluk testinde ilk eğitimin oranı")
+    parser.add_argument('--skip-cost', action='store_true')
+    args = parser.parse_args()
+
+    if not args.skip_cost:
+        cost_table(args, Resampler())
+    parity_table(args)
+
+
+if __name__ == '__main__':
+    main()
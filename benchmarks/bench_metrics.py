@@ -0,0 +1,79 @@
+"""
+Aşama zamanlayıcılarının (core.metrics) maliyeti ve soğuk başlangıçta aşama dökümü.
+
+1. Ek yük: boş bir fonksiyonun çıplak, ölçüm kapalıyken ve açıkken timed() ile sarılmış
+   hali ile boş bir `with metrics.timer(...)` bloğunun çağrı başına süresi.
+2. Aşama dökümü: her model için model kayıt defteri ve dosyalar kullanılmadan
+   fit_trained_model çağrılır (ilk model veri yükleme, ön işleme ve bölmeyi de öder),
+   ardından tek satırlık predict_proba ve bir grafik çizimi ölçülür. Tablo aşama başına
+   adet ve toplam süreyi verir.
+
+Kullanım:
+    python benchmarks/bench_metrics.py --calls 1000000
+"""
+import argparse
+import os
+import sys
+import time
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from core.metrics import STAGES, StageMetrics, metrics  # noqa: E402
+
+
+def _overhead(calls):
+    def noop():
+        return None
+
+    probe = StageMetrics()
+    wrapped = probe.timed('probe')(noop)
+
+    def block():
+        with probe.timer('probe'):
+            pass
+
+    rows = [('çıplak çağrı', noop, False)]
+    for enabled in (False, True):
+        state = 'açık' if enabled else 'kapalı'
+        rows.append((f"timed(), ölçüm {state}", wrapped, enabled))
+        rows.append((f"with timer(), ölçüm {state}", block, enabled))
+
+    print(f"{'Yol':<28}{'ns/çağrı':>10}")
+    for name, func, enabled in rows:
+        probe.enabled = enabled
+        seconds = min(timeit.repeat(func, number=calls, repeat=3))
+        print(f"{name:<28}{seconds / calls * 1e9:>10.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--calls', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    _overhead(args.calls)
+
+    from core.figures import render_figure
+    from core.models import MODEL_OPTIONS, fit_trained_model, load_split
+
+    metrics.enabled = True
+    start = time.perf_counter()
+    for model_option in MODEL_OPTIONS:
+        trained = fit_trained_model(model_option)
+        trained.predict_proba(trained.encode(load_split().raw_test[:1]))
+    render_figure(lambda ax: ax.bar(['Sağlıklı', 'Kalp Hastalığı'], [0.3, 0.7]))
+    wall = time.perf_counter() - start
+
+    print(f"\nSoğuk başlangıç, {len(MODEL_OPTIONS)} model ({wall:.2f} s)")
+    print(f"{'Aşama':<18}{'adet':>6}{'toplam ms':>12}{'pay':>8}")
+    for row in metrics.summary():
+        print(f"{row['stage']:<18}{row['count']:>6}{row['total_s'] * 1000:>12.1f}{row['total_s'] / wall:>8.1%}")
+    missing = [stage for stage in STAGES if stage not in {row['stage'] for row in metrics.summary()}]
+    if missing:
+        print(f"Ölçülmeyen aşamalar: {', '.join(missing)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Uygulamadaki modellerin eğitim ve toplu tahmin (predict_proba) hızı.
+
+heart_cleaned.csv satırları yeniden örneklenir ve sürekli özelliklere küçük bir gürültü
+eklenerek (ağaçların yalnızca 1.430 farklı satırı ezberlememesi için) verilen boyutlarda
+eğitim ve tahmin setleri üretilir. Modeller uygulamadaki gibi train_model ile, modelin
+sütun düzeninde (one-hot; gradyan artırmada kategori kodları) ölçeklenmiş girdide eğitilir. SVM'in eğitim süresi satır sayısının karesiyle büyüdüğü için
+--max-svm-rows üzerindeki boyutlarda eğitim atlanır ve tahmin o boyutta eğitilmiş modelle
+ölçülür.
+
+Kullanım:
+    python benchmarks/bench_models.py --rows 1000 100000 1000000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from core.data import TARGET_COLUMN, load_data  # noqa: E402
+from core.models import MODEL_OPTIONS, fit_scaler, model_feature_names, train_model  # noqa: E402
+from core.preprocessing import FeatureEncoder  # noqa: E402
+
+# Sürekli özellikler ve eklenen gürültünün standart sapması
+JITTER = {'Yaş': 1.0, 'İstirahatKanBasıncı': 3.0, 'Kolesterol': 5.0, 'MaksimumKalpHızı': 3.0, 'STDepresyonu': 0.1}
+
+
+def synthetic(rows, seed):
+    df = load_data()
+    rng = np.random.default_rng(seed)
+    sample = df.iloc[rng.integers(0, len(df), size=rows)].reset_index(drop=True)
+    for column, scale in JITTER.items():
+        sample[column] = sample[column] + rng.normal(0.0, scale, size=rows)
+    return sample, sample[TARGET_COLUMN].to_numpy()
+
+
+def scaled_inputs(train, test, feature_names):
+    """Modelin sütun düzeninde kodlanmış ve eğitim satırlarıyla ölçeklenmiş matrisler."""
+    encoder = FeatureEncoder(feature_names)
+    X_train = np.ascontiguousarray(encoder.encode_batch(train))
+    X_test = np.ascontiguousarray(encoder.encode_batch(test))
+    scaler = fit_scaler(X_train, feature_names)
+    return scaler.transform(X_train), scaler.transform(X_test)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, nargs='*', default=[1_000, 100_000, 1_000_000])
+    parser.add_argument('--models', nargs='*', default=MODEL_OPTIONS, choices=MODEL_OPTIONS)
+    parser.add_argument('--max-svm-rows', type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"{'Model':<28}{'Satır':>12}{'eğitim s':>10}{'eğitim satır/s':>16}{'tahmin s':>10}{'tahmin satır/s':>16}"
+          f"{'doğruluk':>10}")
+    for rows in args.rows:
+        train, y_train = synthetic(rows, seed=0)
+        test, y_test = synthetic(rows, seed=1)
+        inputs = {}
+
+        for model_option in args.models:
+            # Kategorik modeller (gradyan artırma) one-hot yerine kod sütunlarıyla çalışır
+            feature_names = model_feature_names(model_option)
+            layout = tuple(feature_names)
+            if layout not in inputs:
+                inputs = {layout: scaled_inputs(train, test, feature_names)}
+            X_train, X_test = inputs[layout]
+            train_rows = min(rows, args.max_svm_rows) if model_option == "Destek Vektör Makinesi" else rows
+            start = time.perf_counter()
+            model = train_model(model_option, X_train[:train_rows], y_train[:train_rows], feature_names=feature_names)
+            train_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            proba = model.predict_proba(X_test)[:, 1]
+            predict_seconds = time.perf_counter() - start
+            accuracy = np.mean((proba >= 0.5) == y_test)
+
+            train_text = (f"{train_seconds:>10.2f}{train_rows / train_seconds:>16,.0f}" if train_rows == rows
+                          else f"{'—':>10}{f'({train_rows:,} satır)':>16}")
+            print(f"{model_option:<28}{rows:>12,}{train_text}{predict_seconds:>10.2f}"
+                  f"{rows / predict_seconds:>16,.0f}{accuracy:>10.4f}")
+
+
+if __name__ == '__main__':
+    main()
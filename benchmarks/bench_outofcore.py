@@ -0,0 +1,102 @@
+"""
+Parça parça eğitimin (core.outofcore) sayfalardaki bellek içi eğitimle karşılaştırılması:
+süre ve sürecin en yüksek yerleşik belleği (peak RSS).
+
+heart_cleaned.csv satırları yeniden örneklenerek verilen boyutlarda sentetik CSV'ler
+üretilir. Her ölçüm temiz bir alt süreçte ve --memory-limit-mb adres alanı sınırıyla
+yapılır; sınırı aşan yapılandırmalar MemoryError olarak raporlanır. Süreler kodlanmış
+matrislerin oluşturulmasını (soğuk önbellek) içerir.
+
+- bellek içi: fit_trained_model("Lojistik Regresyon") (load_data -> preprocess_data ->
+  train_test_split -> StandardScaler -> LogisticRegression)
+- parça SGD: fit_out_of_core("Lojistik Regresyon")
+- parça HGB: fit_out_of_core("Histogram Gradyan Artırma")
+
+Kullanım:
+    python benchmarks/bench_outofcore.py --rows 100000 1000000 10000000
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_MEASURE = r"""
+import json, resource, sys, time
+sys.path.insert(0, sys.argv[1])
+mode, path, limit_mb = sys.argv[2], sys.argv[3], int(sys.argv[4])
+resource.setrlimit(resource.RLIMIT_AS, (limit_mb << 20, limit_mb << 20))
+
+from core.models import fit_trained_model
+from core.outofcore import fit_out_of_core, peak_rss_mb
+
+baseline = peak_rss_mb()
+start = time.perf_counter()
+try:
+    if mode == 'bellek içi':
+        trained = fit_trained_model("Lojistik Regresyon", path=path)
+    elif mode == 'parça SGD':
+        trained = fit_out_of_core("Lojistik Regresyon", path)
+    else:
+        trained = fit_out_of_core("Histogram Gradyan Artırma", path)
+    result = {'seconds': time.perf_counter() - start, 'accuracy': float(trained.metrics['accuracy'])}
+except MemoryError:
+    result = {'error': 'MemoryError'}
+result.update(peak_mb=peak_rss_mb(), baseline_mb=baseline)
+print(json.dumps(result))
+"""
+
+MODES = ['bellek içi', 'parça SGD', 'parça HGB']
+
+
+def _synthetic_csv(rows, destination, seed=0, chunk_rows=1_000_000):
+    df = pd.read_csv(os.path.join(ROOT, 'heart_cleaned.csv'))
+    rng = np.random.default_rng(seed)
+    for start in range(0, rows, chunk_rows):
+        sample = df.iloc[rng.integers(0, len(df), size=min(chunk_rows, rows - start))]
+        sample.to_csv(destination, index=False, mode='a' if start else 'w', header=not start)
+
+
+def _measure(mode, path, workdir, limit_mb):
+    completed = subprocess.run(
+        [sys.executable, '-c', _MEASURE, ROOT, mode, path, str(limit_mb)],
+        cwd=workdir, capture_output=True, text=True,
+    )
+    if completed.returncode != 0:
+        return {'error': completed.stderr.strip().splitlines()[-1] if completed.stderr else 'hata'}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, nargs='*', default=[100_000, 1_000_000])
+    parser.add_argument('--memory-limit-mb', type=int, default=4000,
+                        help="Alt süreçlerin adres alanı sınırı (MB)")
+    args = parser.parse_args()
+
+    print(f"{'Satır':>12}  {'Yol':<12}{'süre s':>9}{'en yüksek RSS MB':>18}{'doğruluk':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            path = os.path.join(tmp, f"heart_{rows}.csv")
+            _synthetic_csv(rows, path)
+            for mode in MODES:
+                # Her yol kendi (boş) önbellek klasöründe çalışır
+                workdir = os.path.join(tmp, f"{rows}-{MODES.index(mode)}")
+                os.makedirs(workdir)
+                result = _measure(mode, path, workdir, args.memory_limit_mb)
+                if 'error' in result:
+                    print(f"{rows:>12,}  {mode:<12}{result['error']:>37}")
+                    continue
+                print(f"{rows:>12,}  {mode:<12}{result['seconds']:>9.1f}{result['peak_mb']:>18.0f}"
+                      f"{result['accuracy']:>10.4f}")
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Taşınabilir modellerin (core.portable + core.runtime) joblib model dosyalarıyla karşılaştırılması.
+
+Her model geçici bir klasöre hem joblib (core.artifacts) hem .npz (core.portable) olarak
+yazılır. Betik önce çalışma zamanının test setinde ve ham kayıtlardan (eksik değerli
+kayıtlar dahil) scikit-learn ile aynı olasılıkları verdiğini doğrular. Ardından her yol
+temiz bir alt süreçte çalıştırılır: içe aktarma + dosya yükleme + tek kayıt tahmini süresi
+ve sürecin en yüksek yerleşik belleği (peak RSS).
+
+Kullanım:
+    python benchmarks/bench_portable.py --repeat 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from core.artifacts import save_artifact  # noqa: E402
+from core.data import load_data  # noqa: E402
+from core.models import MODEL_OPTIONS, get_trained_model, load_split  # noqa: E402
+from core.portable import export_model, parity  # noqa: E402
+from core.preprocessing import RAW_FEATURES  # noqa: E402
+from core.runtime import load_portable  # noqa: E402
+
+_MEASURE = r"""
+import json, sys, time
+start = time.perf_counter()
+sys.path.insert(0, sys.argv[1])
+mode, model_option, path = sys.argv[2], sys.argv[3], sys.argv[4]
+record = {'Yaş': 45, 'Cinsiyet': 1, 'GöğüsAğrısıTürü': 0, 'İstirahatKanBasıncı': 130, 'Kolesterol': 250,
+          'AçlıkKanŞekeri': 0, 'İstirahatEKG': 0, 'MaksimumKalpHızı': 150, 'EgzersizAnginası': 0,
+          'STDepresyonu': 1.0, 'ST_Eğimi': 1}
+if mode == 'joblib':
+    from core.artifacts import load_artifact
+    trained = load_artifact(model_option, directory=path)
+    risk = trained.predict_proba(trained.encode([record]))[0, 1]
+else:
+    from core.runtime import load_portable
+    risk = load_portable(path).predict_risk(record)[0]
+seconds = time.perf_counter() - start
+# ru_maxrss fork sırasında üst süreçten devralınır; VmHWM exec ile sıfırlanır
+with open('/proc/self/status') as status:
+    peak_kb = next(int(line.split()[1]) for line in status if line.startswith('VmHWM'))
+print(json.dumps({'seconds': seconds, 'peak_mb': peak_kb / 1024,
+                  'risk': float(risk), 'modules': sorted(m for m in ('pandas', 'sklearn', 'scipy') if m in sys.modules)}))
+"""
+
+
+def _measure(mode, model_option, path):
+    completed = subprocess.run([sys.executable, '-c', _MEASURE, ROOT, mode, model_option, path],
+                               capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--models', nargs='*', default=MODEL_OPTIONS, choices=MODEL_OPTIONS)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    # Ham kayıtlar: veri setinden örneklem, %5'i eksik
+    rng = np.random.default_rng(0)
+    records = load_data()[RAW_FEATURES].sample(1000, random_state=0).to_numpy(dtype=np.float64)
+    records[rng.random(records.shape) < 0.05] = np.nan
+    X_test = load_split().raw_test
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'Model':<28}{'KB':>7}{'test |Δp|':>12}{'ham kayıt |Δp|':>16}")
+        for model_option in args.models:
+            trained = get_trained_model(model_option)
+            save_artifact(trained, tmp)
+            path = export_model(trained, directory=tmp)
+            portable = load_portable(path)
+            test_diff = parity(trained, portable, trained.encode(X_test))
+            expected = trained.predict_proba(trained.encode(records))[:, 1]
+            raw_diff = np.abs(portable.predict_risk(records) - expected).max()
+            print(f"{model_option:<28}{os.path.getsize(path) / 1024:>7.0f}{test_diff:>12.1e}{raw_diff:>16.1e}")
+            results.append((model_option, path))
+
+        print(f"\n{'Model':<28}{'Yol':<9}{'ilk tahmin ms':>15}{'en yüksek RSS MB':>18}  içe aktarılan")
+        for model_option, path in results:
+            for mode, target in [('joblib', tmp), ('npz', path)]:
+                runs = [_measure(mode, model_option, target) for _ in range(args.repeat)]
+                seconds = statistics.median(run['seconds'] for run in runs)
+                peak = statistics.median(run['peak_mb'] for run in runs)
+                print(f"{model_option:<28}{mode:<9}{seconds * 1000:>15.0f}{peak:>18.0f}  "
+                      f"{', '.join(runs[0]['modules']) or '-'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+Taşınabilir modellerin azaltılmış duyarlıkla (core.runtime: float32, int8) çalıştırılması.
+
+1. Doğruluk raporu: her model ve duyarlık için test setinde doğruluk, ROC AUC, scikit-learn
+   olasılıklarından en büyük fark ve 0.5 eşiğinde etiketi değişen hasta sayısı.
+2. Toplu puanlama: heart_cleaned.csv satırlarının yeniden örneklenmesiyle üretilen --rows
+   ham kayıt (varsayılan 1 milyon) her yol için temiz bir alt süreçte puanlanır (kodlama +
+   ölçekleme + tahmin). Süre, satır/s ve puanlama sırasında sürecin belleğindeki en büyük
+   artış (VmHWM - puanlama öncesi VmRSS) raporlanır. 'sklearn' satırı aynı modelin joblib
+   dosyasından TrainedModel ile puanlanmasıdır.
+
+Kullanım:
+    python benchmarks/bench_precision.py --rows 1000000
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from core.artifacts import save_artifact  # noqa: E402
+from core.data import load_data  # noqa: E402
+from core.models import MODEL_OPTIONS, get_trained_model, load_split  # noqa: E402
+from core.portable import export_model  # noqa: E402
+from core.preprocessing import RAW_FEATURES  # noqa: E402
+from core.runtime import PRECISIONS, load_portable  # noqa: E402
+
+_MEASURE = r"""
+import json, sys, time
+import numpy as np
+sys.path.insert(0, sys.argv[1])
+mode, model_option, path, records_path = sys.argv[2:6]
+
+def status(field):
+    with open('/proc/self/status') as f:
+        return next(int(line.split()[1]) for line in f if line.startswith(field)) / 1024
+
+if mode == 'sklearn':
+    from core.artifacts import load_artifact
+    trained = load_artifact(model_option, directory=path)
+    score = lambda records: trained.predict_proba(trained.encode(records))[:, 1]
+else:
+    from core.runtime import load_portable
+    score = load_portable(path, precision=mode).predict_risk
+records = np.load(records_path)
+score(records[:100])
+
+before = status('VmRSS')
+start = time.perf_counter()
+risk = score(records)
+seconds = time.perf_counter() - start
+print(json.dumps({'seconds': seconds, 'memory_mb': status('VmHWM') - before, 'mean_risk': float(risk.mean())}))
+"""
+
+
+def _measure(mode, model_option, path, records_path):
+    completed = subprocess.run([sys.executable, '-c', _MEASURE, ROOT, mode, model_option, path, records_path],
+                               capture_output=True, text=True)
+    if completed.returncode != 0:
+        return {'error': completed.stderr.strip().splitlines()[-1] if completed.stderr else 'hata'}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--models', nargs='*', default=MODEL_OPTIONS, choices=MODEL_OPTIONS)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    from sklearn.metrics import roc_auc_score
+
+    split = load_split()
+    df = load_data()
+    rng = np.random.default_rng(0)
+    records = df[RAW_FEATURES].to_numpy(dtype=np.float64)[rng.integers(0, len(df), size=args.rows)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        records_path = os.path.join(tmp, 'records.npy')
+        np.save(records_path, records)
+        del records
+
+        print(f"{'Model':<28}{'Duyarlık':<10}{'doğruluk':>10}{'AUC':>8}{'maks |Δp|':>11}{'değişen':>9}")
+        paths = {}
+        for model_option in args.models:
+            trained = get_trained_model(model_option)
+            save_artifact(trained, tmp)
+            paths[model_option] = export_model(trained, directory=tmp)
+            X_test = trained.encode(split.raw_test)
+            reference = trained.model.predict_proba(X_test)[:, 1]
+            for precision in PRECISIONS[load_portable(paths[model_option]).meta['kind']]:
+                risk = load_portable(paths[model_option], precision).predict_proba(X_test)[:, 1]
+                accuracy = np.mean((risk >= 0.5) == split.y_test)
+                changed = int(np.sum((risk >= 0.5) != (reference >= 0.5)))
+                print(f"{model_option:<28}{precision:<10}{accuracy:>10.4f}{roc_auc_score(split.y_test, risk):>8.4f}"
+                      f"{np.abs(risk - reference).max():>11.1e}{changed:>9}")
+
+        print(f"\n{args.rows:,} ham kayıt")
+        print(f"{'Model':<28}{'Yol':<10}{'süre s':>8}{'satır/s':>13}{'bellek artışı MB':>18}")
+        for model_option in args.models:
+            kind = load_portable(paths[model_option]).meta['kind']
+            for mode, path in [('sklearn', tmp)] + [(precision, paths[model_option]) for precision in PRECISIONS[kind]]:
+                result = _measure(mode, model_option, path, records_path)
+                if 'error' in result:
+                    print(f"{model_option:<28}{mode:<10}{result['error']:>39}")
+                    continue
+                print(f"{model_option:<28}{mode:<10}{result['seconds']:>8.2f}{args.rows / result['seconds']:>13,.0f}"
+                      f"{result['memory_mb']:>18.0f}")
+
+
+if __name__ == '__main__':
+    main()
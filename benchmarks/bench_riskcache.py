@@ -0,0 +1,110 @@
+"""
+Tahmin önbelleğinin (core.riskcache) isabet ve ıska gecikmeleri.
+
+Form benzeri kayıtlar heart_cleaned.csv'deki --distinct hastadan (varsayılan 200) tekrarlı
+olarak çekilir; her model için önce --requests tek kayıtlık tahmin doğrudan
+(encode + predict_proba), ardından önbellek üzerinden yapılır. Tablo ilk (ıska) ve
+tekrarlanan (isabet) isteklerin ortanca sürelerini ve isabet oranını verir.
+
+Ardından disk deposu (SQLite) ile iki kontrol yapılır: sonuçlar yeni bir PredictionCache
+örneğinde (süreç yeniden başlatılmış gibi) diskten okunur ve model değiştiğinde (farklı
+hiperparametreyle eğitilmiş model) eski sürümün girdileri silinir.
+
+Kullanım:
+    python benchmarks/bench_riskcache.py --requests 2000
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from core.data import load_data  # noqa: E402
+from core.models import DEFAULT_PARAMS, MODEL_OPTIONS, get_trained_model  # noqa: E402
+from core.preprocessing import RAW_FEATURES  # noqa: E402
+from core.riskcache import PredictionCache  # noqa: E402
+
+
+def _records(distinct, count):
+    df = load_data()[RAW_FEATURES].sample(distinct, random_state=0)
+    patients = df.to_dict('records')
+    rng = np.random.default_rng(0)
+    return [patients[i] for i in rng.integers(0, len(patients), size=count)]
+
+
+def _median_ms(values):
+    return statistics.median(values) * 1000 if values else float('nan')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--models', nargs='*', default=MODEL_OPTIONS, choices=MODEL_OPTIONS)
+    parser.add_argument('--distinct', type=int, default=200)
+    parser.add_argument('--requests', type=int, default=2000)
+    args = parser.parse_args()
+
+    records = _records(args.distinct, args.requests)
+
+    print(f"{args.requests} istek, {args.distinct} farklı hasta")
+    print(f"{'Model':<28}{'doğrudan ms':>13}{'ıska ms':>10}{'isabet ms':>11}{'isabet oranı':>14}")
+    for model_option in args.models:
+        trained = get_trained_model(model_option)
+        cache = PredictionCache()
+        cache.key(trained, records[0])  # model sürümü (joblib.hash) bir kez hesaplanır
+
+        direct = []
+        for record in records:
+            start = time.perf_counter()
+            trained.predict_proba(trained.encode([record]))
+            direct.append(time.perf_counter() - start)
+
+        misses, hits = [], []
+        for record in records:
+            start = time.perf_counter()
+            seen = cache.stats()['entries']
+            cache.predict(trained, [record])
+            seconds = time.perf_counter() - start
+            (misses if cache.stats()['entries'] > seen else hits).append(seconds)
+
+        print(f"{model_option:<28}{_median_ms(direct):>13.3f}{_median_ms(misses):>10.3f}{_median_ms(hits):>11.3f}"
+              f"{cache.stats()['hit_rate']:>14.1%}")
+
+    model_option = args.models[0]
+    trained = get_trained_model(model_option)
+    sample = records[:args.distinct]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'predictions.sqlite')
+        expected = PredictionCache(path=path).predict(trained, sample)
+
+        restarted = PredictionCache(path=path)
+        start = time.perf_counter()
+        restored = restarted.predict(trained, sample)
+        seconds = time.perf_counter() - start
+        stats = restarted.stats()
+        print(f"\nDisk deposu ({model_option}): yeni örnekte {stats['disk_hits']} disk isabeti, "
+              f"{stats['misses']} ıska, {seconds * 1000 / len(sample):.3f} ms/kayıt, "
+              f"maks |Δp| = {np.abs(restored - expected).max():.1e}")
+
+        params = dict(DEFAULT_PARAMS.get(model_option, {}))
+        changed = None
+        for name, value in params.items():
+            if isinstance(value, int) and not isinstance(value, bool):
+                changed = get_trained_model(model_option, {**params, name: value + 1})
+                break
+        if changed is None:
+            print("Sürüm değişikliği: modelin tam sayı hiperparametresi yok, atlandı")
+            return
+        restarted.key(changed, sample[0])
+        rows = restarted._db.execute('SELECT COUNT(*) FROM predictions').fetchone()[0]
+        print(f"Sürüm değişikliği: bellekte {restarted.stats()['entries']} girdi, diskte {rows} satır kaldı")
+
+
+if __name__ == '__main__':
+    main()
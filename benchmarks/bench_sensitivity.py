@@ -0,0 +1,86 @@
+"""
+Duyarlılık analizinin (core.sensitivity) süresi.
+
+Her model için tek özellikli (N nokta) ve iki özellikli (N x N) ızgara, ızgara kurma ve
+puanlama dahil ölçülür. Karşılaştırma için aynı senaryoların form üzerinden tek tek
+(kayıt başına bir predict_proba çağrısı) puanlanması bir örneklem üzerinden tahmin edilir.
+Betik önce taramanın ızgara matrisindeki model.predict_proba ile aynı riski verdiğini
+doğrular. Bir modelin iki özellikli ızgarası --target-ms'yi aşarsa betik hata koduyla biter.
+
+Kullanım:
+    python benchmarks/bench_sensitivity.py --steps 200 --repeat 5
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from core.models import MODEL_OPTIONS, get_trained_model  # noqa: E402
+from core.sensitivity import sensitivity_sweep, sweep_matrix  # noqa: E402
+
+RECORD = {
+    'Yaş': 45, 'Cinsiyet': 1, 'GöğüsAğrısıTürü': 0, 'İstirahatKanBasıncı': 130, 'Kolesterol': 250,
+    'AçlıkKanŞekeri': 0, 'İstirahatEKG': 0, 'MaksimumKalpHızı': 150, 'EgzersizAnginası': 0,
+    'STDepresyonu': 1.0, 'ST_Eğimi': 1,
+}
+
+FEATURES = ['Kolesterol', 'MaksimumKalpHızı']
+
+# Tek tek puanlama süresi bu kadar senaryo üzerinden ölçülüp ızgaraya oranlanır
+PER_RECORD_SAMPLE = 200
+
+# İki özellikli ızgaranın model başına süre hedefi (ms)
+TARGET_MS = 200
+
+
+def _median_ms(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--steps', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--target-ms', type=float, default=TARGET_MS)
+    args = parser.parse_args()
+
+    print(f"{'Model':<26}{'1B ms':>8}{'2B ms':>9}{'tek tek ms (tahmini)':>23}{'maks |Δp|':>12}")
+    slow = []
+    for model_option in MODEL_OPTIONS:
+        trained = get_trained_model(model_option)
+
+        result = sensitivity_sweep(trained, RECORD, FEATURES, args.steps)
+        X = sweep_matrix(trained, RECORD, FEATURES, result.grids)
+        max_diff = np.abs(result.risk.ravel() - trained.model.predict_proba(X)[:, 1]).max()
+        if max_diff > 1e-12:
+            raise SystemExit(f"{model_option}: tarama ızgaranın predict_proba sonucundan farklı")
+
+        one_ms = _median_ms(lambda: sensitivity_sweep(trained, RECORD, FEATURES[:1], args.steps), args.repeat)
+        two_ms = _median_ms(lambda: sensitivity_sweep(trained, RECORD, FEATURES, args.steps), args.repeat)
+
+        sample = X[:PER_RECORD_SAMPLE]
+        per_record_ms = _median_ms(lambda: [trained.model.predict_proba(row[np.newaxis, :]) for row in sample], 1)
+        naive_ms = per_record_ms / len(sample) * len(X)
+
+        print(f"{model_option:<26}{one_ms:>8.1f}{two_ms:>9.1f}{naive_ms:>23,.0f}{max_diff:>12.1e}")
+        if two_ms > args.target_ms:
+            slow.append(f"{model_option} ({two_ms:.1f} ms)")
+
+    if slow:
+        raise SystemExit(f"{args.steps}x{args.steps} ızgara {args.target_ms:g} ms hedefini aşıyor: {', '.join(slow)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Yeni başlatılan bir süreçte ilk tahmine hazır olma süresini ölçer:
+açılışta eğitim ile model dosyasından yükleme karşılaştırılır.
+
+Her ölçüm temiz bir Python sürecinde yapılır (içe aktarma süresi hariç).
+Model dosyaları yoksa önce `python -m core.train` ile oluşturulur.
+
+Kullanım:
+    python benchmarks/bench_startup.py --repeat 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def _worker(mode, model_option):
+    from core.artifacts import load_artifact
+    from core.data import data_fingerprint
+    from core.models import fit_trained_model
+
+    start = time.perf_counter()
+    if mode == 'train':
+        trained = fit_trained_model(model_option)
+    else:
+        trained = load_artifact(model_option, data_fingerprint())
+        if trained is None:
+            raise SystemExit(f"{model_option} için güncel model dosyası bulunamadı")
+    # İlk tahmin de ölçüme dahildir
+    trained.predict_proba(trained.transform(
+        __import__('numpy').zeros((1, len(trained.feature_names)))))
+    print(json.dumps({'seconds': time.perf_counter() - start}))
+
+
+def _measure(mode, model_option):
+    out = subprocess.run(
+        [sys.executable, __file__, '--worker', mode, model_option],
+        cwd=ROOT, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])['seconds']
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--worker', nargs=2, metavar=('MODE', 'MODEL'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        _worker(*args.worker)
+        return
+
+    from core.models import MODEL_OPTIONS
+
+    subprocess.run([sys.executable, '-m', 'core.train'], cwd=ROOT, check=True, capture_output=True)
+
+    print(f"{'Model':<26}{'eğitim (ms)':>14}{'yükleme (ms)':>14}{'hızlanma':>10}")
+    for model_option in MODEL_OPTIONS:
+        train = statistics.median(_measure('train', model_option) for _ in range(args.repeat))
+        load = statistics.median(_measure('load', model_option) for _ in range(args.repeat))
+        print(f"{model_option:<26}{train * 1000:>14.1f}{load * 1000:>14.1f}{train / load:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
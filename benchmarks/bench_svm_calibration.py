@@ -0,0 +1,79 @@
+"""
+SVM olasılıkları için iki yolun karşılaştırması:
+
+- eski yol: SVC(probability=True), fit sırasında içeride 5 katlı Platt ölçekleme
+- yeni yol: SVC bir kez eğitilir, ayrılan parça üzerinde sigmoid/isotonic kalibrasyon
+
+Eğitim süreleri ve test setindeki olasılık kalitesi (Brier, log-loss, ROC AUC)
+ile iki yolun olasılıkları arasındaki fark raporlanır.
+
+Kullanım:
+    python benchmarks/bench_svm_calibration.py --repeat 5
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+import warnings
+
+import numpy as np
+from sklearn.metrics import accuracy_score, brier_score_loss, log_loss, roc_auc_score
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import SVC
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from core.models import RANDOM_STATE, load_split, train_model  # noqa: E402
+
+
+def _timed_fit(fit, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        model = fit()
+        times.append(time.perf_counter() - start)
+    return model, statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    split = load_split()
+    scaler = StandardScaler()
+    X_train = scaler.fit_transform(split.X_train)
+    X_test = scaler.transform(split.X_test)
+    y_train, y_test = split.y_train, split.y_test
+
+    def fit_legacy():
+        with warnings.catch_warnings():
+            # scikit-learn 1.9 'probability' parametresini kullanımdan kaldırıyor
+            warnings.simplefilter('ignore', FutureWarning)
+            return SVC(probability=True, random_state=RANDOM_STATE).fit(X_train, y_train)
+
+    candidates = [("SVC(probability=True)", fit_legacy)]
+    for method in ('sigmoid', 'isotonic'):
+        candidates.append((
+            f"SVC + {method} kalibrasyon",
+            lambda method=method: train_model("Destek Vektör Makinesi", X_train, y_train, {'calibration': method}),
+        ))
+
+    reference = None
+    print(f"{'Yol':<28}{'eğitim ms':>10}{'doğruluk':>10}{'Brier':>8}{'logloss':>9}{'AUC':>7}{'|Δp| ort.':>11}")
+    for label, fit in candidates:
+        model, seconds = _timed_fit(fit, args.repeat)
+        proba = model.predict_proba(X_test)[:, 1]
+        if reference is None:
+            reference = proba
+        print(f"{label:<28}{seconds * 1000:>10.1f}"
+              f"{accuracy_score(y_test, model.predict(X_test)):>10.4f}"
+              f"{brier_score_loss(y_test, proba):>8.4f}{log_loss(y_test, proba):>9.4f}"
+              f"{roc_auc_score(y_test, proba):>7.4f}{np.abs(proba - reference).mean():>11.4f}")
+
+
+if __name__ == '__main__':
+    main()
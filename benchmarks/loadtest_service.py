@@ -0,0 +1,149 @@
+"""
+Tahmin servisine (core.service) localhost üzerinden yük bindirir ve gecikme
+yüzdeliklerini (p50/p99) ile saniyedeki istek sayısını raporlar.
+
+Varsayılan olarak servis bu betik tarafından alt süreç olarak başlatılır ve
+birleştirme açık/kapalı iki yapılandırma karşılaştırılır. Çalışan bir servisi
+ölçmek için --url verilebilir.
+
+Kullanım:
+    python benchmarks/loadtest_service.py --concurrency 64 --requests 5000
+    python benchmarks/loadtest_service.py --url http://127.0.0.1:8000 --batch-size 100
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from urllib.parse import urlparse
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from core.preprocessing import RAW_FEATURES  # noqa: E402
+
+
+def _sample_records(n, seed=0):
+    df = pd.read_csv(os.path.join(ROOT, 'heart_cleaned.csv'))[RAW_FEATURES]
+    rows = df.iloc[np.random.default_rng(seed).integers(0, len(df), size=n)]
+    return [{k: (v.item() if hasattr(v, 'item') else v) for k, v in r.items()} for r in rows.to_dict('records')]
+
+
+async def _request(reader, writer, host, path, payload):
+    body = json.dumps(payload).encode('utf-8')
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode('latin-1') + body
+    )
+    await writer.drain()
+
+    status_line = await reader.readline()
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    data = await reader.readexactly(length)
+    if b' 200 ' not in status_line:
+        raise RuntimeError(f"{status_line.decode().strip()}: {data.decode()}")
+
+
+async def _client(host, port, path, payloads, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for payload in payloads:
+            start = time.perf_counter()
+            await _request(reader, writer, host, path, payload)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, model, concurrency, n_requests, batch_size):
+    records = _sample_records(n_requests * batch_size)
+    if batch_size == 1:
+        path = '/predict'
+        payloads = [{'model': model, 'record': r} for r in records]
+    else:
+        path = '/predict/batch'
+        payloads = [{'model': model, 'records': records[i:i + batch_size]}
+                    for i in range(0, len(records), batch_size)]
+
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*[
+        _client(host, port, path, payloads[i::concurrency], latencies) for i in range(concurrency)
+    ])
+    elapsed = time.perf_counter() - start
+
+    latencies = np.array(latencies) * 1000
+    return {
+        'requests': len(latencies),
+        'records_per_second': len(latencies) * batch_size / elapsed,
+        'requests_per_second': len(latencies) / elapsed,
+        'p50_ms': float(np.percentile(latencies, 50)),
+        'p99_ms': float(np.percentile(latencies, 99)),
+    }
+
+
+async def _wait_ready(host, port, timeout=120):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.2)
+    raise RuntimeError("Servis zamanında başlamadı")
+
+
+def _print(label, result):
+    print(f"{label:<28}{result['requests']:>8}{result['requests_per_second']:>12.0f}"
+          f"{result['records_per_second']:>12.0f}{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--url', help="Çalışan servisin adresi (verilmezse servis başlatılır)")
+    parser.add_argument('--model', default="Rastgele Orman")
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--batch-size', type=int, default=1, help="1: /predict, >1: /predict/batch")
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    print(f"{'Yapılandırma':<28}{'istek':>8}{'istek/s':>12}{'kayıt/s':>12}{'p50 ms':>10}{'p99 ms':>10}")
+
+    if args.url:
+        parsed = urlparse(args.url)
+        result = asyncio.run(run_load(parsed.hostname, parsed.port, args.model,
+                                      args.concurrency, args.requests, args.batch_size))
+        _print(args.url, result)
+        return
+
+    for label, max_batch in [("birleştirme kapalı", 1), ("birleştirme açık", 256)]:
+        process = subprocess.Popen(
+            [sys.executable, '-m', 'core.service', '--port', str(args.port), '--max-batch', str(max_batch)],
+            cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            asyncio.run(_wait_ready('127.0.0.1', args.port))
+            result = asyncio.run(run_load('127.0.0.1', args.port, args.model,
+                                          args.concurrency, args.requests, args.batch_size))
+            _print(label, result)
+        finally:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == '__main__':
+    main()
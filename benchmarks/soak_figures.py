@@ -0,0 +1,133 @@
+"""
+Grafik önbelleği (core.figures) için uzun süreli yük (soak) testi.
+
+Sayfa betikleri Streamlit'in "bare" kipinde (sunucu olmadan, bileşenler varsayılan
+değerleriyle) sırayla tekrar tekrar çalıştırılır ve sürecin yerleşik belleği (RSS)
+belirli aralıklarla raporlanır. Her --unique-every görüntülemede bir, farklı
+parametreli bir grafik (kişisel tahmin grafiği gibi) çizilir; küçük bir --max-mb ile
+LRU atma da sınanır.
+
+--legacy verilirse karşılaştırma için eski yol (plt.subplots + savefig, şekil
+kapatılmadan) aynı sayıda görüntüleme için ölçülür.
+
+Kullanım:
+    python benchmarks/soak_figures.py --views 10000
+    python benchmarks/soak_figures.py --views 2000 --legacy
+"""
+import argparse
+import io
+import logging
+import os
+import runpy
+import sys
+import time
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+PAGES = [
+    'pages/1_Veri_Görselleştirme.py',
+    'pages/2_Tahmin_Modeli.py',
+    'pages/3_Tanıtım.py',
+    'pages/4_Model_Karşılaştırma.py',
+]
+
+
+def rss_mb():
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) / 1024
+    return float('nan')
+
+
+def _draw_probability(probability):
+    def draw(ax):
+        bars = ax.bar(['Sağlıklı', 'Kalp Hastalığı'], [1 - probability, probability],
+                      color=['lightgreen', 'lightcoral'], alpha=0.7, edgecolor='black')
+        for bar, value in zip(bars, [1 - probability, probability]):
+            ax.text(bar.get_x() + bar.get_width() / 2., value + 0.01, f'{value:.1%}', ha='center', va='bottom')
+        ax.set_ylim(0, 1)
+        ax.axhline(y=0.5, color='red', linestyle='--', alpha=0.7)
+    return draw
+
+
+def _run_page(page):
+    from streamlit.runtime.scriptrunner_utils.exceptions import StopException
+
+    try:
+        runpy.run_path(page, run_name='__main__')
+    except StopException:
+        pass
+
+
+def soak(views, unique_every, report_every):
+    from core.figures import figure_cache
+
+    samples = []
+    start = time.perf_counter()
+    for view in range(1, views + 1):
+        _run_page(PAGES[view % len(PAGES)])
+        if unique_every and view % unique_every == 0:
+            probability = (view // unique_every) % 10_000 / 10_000
+            figure_cache.render('soak_olasilik', _draw_probability(probability), params=probability)
+        if view % report_every == 0:
+            samples.append((view, rss_mb(), time.perf_counter() - start, figure_cache.stats()))
+    return samples
+
+
+def soak_legacy(views, report_every):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    from core.data import load_data
+
+    df = load_data()
+    samples = []
+    start = time.perf_counter()
+    for view in range(1, views + 1):
+        # Eski sayfalardaki gibi: her görüntülemede yeni şekil, st.pyplot ile aynı kaydetme, kapatma yok
+        fig, ax = plt.subplots(figsize=(10, 6))
+        sns.histplot(data=df, x='Yaş', bins=20, ax=ax)
+        fig.savefig(io.BytesIO(), format='png', dpi=200, bbox_inches='tight')
+        if view % report_every == 0:
+            samples.append((view, rss_mb(), time.perf_counter() - start, {'open_figures': len(plt.get_fignums())}))
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--views', type=int, default=10_000)
+    parser.add_argument('--unique-every', type=int, default=10,
+                        help="Her N görüntülemede bir farklı parametreli grafik çizilir (0: kapalı)")
+    parser.add_argument('--max-mb', type=float, default=8.0, help="Grafik önbelleğinin bayt sınırı (MB)")
+    parser.add_argument('--report-every', type=int, default=1000)
+    parser.add_argument('--legacy', action='store_true', help="Eski yolu (şekiller kapatılmadan) ölç")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    warnings.simplefilter('ignore')
+
+    if args.legacy:
+        samples = soak_legacy(args.views, args.report_every)
+    else:
+        from core.figures import figure_cache
+
+        figure_cache.max_bytes = int(args.max_mb * 1024 * 1024)
+        samples = soak(args.views, args.unique_every, args.report_every)
+
+    print(f"{'görüntüleme':>12}{'RSS MB':>10}{'süre s':>10}  önbellek")
+    for view, rss, seconds, stats in samples:
+        print(f"{view:>12,}{rss:>10.1f}{seconds:>10.1f}  {stats}")
+
+    if len(samples) >= 2:
+        first, last = samples[0], samples[-1]
+        print(f"RSS değişimi ({first[0]:,} -> {last[0]:,}. görüntüleme): {last[1] - first[1]:+.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,369 @@
+"""
+Veri, eğitim ve tahmin yollarının tekrarlanabilir ölçüm takımı.
+
+heart_cleaned.csv satırları yeniden örneklenip sürekli özelliklere küçük bir gürültü
+eklenerek (bench_models.py ile aynı yöntem, sabit tohumla) verilen boyutlarda sentetik veri
+setleri üretilir ve her boyutta şu durumlar ölçülür:
+
+- load_data: CSV'den ilk yükleme (içerik özeti ve sütunlu kopyanın oluşturulması dahil),
+  diskteki sütunlu kopyadan yükleme (yeni süreç gibi) ve süreç içi önbellekten yükleme
+- preprocess_data: eğitim kipinde tüm veri seti; tek satır kipi boyuttan bağımsızdır, bir kez ölçülür
+- train_model: her model seçeneği, ölçeklenmiş one-hot girdide
+- predict_proba: her model için tek satır ve tüm veri seti
+- figure_render: görselleştirme sayfasının en ağır grafikleri (KDE'li histogram, saçılım,
+  kutu grafiği, korelasyon ısı haritası), PNG'ye dönüştürme dahil
+
+Her durum en fazla --repeat kez çalıştırılır; bir çalıştırma LONG_RUN saniyeden uzun
+sürerse tekrarlanmaz. Eğitim --max-train-rows (SVM için --max-svm-rows) satırla sınırlıdır;
+daha büyük boyutlarda eğitim atlanır ve tahmin bu sınırda eğitilmiş modelle ölçülür.
+Grafikler --max-chart-rows satırdan büyük veri setlerinde atlanır. Atlanan durumlar da
+nedeniyle birlikte sonuç dosyasına yazılır.
+
+Sonuçlar (commit, kütüphane sürümleri ve her durumun süreleri) JSON olarak
+benchmarks/results/<commit>.json dosyasına yazılır; iki sonuç dosyası compare ile
+karşılaştırılır. Paylaşılan makinelerdeki gürültüden daha az etkilendiği için varsayılan
+olarak en iyi çalıştırmanın süresi karşılaştırılır (--statistic median da seçilebilir);
+süresi --threshold oranından fazla artan bir durum varsa compare 1 ile çıkar.
+
+Kullanım:
+    python benchmarks/suite.py run --rows 1000 100000 1000000
+    python benchmarks/suite.py run --rows 10000000 --only load_data preprocess_data
+    python benchmarks/suite.py compare benchmarks/results/abc1234.json benchmarks/results/def5678.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from core.data import TARGET_COLUMN, load_data  # noqa: E402
+from core.models import MODEL_OPTIONS  # noqa: E402
+
+RESULTS_DIR = os.path.join('benchmarks', 'results')
+
+CASES = ['load_data', 'preprocess_data', 'train_model', 'predict_proba', 'figure_render']
+
+# Bu süreden uzun bir çalıştırma tekrarlanmaz (saniye)
+LONG_RUN = 5.0
+
+# Sürekli özellikler ve eklenen gürültünün standart sapması (bench_models.py ile aynı)
+JITTER = {'Yaş': 1.0, 'İstirahatKanBasıncı': 3.0, 'Kolesterol': 5.0, 'MaksimumKalpHızı': 3.0, 'STDepresyonu': 0.1}
+
+# STDepresyonu dışındaki sürekli özellikler veri setinde tam sayıdır
+DECIMALS = {'STDepresyonu': 1}
+
+
+def synthetic_frame(rows, seed=0):
+    """heart_cleaned.csv şemasında, rows satırlık sentetik veri seti."""
+    df = load_data()
+    rng = np.random.default_rng(seed)
+    sample = df.iloc[rng.integers(0, len(df), size=rows)].reset_index(drop=True)
+    for column, scale in JITTER.items():
+        values = sample[column].to_numpy(dtype=np.float64) + rng.normal(0.0, scale, size=rows)
+        decimals = DECIMALS.get(column, 0)
+        sample[column] = np.round(values, decimals) if decimals else np.round(values).astype(np.int64)
+    return sample
+
+
+def _gender_labels(df):
+    from core.aggregates import DIMENSIONS
+    from core.derived import to_categorical
+
+    return pd.Series(to_categorical(DIMENSIONS['Cinsiyet'], df['Cinsiyet'].to_numpy()), name='Cinsiyet')
+
+
+def _charts(df):
+    """Görselleştirme sayfasındaki en ağır grafiklerin çizim fonksiyonları (sayfadakiyle aynı)."""
+    import seaborn as sns
+
+    def age_by_target(ax):
+        sns.histplot(data=df, x='Yaş', hue='KalpHastalığı', bins=20, kde=True, ax=ax)
+        ax.set_title("Yaş Dağılımı ve Kalp Hastalığı İlişkisi")
+
+    def cholesterol_vs_pressure(ax):
+        sns.scatterplot(data=df, x='Kolesterol', y='İstirahatKanBasıncı', hue='KalpHastalığı', ax=ax)
+        ax.set_title("Kolesterol ve Kan Basıncı İlişkisi")
+
+    def age_by_gender_and_target(ax):
+        sns.boxplot(x=_gender_labels(df), y=df['Yaş'], hue=df['KalpHastalığı'], ax=ax)
+        ax.set_title("Cinsiyete ve Kalp Hastalığına Göre Yaş Dağılımı")
+
+    def correlation(ax):
+        corr = df.select_dtypes(include=[np.number]).corr()
+        mask = np.triu(np.ones_like(corr, dtype=bool))
+        cmap = sns.diverging_palette(230, 20, as_cmap=True)
+        sns.heatmap(corr, mask=mask, cmap=cmap, vmax=1, vmin=-1, center=0,
+                    square=True, linewidths=.5, cbar_kws={"shrink": .5}, annot=True, fmt=".2f", ax=ax)
+        ax.set_title("Özellikler Arası Korelasyon Matrisi")
+
+    return [
+        ('yas_dagilimi_hedef', age_by_target, (10, 6)),
+        ('kolesterol_kan_basinci', cholesterol_vs_pressure, (10, 6)),
+        ('cinsiyet_yas_hedef_kutu', age_by_gender_and_target, (10, 6)),
+        ('korelasyon', correlation, (12, 10)),
+    ]
+
+
+def _time(func, repeat, setup=None):
+    """func'ın süreleri (saniye); ilk çalıştırma LONG_RUN'dan uzunsa tekrarlanmaz."""
+    seconds = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        seconds.append(time.perf_counter() - start)
+        if seconds[-1] > LONG_RUN:
+            break
+    return seconds
+
+
+class Recorder:
+    """Ölçüm sonuçlarını toplar ve ekrana yazar."""
+
+    def __init__(self):
+        self.results = []
+        print(f"{'Durum':<16}{'Değişken':<40}{'Satır':>12}{'ortanca ms':>13}{'en iyi ms':>12}{'satır/s':>16}")
+
+    def add(self, case, variant, rows, seconds, batch=None, **extra):
+        """rows veri setinin boyutu, batch bir çağrıda işlenen satır sayısıdır (varsayılan rows)."""
+        batch = rows if batch is None else batch
+        median = statistics.median(seconds)
+        result = {'case': case, 'variant': variant, 'rows': rows, 'batch': batch, 'seconds': seconds,
+                  'median': median, 'min': min(seconds), 'rows_per_second': batch / median, **extra}
+        self.results.append(result)
+        print(f"{case:<16}{variant:<40}{rows:>12,}{median * 1000:>13.3f}{min(seconds) * 1000:>12.3f}"
+              f"{batch / median:>16,.0f}", flush=True)
+
+    def skip(self, case, variant, rows, reason):
+        self.results.append({'case': case, 'variant': variant, 'rows': rows, 'skipped': reason})
+        print(f"{case:<16}{variant:<40}{rows:>12,}  atlandı: {reason}", flush=True)
+
+
+def _forget(path):
+    """Yolun süreç içi özet ve sütun önbelleklerini boşaltır (yeni bir süreç gibi)."""
+    from core import data
+
+    key = os.path.abspath(path)
+    data._columnar_cache.pop(key, None)
+    for stat_key in [k for k in data._fingerprint_cache if k[0] == key]:
+        del data._fingerprint_cache[stat_key]
+
+
+def _bench_load(recorder, sample, rows, repeat, tmp):
+    """CSV'den ilk yükleme, diskteki sütunlu kopyadan yükleme ve süreç içi önbellekten yükleme."""
+    csv_path = os.path.join(tmp, f"heart_{rows}.csv")
+    sample.to_csv(csv_path, index=False)
+    counter = iter(range(repeat))
+    directory = {}
+
+    def cold():
+        _forget(csv_path)
+        directory['path'] = os.path.join(tmp, f"columnar_{rows}_{next(counter)}")
+
+    load = lambda: load_data(csv_path, directory['path'])  # noqa: E731
+    recorder.add('load_data', 'csv', rows, _time(load, repeat, setup=cold))
+    recorder.add('load_data', 'sütunlu', rows, _time(load, repeat, setup=lambda: _forget(csv_path)))
+    recorder.add('load_data', 'bellek', rows, _time(load, max(repeat, 100)))
+    _forget(csv_path)
+    os.remove(csv_path)
+
+
+def _bench_charts(recorder, sample, rows, repeat, max_rows):
+    from core.figures import render_figure
+
+    for chart_id, draw, figsize in _charts(sample):
+        if rows > max_rows:
+            recorder.skip('figure_render', chart_id, rows, f"--max-chart-rows {max_rows:,}")
+            continue
+        recorder.add('figure_render', chart_id, rows, _time(lambda: render_figure(draw, figsize), repeat))
+
+
+def _bench_models(recorder, sample, rows, repeat, args, cases):
+    from core import forest
+    from core.models import fit_scaler, model_feature_names, train_model
+    from core.preprocessing import FeatureEncoder
+
+    y = sample[TARGET_COLUMN].to_numpy()
+    inputs = {}
+
+    for model_option in args.models:
+        # Kategorik modeller (gradyan artırma) one-hot yerine kod sütunlarıyla çalışır
+        feature_names = model_feature_names(model_option)
+        layout = tuple(feature_names)
+        if layout not in inputs:
+            X = FeatureEncoder(feature_names).encode_batch(sample)
+            inputs = {layout: fit_scaler(X, feature_names).transform(X)}
+        X = inputs[layout]
+        limit = args.max_svm_rows if model_option == "Destek Vektör Makinesi" else args.max_train_rows
+        train_rows = min(rows, limit)
+
+        start = time.perf_counter()
+        model = train_model(model_option, X[:train_rows], y[:train_rows], feature_names=feature_names)
+        train_seconds = time.perf_counter() - start
+        if 'train_model' in cases:
+            if train_rows < rows:
+                recorder.skip('train_model', model_option, rows, f"eğitim sınırı {limit:,} satır")
+            else:
+                # Modelin kendisi ilk ölçümdür; kalan tekrarlar yeniden eğitir
+                seconds = [train_seconds]
+                if train_seconds <= LONG_RUN:
+                    seconds += _time(lambda: train_model(model_option, X[:train_rows], y[:train_rows],
+                                                         feature_names=feature_names), repeat - 1)
+                recorder.add('train_model', model_option, rows, seconds)
+
+        if 'predict_proba' in cases:
+            row = X[:1].copy()
+            forest.predict_proba(model, row)  # derlenmiş orman gibi ilk çağrı önbellekleri ısıtılır
+            seconds = _time(lambda: forest.predict_proba(model, row), max(repeat, 100))
+            recorder.add('predict_proba', f"{model_option} (tek satır)", rows, seconds, batch=1,
+                         rows_trained=train_rows)
+            seconds = _time(lambda: forest.predict_proba(model, X), repeat)
+            recorder.add('predict_proba', f"{model_option} (toplu)", rows, seconds, rows_trained=train_rows)
+
+
+def _environment():
+    import matplotlib
+    import sklearn
+
+    def git(*command):
+        try:
+            return subprocess.run(['git', *command], capture_output=True, text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    return {
+        'commit': git('rev-parse', '--short', 'HEAD'),
+        'dirty': bool(git('status', '--porcelain', '--untracked-files=no')),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'sklearn': sklearn.__version__,
+        'matplotlib': matplotlib.__version__,
+    }
+
+
+def run(args):
+    cases = args.only or CASES
+    environment = _environment()
+    recorder = Recorder()
+
+    if 'preprocess_data' in cases:
+        from core.preprocessing import RAW_FEATURES, encoded_feature_names, preprocess_data
+
+        record = synthetic_frame(1)[RAW_FEATURES]
+        feature_names = encoded_feature_names()
+        seconds = _time(lambda: preprocess_data(record, is_training=False, reference_columns=feature_names),
+                        max(args.repeat, 100))
+        recorder.add('preprocess_data', 'tek satır', 1, seconds)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            sample = synthetic_frame(rows)
+            if 'load_data' in cases:
+                _bench_load(recorder, sample, rows, args.repeat, tmp)
+            if 'preprocess_data' in cases:
+                recorder.add('preprocess_data', 'eğitim', rows,
+                             _time(lambda: preprocess_data(sample, is_training=True), args.repeat))
+            if 'figure_render' in cases:
+                _bench_charts(recorder, sample, rows, args.repeat, args.max_chart_rows)
+            if 'train_model' in cases or 'predict_proba' in cases:
+                _bench_models(recorder, sample, rows, args.repeat, args, cases)
+            del sample
+
+    output = args.output
+    if output is None:
+        name = environment['commit'] or 'sonuc'
+        output = os.path.join(RESULTS_DIR, f"{name}{'-dirty' if environment['dirty'] else ''}.json")
+    directory = os.path.dirname(output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    arguments = {key: value for key, value in vars(args).items() if key not in ('command', 'func')}
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({'environment': environment, 'arguments': arguments, 'results': recorder.results},
+                  f, ensure_ascii=False, indent=2)
+    print(f"\nSonuçlar: {output}")
+
+
+def _index(path):
+    with open(path, encoding='utf-8') as f:
+        report = json.load(f)
+    measured = {(r['case'], r['variant'], r['rows']): r for r in report['results'] if 'skipped' not in r}
+    return report['environment'], measured
+
+
+def compare(args):
+    base_environment, base = _index(args.base)
+    new_environment, new = _index(args.new)
+    print(f"Temel: {base_environment.get('commit')} ({base_environment.get('created')})  "
+          f"Yeni: {new_environment.get('commit')} ({new_environment.get('created')})")
+    for field in ('python', 'numpy', 'pandas', 'sklearn', 'cpus'):
+        if base_environment.get(field) != new_environment.get(field):
+            print(f"Uyarı: {field} farklı ({base_environment.get(field)} -> {new_environment.get(field)})")
+
+    print(f"\n{'Durum':<16}{'Değişken':<40}{'Satır':>12}{'temel ms':>12}{'yeni ms':>12}{'oran':>8}")
+    regressions = 0
+    for key in sorted(base.keys() & new.keys(), key=lambda k: (CASES.index(k[0]) if k[0] in CASES else 99, k[1], k[2])):
+        ratio = new[key][args.statistic] / base[key][args.statistic]
+        if ratio > 1 + args.threshold:
+            mark = "  YAVAŞLAMA"
+            regressions += 1
+        elif ratio < 1 - args.threshold:
+            mark = "  hızlanma"
+        else:
+            mark = ""
+        case, variant, rows = key
+        print(f"{case:<16}{variant:<40}{rows:>12,}{base[key][args.statistic] * 1000:>12.3f}"
+              f"{new[key][args.statistic] * 1000:>12.3f}{ratio:>7.2f}x{mark}")
+
+    for label, keys in (("Yalnızca temelde", base.keys() - new.keys()), ("Yalnızca yenide", new.keys() - base.keys())):
+        if keys:
+            print(f"{label}: {len(keys)} durum")
+    print(f"\n%{args.threshold * 100:.0f} eşiğinde {regressions} yavaşlama")
+    return 1 if regressions else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Veri, eğitim ve tahmin yollarının ölçüm takımı.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="Ölçümleri çalıştırır ve JSON olarak yazar")
+    run_parser.add_argument('--rows', type=int, nargs='*', default=[1_000, 10_000, 100_000, 1_000_000])
+    run_parser.add_argument('--only', nargs='*', choices=CASES, help="Yalnızca bu durumlar (varsayılan: hepsi)")
+    run_parser.add_argument('--models', nargs='*', default=MODEL_OPTIONS, choices=MODEL_OPTIONS)
+    run_parser.add_argument('--repeat', type=int, default=3)
+    run_parser.add_argument('--max-train-rows', type=int, default=1_000_000)
+    run_parser.add_argument('--max-svm-rows', type=int, default=20_000)
+    run_parser.add_argument('--max-chart-rows', type=int, default=1_000_000)
+    run_parser.add_argument('--output', help="Sonuç dosyası (varsayılan: benchmarks/results/<commit>.json)")
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser('compare', help="İki sonuç dosyasını karşılaştırır")
+    compare_parser.add_argument('base')
+    compare_parser.add_argument('new')
+    compare_parser.add_argument('--threshold', type=float, default=0.10,
+                                help="Yavaşlama sayılan en küçük süre artışı (oran)")
+    compare_parser.add_argument('--statistic', choices=['min', 'median'], default='min',
+                                help="Karşılaştırılan süre (varsayılan: en iyi çalıştırma)")
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Kalp Yetmezliği Analiz Platformu için sayfalar arasında paylaşılan kod."""
@@ -0,0 +1,154 @@
+"""
+Veri görselleştirme sayfasındaki gruplama grafikleri için önceden hesaplanan toplam küpü.
+
+Küp, aşağıdaki boyutların (gruplanmış ya da kategorik sütunlar) her birleşimi için kişi
+sayısını ve kalp hastası sayısını tutar. Veri setinin her sürümü için bir kez hesaplanır ve
+cache/aggregates/ altına yazılır; grafikler küpün dilimleridir, bu yüzden çizim süresi
+satır sayısından bağımsızdır.
+"""
+import hashlib
+import json
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from core.data import DATA_PATH, TARGET_COLUMN, data_fingerprint, load_data
+from core.derived import Binning, Categories
+
+# Küp dosyalarının klasörü
+CUBE_DIR = os.path.join('cache', 'aggregates')
+
+# Küpün boyutları (sözlük sırası küpün eksen sırasıdır)
+DIMENSIONS = {
+    'YaşGrubu': Binning('Yaş', (20, 30, 40, 50, 60, 70, 80),
+                        ('20-30', '30-40', '40-50', '50-60', '60-70', '70-80')),
+    'YaşGrubuGeniş': Binning('Yaş', (20, 40, 60, 80),
+                             ('Genç (20-40)', 'Orta Yaş (40-60)', 'Yaşlı (60-80)')),
+    'KolesterolGrubu': Binning('Kolesterol', (0, 200, 240, 600),
+                               ('Normal (<200)', 'Sınırda (200-240)', 'Yüksek (>240)')),
+    'KanBasıncıGrubu': Binning('İstirahatKanBasıncı', (0, 120, 140, 200),
+                               ('Normal (<120)', 'Prehipertansiyon (120-140)', 'Hipertansiyon (>140)')),
+    'KalpHızıGrubu': Binning('MaksimumKalpHızı', (0, 120, 150, 220),
+                             ('Düşük (<120)', 'Normal (120-150)', 'Yüksek (>150)')),
+    'Cinsiyet': Categories('Cinsiyet', ((1, 'Erkek'), (0, 'Kadın'))),
+    'GöğüsAğrısıTürü': Categories('GöğüsAğrısıTürü', ((0, 'ASY'), (1, 'ATA'), (2, 'NAP'), (3, 'TA'))),
+    'EgzersizAnginası': Categories('EgzersizAnginası', ((1, 'Evet'), (0, 'Hayır'))),
+    'ST_Eğimi': Categories('ST_Eğimi', ((0, 'Down'), (1, 'Flat'), (2, 'Up'))),
+}
+
+# Özet istatistikleri (ortalama/en küçük/en büyük) saklanan sütunlar
+SUMMARY_COLUMNS = ['Yaş', 'Kolesterol', 'İstirahatKanBasıncı', 'MaksimumKalpHızı', 'STDepresyonu']
+
+
+def dimensions_key(dimensions=DIMENSIONS):
+    spec = {name: [type(dim).__name__, dim.column, list(getattr(dim, 'edges', ())), list(dim.labels)]
+            for name, dim in dimensions.items()}
+    return hashlib.sha256(json.dumps(spec, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+class AggregateCube:
+    """
+    counts[..., 0] sağlıklı, counts[..., 1] kalp hastası kişi sayısıdır. Her eksenin son
+    hücresi aralık dışı/eksik değerleri tutar ve dilimlerde atlanır.
+    """
+
+    def __init__(self, counts, rows, summary, dimensions=DIMENSIONS):
+        self.counts = counts
+        self.rows = rows
+        self.summary = summary
+        self.dimensions = dimensions
+        self._axes = {name: i for i, name in enumerate(dimensions)}
+
+    def table(self, *dims):
+        """
+        pd.crosstab([etiketler...], df['KalpHastalığı']) ile aynı biçimde sayı tablosu:
+        satırlar verilen boyutların birleşimleri, sütunlar 0/1. Boş satırlar atlanır.
+        """
+        axes = [self._axes[dim] for dim in dims]
+        others = tuple(i for i in range(len(self.dimensions)) if i not in axes)
+        values = self.counts.sum(axis=others)
+        # Eksenleri istenen sıraya getir ve aralık dışı hücreleri at
+        kept = sorted(axes)
+        values = values.transpose([kept.index(axis) for axis in axes] + [len(axes)])
+        values = values[tuple(slice(0, -1) for _ in dims)]
+
+        labels = [self.dimensions[dim].labels for dim in dims]
+        if len(dims) == 1:
+            index = pd.Index(labels[0], name=dims[0])
+        else:
+            index = pd.MultiIndex.from_product(labels, names=list(dims))
+        table = pd.DataFrame(values.reshape(-1, 2), index=index,
+                             columns=pd.Index([0, 1], name=TARGET_COLUMN))
+        return table[table.sum(axis=1) > 0]
+
+    def totals(self, dim):
+        """Boyutun her kategorisindeki kişi sayısı (value_counts gibi azalan sırada)."""
+        return self.table(dim).sum(axis=1).sort_values(ascending=False).rename('count')
+
+    def rates(self, *dims):
+        """Boyut birleşimlerine göre kalp hastalığı oranı (%)."""
+        table = self.table(*dims)
+        return table[1] / table.sum(axis=1) * 100
+
+
+def build_cube(df, dimensions=DIMENSIONS, target=TARGET_COLUMN):
+    """Küpü veri çerçevesi üzerinden tek geçişte (np.bincount) hesaplar."""
+    shape = tuple(len(dim.labels) + 1 for dim in dimensions.values())
+    codes = [dim.codes(df[dim.column].to_numpy()) for dim in dimensions.values()]
+    flat = np.ravel_multi_index(codes, shape) * 2 + df[target].to_numpy().astype(np.int64)
+    counts = np.bincount(flat, minlength=int(np.prod(shape)) * 2).reshape(shape + (2,))
+
+    summary = {}
+    for col in SUMMARY_COLUMNS:
+        values = df[col].to_numpy()
+        summary[col] = {'mean': float(values.mean()), 'min': values.min().item(), 'max': values.max().item()}
+    return AggregateCube(counts, len(df), summary, dimensions)
+
+
+_cube_cache = {}
+_cube_lock = threading.Lock()
+
+
+def _cube_path(fingerprint, cache_dir):
+    return os.path.join(cache_dir, f"cube-{fingerprint[:16]}-{dimensions_key()[:8]}.npz")
+
+
+def _read_cube(path):
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data['meta']))
+            return AggregateCube(data['counts'], meta['rows'], meta['summary'])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _write_cube(cube, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    meta = json.dumps({'rows': cube.rows, 'summary': cube.summary}, ensure_ascii=False)
+    tmp_path = path + '.tmp.npz'
+    np.savez(tmp_path, counts=cube.counts, meta=np.array(meta))
+    os.replace(tmp_path, path)
+
+
+def load_cube(path=DATA_PATH, cache_dir=CUBE_DIR):
+    """
+    Veri setinin mevcut sürümüne ait küpü döndürür. Küp süreç içinde ve diskte
+    saklanır; veri dosyası değiştiğinde yeniden hesaplanır.
+    """
+    fingerprint = data_fingerprint(path)
+    key = os.path.abspath(path)
+
+    with _cube_lock:
+        cached = _cube_cache.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        cube_path = _cube_path(fingerprint, cache_dir)
+        cube = _read_cube(cube_path)
+        if cube is None:
+            cube = build_cube(load_data(path))
+            _write_cube(cube, cube_path)
+        _cube_cache[key] = (fingerprint, cube)
+    return cube
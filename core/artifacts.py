@@ -0,0 +1,88 @@
+import os
+
+import joblib
+import sklearn
+
+from core.models import DEFAULT_PARAMS, TrainedModel
+
+# Eğitilmiş model dosyalarının varsayılan klasörü
+ARTIFACT_DIR = 'artifacts'
+
+# Dosya biçimi değiştiğinde artırılır; eski sürümdeki dosyalar yüklenmez
+FORMAT_VERSION = 2
+
+# Model seçeneği -> dosya adı
+MODEL_SLUGS = {
+    "Lojistik Regresyon": 'lojistik_regresyon',
+    "Rastgele Orman": 'rastgele_orman',
+    "Destek Vektör Makinesi": 'destek_vektor_makinesi',
+    "Histogram Gradyan Artırma": 'histogram_gradyan_artirma',
+}
+
+
+def artifact_path(model_option, directory=ARTIFACT_DIR, slug=None):
+    return os.path.join(directory, f"{slug or MODEL_SLUGS[model_option]}.joblib")
+
+
+def save_artifact(trained, directory=ARTIFACT_DIR, slug=None):
+    """
+    Eğitilmiş modeli, ölçekleyiciyi, sütun sırasını, veri özetini, scikit-learn
+    sürümünü ve test metriklerini tek bir dosyaya yazar. slug verilmezse dosya adı
+    MODEL_SLUGS'tan alınır.
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = artifact_path(trained.model_option, directory, slug)
+
+    payload = {
+        'format_version': FORMAT_VERSION,
+        'sklearn_version': sklearn.__version__,
+        'model_option': trained.model_option,
+        'params': trained.params,
+        'fingerprint': trained.fingerprint,
+        'feature_names': trained.feature_names,
+        'metrics': trained.metrics,
+        'scaler': trained.scaler,
+        'model': trained.model,
+    }
+
+    # Yarım yazılmış dosyanın okunmaması için önce geçici dosyaya yazılır
+    tmp_path = path + '.tmp'
+    joblib.dump(payload, tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_artifact(model_option, fingerprint=None, params=None, directory=ARTIFACT_DIR, slug=None):
+    """
+    Kaydedilmiş modeli yükler. Dosya yoksa ya da veri özeti, hiperparametreler,
+    dosya biçimi veya scikit-learn sürümü uyuşmuyorsa None döner.
+    """
+    path = artifact_path(model_option, directory, slug)
+    if not os.path.exists(path):
+        return None
+
+    if params is None:
+        params = DEFAULT_PARAMS[model_option]
+
+    # Büyük NumPy dizileri kopyalanmadan belleğe eşlenir. libsvm salt okunur
+    # dizileri kabul etmediği için yazıldığında kopyalanan ('c') kip kullanılır.
+    payload = joblib.load(path, mmap_mode='c')
+
+    if payload.get('format_version') != FORMAT_VERSION:
+        return None
+    if payload['sklearn_version'] != sklearn.__version__:
+        return None
+    if fingerprint is not None and payload['fingerprint'] != fingerprint:
+        return None
+    if payload['params'] != params:
+        return None
+
+    return TrainedModel(
+        payload['model_option'],
+        payload['params'],
+        payload['fingerprint'],
+        payload['model'],
+        payload['scaler'],
+        payload['feature_names'],
+        payload['metrics'],
+    )
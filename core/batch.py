@@ -0,0 +1,99 @@
+"""
+heart_cleaned.csv şemasındaki hasta kayıtlarını toplu olarak puanlar.
+
+Dosya sabit boyutlu parçalar halinde okunur, her parça tek seferde kodlanıp
+puanlanır ve çıktıya eklenir; böylece dosyanın tamamı belleğe alınmaz.
+
+Kullanım:
+    python -m core.batch hastalar.csv sonuclar.csv --model "Rastgele Orman"
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from core.models import DEFAULT_MODEL_OPTION, MODEL_OPTIONS, get_trained_model
+from core.preprocessing import RAW_FEATURES
+
+# Bir seferde okunan satır sayısı
+DEFAULT_CHUNKSIZE = 50_000
+
+# Sayfadaki tek kişilik tahminle aynı risk eşiği ve etiketleri
+RISK_THRESHOLD = 0.50
+PROBABILITY_COLUMN = 'RiskOlasılığı'
+LABEL_COLUMN = 'RiskEtiketi'
+HIGH_RISK_LABEL = 'YÜKSEK RİSK'
+LOW_RISK_LABEL = 'DÜŞÜK RİSK'
+
+
+def score_frame(trained, chunk):
+    """
+    Bir DataFrame parçasına risk olasılığı ve risk etiketi sütunlarını ekler.
+    """
+    missing = [col for col in RAW_FEATURES if col not in chunk.columns]
+    if missing:
+        raise ValueError(f"Eksik sütunlar: {', '.join(missing)}")
+
+    probabilities = trained.predict_proba(trained.encode(chunk))[:, 1]
+    chunk[PROBABILITY_COLUMN] = probabilities
+    chunk[LABEL_COLUMN] = np.where(probabilities >= RISK_THRESHOLD, HIGH_RISK_LABEL, LOW_RISK_LABEL)
+    return chunk
+
+
+def iter_scored_chunks(source, trained, chunksize=DEFAULT_CHUNKSIZE):
+    """CSV kaynağını parça parça okuyup puanlanmış parçaları döndürür."""
+    for chunk in pd.read_csv(source, chunksize=chunksize):
+        yield score_frame(trained, chunk)
+
+
+def score_csv(source, destination, trained, chunksize=DEFAULT_CHUNKSIZE, progress=None):
+    """
+    source CSV'sini puanlayıp destination'a (dosya yolu ya da metin akışı) yazar.
+    Her parçadan sonra progress(satır_sayısı) çağrılır. Satır sayısını, süreyi ve
+    saniyedeki satır sayısını döndürür.
+    """
+    start = time.perf_counter()
+    rows = 0
+
+    own_file = isinstance(destination, str)
+    out = open(destination, 'w', newline='', encoding='utf-8') if own_file else destination
+    try:
+        for chunk in iter_scored_chunks(source, trained, chunksize):
+            chunk.to_csv(out, index=False, header=rows == 0)
+            rows += len(chunk)
+            if progress is not None:
+                progress(rows)
+    finally:
+        if own_file:
+            out.close()
+
+    seconds = time.perf_counter() - start
+    return {
+        'rows': rows,
+        'seconds': seconds,
+        'rows_per_second': rows / seconds if seconds > 0 else float('inf'),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CSV dosyasındaki hastaları toplu olarak puanlar.")
+    parser.add_argument('input', help="heart_cleaned.csv şemasında girdi dosyası")
+    parser.add_argument('output', help="Risk olasılığı ve etiketinin ekleneceği çıktı dosyası")
+    parser.add_argument('--model', default=DEFAULT_MODEL_OPTION, choices=MODEL_OPTIONS)
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE)
+    args = parser.parse_args(argv)
+
+    trained = get_trained_model(args.model)
+
+    def report(rows):
+        print(f"\r{rows} satır puanlandı", end='', file=sys.stderr)
+
+    stats = score_csv(args.input, args.output, trained, args.chunksize, progress=report)
+    print(file=sys.stderr)
+    print(f"{stats['rows']} satır, {stats['seconds']:.2f}s, {stats['rows_per_second']:.0f} satır/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Kategorik özellikleri doğal olarak işleyen histogram tabanlı gradyan artırma.
+
+Bu model one-hot düzeni yerine categorical_feature_names() düzeniyle çalışır: one-hot
+olmayan sütunlar ölçeklenmiş, GöğüsAğrısıTürü, İstirahatEKG ve ST_Eğimi ise
+FeatureEncoder'ın ham özelliklerden yazdığı (ölçeklenmemiş) kategori kodlarıdır. Kod
+sütunları HistGradientBoostingClassifier'a kategorik özellik olarak verilir; böylece
+ağaçlar bir kategori kümesini tek bölünmede ayırabilir ve sütun sayısı kategori sayısıyla
+büyümez. Eğitimde görülmeyen ya da eksik kodlar eksik değer olarak işlenir. Eğitim
+OpenMP ile tüm çekirdekleri kullanır.
+"""
+import numpy as np
+from sklearn.base import BaseEstimator, ClassifierMixin
+from sklearn.ensemble import HistGradientBoostingClassifier
+
+from core.preprocessing import categorical_feature_names, category_columns
+
+
+class CategoricalHistGradientBoosting(ClassifierMixin, BaseEstimator):
+    """
+    feature_names, girdinin sütun adlarıdır (verilmezse categorical_feature_names());
+    kategorik özellik adlarını taşıyan sütunlar kategori kodudur. Diğer parametreler
+    HistGradientBoostingClassifier'a aktarılır.
+    """
+
+    def __init__(self, feature_names=None, max_iter=100, learning_rate=0.1, max_leaf_nodes=31, max_depth=None,
+                 min_samples_leaf=20, l2_regularization=0.0, early_stopping='auto', random_state=None):
+        self.feature_names = feature_names
+        self.max_iter = max_iter
+        self.learning_rate = learning_rate
+        self.max_leaf_nodes = max_leaf_nodes
+        self.max_depth = max_depth
+        self.min_samples_leaf = min_samples_leaf
+        self.l2_regularization = l2_regularization
+        self.early_stopping = early_stopping
+        self.random_state = random_state
+
+    def fit(self, X, y):
+        X = np.asarray(X, dtype=np.float64)
+        names = list(self.feature_names) if self.feature_names is not None else categorical_feature_names()
+        if len(names) != X.shape[1]:
+            raise ValueError(f"Girdide {X.shape[1]} sütun var, sütun adları {len(names)} tane")
+        self.n_features_in_ = X.shape[1]
+
+        categorical = np.zeros(X.shape[1], dtype=bool)
+        categorical[category_columns(names)] = True
+        self.categorical_columns_ = np.flatnonzero(categorical)
+        self.model_ = HistGradientBoostingClassifier(
+            max_iter=self.max_iter, learning_rate=self.learning_rate, max_leaf_nodes=self.max_leaf_nodes,
+            max_depth=self.max_depth, min_samples_leaf=self.min_samples_leaf,
+            l2_regularization=self.l2_regularization, early_stopping=self.early_stopping,
+            categorical_features=categorical, random_state=self.random_state)
+        self.model_.fit(X, y)
+        self.classes_ = self.model_.classes_
+        return self
+
+    def predict_proba(self, X):
+        return self.model_.predict_proba(X)
+
+    def predict(self, X):
+        return self.model_.predict(X)
+
+    def decision_function(self, X):
+        return self.model_.decision_function(X)
+
+    def tree_positions(self):
+        """
+        Girdi sütunlarının ağaçlardaki sırası. HistGradientBoostingClassifier kategorik
+        sütunları OrdinalEncoder'dan geçirip başa alır; ön işlemci yoksa sıra aynıdır.
+        """
+        inner = self.model_
+        if inner._preprocessor is None:
+            return np.arange(self.n_features_in_)
+        order = np.concatenate([np.flatnonzero(inner.is_categorical_), np.flatnonzero(~inner.is_categorical_)])
+        positions = np.empty(self.n_features_in_, dtype=np.intp)
+        positions[order] = np.arange(self.n_features_in_)
+        return positions
+
+    def numeric_thresholds(self, column):
+        """Ağaçların girdideki column sütununu böldüğü sayısal eşikler (sıralı, tekil)."""
+        feature = self.tree_positions()[column]
+        thresholds = [predictor.nodes['num_threshold'][(predictor.nodes['feature_idx'] == feature)
+                                                       & ~predictor.nodes['is_leaf'].astype(bool)
+                                                       & ~predictor.nodes['is_categorical'].astype(bool)]
+                      for iteration in self.model_._predictors for predictor in iteration]
+        return np.unique(np.concatenate(thresholds))
@@ -0,0 +1,243 @@
+"""
+Uygulamadaki modellerin (ve not defterindeki Rastgele Orman ızgarasının) k-katlı
+çapraz doğrulama ile karşılaştırılması.
+
+Her (model, hiperparametreler, kat) işi ayrı bir süreçte çalışır ve sonucu veri
+özeti ile birlikte anahtarlanarak diske yazılır. Tekrar çalıştırıldığında daha önce
+puanlanmış katlar atlanır; yarıda kesilen bir karşılaştırma kaldığı yerden devam eder.
+
+Kullanım:
+    python -m core.comparison
+    python -m core.comparison --grid --folds 5 --workers 8
+"""
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from core.data import DATA_PATH, TARGET_COLUMN, data_fingerprint, load_data
+from core.models import DEFAULT_PARAMS, MODEL_OPTIONS, RANDOM_STATE, fit_scaler, model_feature_names, train_model
+from core.preprocessing import RAW_FEATURES, FeatureEncoder, preprocess_data
+
+# Kat sonuçlarının yazıldığı klasör
+CACHE_DIR = os.path.join('cache', 'cv')
+
+CV_FOLDS = 5
+
+# Not defterindeki GridSearchCV ızgarası. 'auto', sınıflandırıcılarda 'sqrt' ile aynıydı
+# ve scikit-learn 1.3'te kaldırıldı; yerine 'log2' denenir.
+RF_PARAM_GRID = {
+    'n_estimators': [50, 100, 200],
+    'max_depth': [None, 10, 20, 30],
+    'min_samples_split': [2, 5, 10],
+    'min_samples_leaf': [1, 2, 4],
+    'max_features': ['sqrt', 'log2'],
+}
+
+METRICS = ['accuracy', 'f1', 'roc_auc']
+
+
+def candidate_models(include_grid=False):
+    """Karşılaştırılacak (model seçeneği, hiperparametreler) çiftleri."""
+    candidates = [(option, DEFAULT_PARAMS[option]) for option in MODEL_OPTIONS]
+    if include_grid:
+        names = list(RF_PARAM_GRID)
+        for values in itertools.product(*(RF_PARAM_GRID[name] for name in names)):
+            candidates.append(("Rastgele Orman", dict(zip(names, values))))
+    return candidates
+
+
+def fold_key(fingerprint, model_option, params, fold, n_splits):
+    spec = {
+        'fingerprint': fingerprint,
+        'model_option': model_option,
+        'params': params,
+        'fold': fold,
+        'n_splits': n_splits,
+        'random_state': RANDOM_STATE,
+    }
+    return hashlib.sha256(json.dumps(spec, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _cache_path(key, cache_dir):
+    return os.path.join(cache_dir, key[:2], f"{key}.json")
+
+
+def _read_cached(key, cache_dir):
+    try:
+        with open(_cache_path(key, cache_dir), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cached(key, result, cache_dir):
+    path = _cache_path(key, cache_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+# İşçi süreçlerde bir kez yüklenen veri
+_worker_data = {}
+
+
+def _init_worker(X, y, folds, feature_names=None, raw=None):
+    _worker_data['X'] = X
+    _worker_data['feature_names'] = feature_names
+    _worker_data['y'] = y
+    _worker_data['folds'] = folds
+    _worker_data['raw'] = raw
+
+
+def _model_input(model_option):
+    """Modelin sütun düzenindeki matris; kategorik modeller için ham özelliklerden kodlanır."""
+    feature_names = model_feature_names(model_option, _worker_data['feature_names'])
+    if feature_names == _worker_data['feature_names']:
+        return _worker_data['X'], feature_names
+    key = ('X', tuple(feature_names))
+    if key not in _worker_data:
+        _worker_data[key] = FeatureEncoder(feature_names).encode_batch(_worker_data['raw'])
+    return _worker_data[key], feature_names
+
+
+def _score_fold(model_option, params, fold):
+    y = _worker_data['y']
+    X, feature_names = _model_input(model_option)
+    train_idx, test_idx = _worker_data['folds'][fold]
+
+    from sklearn.metrics import accuracy_score, f1_score, roc_auc_score
+
+    scaler = fit_scaler(X[train_idx], feature_names)
+    X_train = scaler.transform(X[train_idx])
+    X_test = scaler.transform(X[test_idx])
+
+    start = time.perf_counter()
+    model = train_model(model_option, X_train, y[train_idx], params, feature_names=feature_names)
+    fit_seconds = time.perf_counter() - start
+
+    y_pred = model.predict(X_test)
+    proba = model.predict_proba(X_test)[:, 1]
+    return {
+        'model_option': model_option,
+        'params': params,
+        'fold': fold,
+        'accuracy': accuracy_score(y[test_idx], y_pred),
+        'f1': f1_score(y[test_idx], y_pred),
+        'roc_auc': roc_auc_score(y[test_idx], proba),
+        'fit_seconds': fit_seconds,
+    }
+
+
+def _load_xy(path):
+    df = load_data(path)
+    df_processed = preprocess_data(df, is_training=True)
+    features = df_processed.drop(TARGET_COLUMN, axis=1)
+    y = df_processed[TARGET_COLUMN].to_numpy()
+    raw = df[RAW_FEATURES].to_numpy(dtype=np.float64)
+    return features.to_numpy(dtype=np.float64), y, features.columns.tolist(), raw
+
+
+def collect_results(candidates, n_splits=CV_FOLDS, path=DATA_PATH, cache_dir=CACHE_DIR):
+    """
+    Önbellekteki kat sonuçlarını ve eksik (henüz puanlanmamış) işleri döndürür.
+    """
+    fingerprint = data_fingerprint(path)
+    results, pending = [], []
+    for model_option, params in candidates:
+        for fold in range(n_splits):
+            key = fold_key(fingerprint, model_option, params, fold, n_splits)
+            cached = _read_cached(key, cache_dir)
+            if cached is not None:
+                results.append(cached)
+            else:
+                pending.append((key, model_option, params, fold))
+    return results, pending
+
+
+def run_comparison(candidates, n_splits=CV_FOLDS, workers=None, path=DATA_PATH,
+                   cache_dir=CACHE_DIR, progress=None):
+    """
+    Eksik katları süreç havuzunda puanlar, her sonucu bittiği anda diske yazar ve
+    tüm kat sonuçlarını döndürür. progress(tamamlanan, toplam) her işten sonra çağrılır.
+    """
+    results, pending = collect_results(candidates, n_splits, path, cache_dir)
+    total = len(results) + len(pending)
+    if progress is not None:
+        progress(len(results), total)
+    if not pending:
+        return results
+
+    from sklearn.model_selection import StratifiedKFold
+
+    X, y, feature_names, raw = _load_xy(path)
+    folds = list(StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=RANDOM_STATE).split(X, y))
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(),
+                             initializer=_init_worker, initargs=(X, y, folds, feature_names, raw)) as executor:
+        futures = {
+            executor.submit(_score_fold, model_option, params, fold): key
+            for key, model_option, params, fold in pending
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            _write_cached(futures[future], result, cache_dir)
+            results.append(result)
+            if progress is not None:
+                progress(len(results), total)
+    return results
+
+
+def leaderboard(results):
+    """Kat sonuçlarını aday başına ortalama/std olarak özetler (F1'e göre sıralı)."""
+    if not results:
+        return pd.DataFrame()
+
+    rows = {}
+    for result in results:
+        key = (result['model_option'], json.dumps(result['params'], sort_keys=True))
+        rows.setdefault(key, []).append(result)
+
+    table = []
+    for (model_option, params), fold_results in rows.items():
+        row = {'Model': model_option, 'Parametreler': params, 'Kat': len(fold_results)}
+        for metric in METRICS:
+            values = [r[metric] for r in fold_results]
+            row[f'{metric}_ort'] = float(np.mean(values))
+            row[f'{metric}_std'] = float(np.std(values))
+        row['eğitim_s'] = float(np.mean([r['fit_seconds'] for r in fold_results]))
+        table.append(row)
+
+    return pd.DataFrame(table).sort_values('f1_ort', ascending=False).reset_index(drop=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Modelleri k-katlı çapraz doğrulama ile karşılaştırır.")
+    parser.add_argument('--grid', action='store_true', help="Rastgele Orman ızgarasını da dahil et")
+    parser.add_argument('--folds', type=int, default=CV_FOLDS)
+    parser.add_argument('--workers', type=int, default=None, help="Süreç sayısı (varsayılan: tüm çekirdekler)")
+    parser.add_argument('--data', default=DATA_PATH)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    candidates = candidate_models(include_grid=args.grid)
+    start = time.perf_counter()
+    _, pending = collect_results(candidates, args.folds, args.data)
+    results = run_comparison(candidates, args.folds, args.workers, args.data)
+    print(f"{len(results)} kat sonucu ({len(pending)} yeni) {time.perf_counter() - start:.1f}s")
+
+    table = leaderboard(results)
+    with pd.option_context('display.max_colwidth', 80, 'display.width', 200):
+        print(table.head(args.top).to_string())
+
+
+if __name__ == '__main__':
+    main()
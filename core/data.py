@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+
+import numpy as np
+import pandas as pd
+
+from core.metrics import metrics
+
+# Veri seti dosyası (uygulama proje kökünden çalıştırılır)
+DATA_PATH = 'heart_cleaned.csv'
+TARGET_COLUMN = 'KalpHastalığı'
+
+# (yol, mtime, boyut) -> içerik özeti; dosya değişmedikçe tekrar okunmaz
+_fingerprint_cache = {}
+_fingerprint_lock = threading.Lock()
+
+
+def data_fingerprint(path=DATA_PATH):
+    """
+    Veri dosyasının içerik özetini (sha256) döndürür.
+    Özet, dosyanın değiştirilme zamanı ve boyutu aynı kaldığı sürece önbellekten gelir.
+    """
+    stat = os.stat(path)
+    stat_key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+    with _fingerprint_lock:
+        cached = _fingerprint_cache.get(stat_key)
+    if cached is not None:
+        return cached
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    fingerprint = digest.hexdigest()
+
+    with _fingerprint_lock:
+        _fingerprint_cache[stat_key] = fingerprint
+    return fingerprint
+
+
+# Sütunlu (her sütun ayrı .npy) veri kopyalarının klasörü
+COLUMNAR_DIR = os.path.join('cache', 'columnar')
+
+_columnar_cache = {}
+_columnar_lock = threading.Lock()
+
+
+def compact_dtype(values):
+    """
+    Değerleri kayıpsız taşıyan en küçük veri tipini döndürür
+    (ör. 0/1 sütunları için int8, tam temsil edilebiliyorsa float32).
+    """
+    if np.issubdtype(values.dtype, np.integer) and len(values):
+        low, high = values.min(), values.max()
+        for dtype in (np.int8, np.int16, np.int32):
+            info = np.iinfo(dtype)
+            if info.min <= low and high <= info.max:
+                return np.dtype(dtype)
+        return np.dtype(np.int64)
+    if np.issubdtype(values.dtype, np.floating):
+        as_float32 = values.astype(np.float32)
+        if np.array_equal(as_float32.astype(values.dtype), values, equal_nan=True):
+            return np.dtype(np.float32)
+    return values.dtype
+
+
+def _columnar_path(path, fingerprint, directory):
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(directory, f"{name}-{fingerprint[:16]}")
+
+
+def build_columnar(path=DATA_PATH, directory=COLUMNAR_DIR):
+    """
+    CSV dosyasını sıkı veri tipleriyle sütun başına bir .npy dosyası olarak yazar.
+    Aynı dosyanın eski sürümlerine ait kopyalar silinir.
+    """
+    fingerprint = data_fingerprint(path)
+    target = _columnar_path(path, fingerprint, directory)
+    if os.path.exists(os.path.join(target, 'meta.json')):
+        return target
+
+    df = pd.read_csv(path)
+    tmp_target = f"{target}.tmp{os.getpid()}"
+    os.makedirs(tmp_target, exist_ok=True)
+
+    columns = []
+    for i, col in enumerate(df.columns):
+        values = df[col].to_numpy()
+        dtype = compact_dtype(values)
+        np.save(os.path.join(tmp_target, f"{i}.npy"), values.astype(dtype))
+        columns.append({'name': col, 'file': f"{i}.npy", 'dtype': dtype.str})
+
+    meta = {'source': os.path.basename(path), 'fingerprint': fingerprint, 'rows': len(df), 'columns': columns}
+    with open(os.path.join(tmp_target, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+
+    try:
+        os.replace(tmp_target, target)
+    except OSError:
+        # Başka bir süreç aynı kopyayı daha önce yazdı
+        shutil.rmtree(tmp_target, ignore_errors=True)
+
+    prefix = os.path.basename(target).rsplit('-', 1)[0] + '-'
+    for entry in os.listdir(directory):
+        entry_path = os.path.join(directory, entry)
+        if entry.startswith(prefix) and entry_path != target and '.tmp' not in entry:
+            shutil.rmtree(entry_path, ignore_errors=True)
+    return target
+
+
+@metrics.timed('load_data')
+def load_data(path=DATA_PATH, directory=COLUMNAR_DIR):
+    """
+    Veri setini sütunlu kopyadan yükler; kopya yoksa ya da CSV değiştiyse önce oluşturur.
+
+    Sütunlar salt okunur olarak belleğe eşlenir ve süreç içinde paylaşılır; her çağrı
+    aynı dizileri kopyalamadan saran yeni bir DataFrame döndürür. Böylece bir sayfanın
+    eklediği sütunlar diğer oturumları etkilemez.
+    """
+    fingerprint = data_fingerprint(path)
+    key = os.path.abspath(path)
+
+    with _columnar_lock:
+        cached = _columnar_cache.get(key)
+        if cached is None or cached[0] != fingerprint:
+            target = build_columnar(path, directory)
+            with open(os.path.join(target, 'meta.json'), encoding='utf-8') as f:
+                meta = json.load(f)
+            arrays = {
+                col['name']: np.load(os.path.join(target, col['file']), mmap_mode='r')
+                for col in meta['columns']
+            }
+            cached = (fingerprint, arrays)
+            _columnar_cache[key] = cached
+
+    return pd.DataFrame(cached[1], copy=False)
@@ -0,0 +1,81 @@
+"""
+Veri setinden türetilen etiket ve grup sütunları.
+
+Sayfalar grafik için ortak veri çerçevesine sütun eklemez ve onu kopyalamaz; bunun yerine
+bir gruplama tanımına (Binning/Categories) karşılık gelen kategorik sütunu buradan alır.
+Her sütun veri setinin sürümü ve tanım başına bir kez, ilk istendiğinde hesaplanır ve
+yalnızca kodları (int8) ile kategori etiketlerini tutar.
+"""
+import os
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from core.data import DATA_PATH, data_fingerprint, load_data
+
+
+@dataclass(frozen=True)
+class Binning:
+    """pd.cut(values, bins=edges, labels=labels) ile aynı, sağdan kapalı aralıklar."""
+    column: str
+    edges: tuple
+    labels: tuple
+
+    def codes(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        codes = np.searchsorted(self.edges, values, side='left') - 1
+        # Aralıkların dışındaki ve eksik değerler son (atlanan) hücreye düşer
+        codes[(codes < 0) | (codes >= len(self.labels)) | np.isnan(values)] = len(self.labels)
+        return codes
+
+
+@dataclass(frozen=True)
+class Categories:
+    """Kodlanmış bir kategorik sütun; (kod, etiket) çiftleri gösterim sırasındadır."""
+    column: str
+    values: tuple
+
+    @property
+    def labels(self):
+        return tuple(label for _, label in self.values)
+
+    def codes(self, values):
+        values = np.asarray(values)
+        codes = np.full(len(values), len(self.values), dtype=np.int64)
+        for i, (value, _) in enumerate(self.values):
+            codes[values == value] = i
+        return codes
+
+
+def to_categorical(spec, values):
+    """Değerleri tanımın etiketleriyle kategorik sütuna dönüştürür (eşleşmeyenler NaN)."""
+    codes = spec.codes(values)
+    codes[codes == len(spec.labels)] = -1
+    return pd.Categorical.from_codes(codes.astype(np.int8), categories=list(spec.labels))
+
+
+_derived_cache = {}
+_derived_lock = threading.Lock()
+
+
+def derived_column(spec, path=DATA_PATH):
+    """
+    Veri setinin mevcut sürümü için tanıma karşılık gelen kategorik sütunu döndürür.
+    Sonuç load_data() ile aynı satır sırasına sahiptir ve önbellekten paylaşıldığı
+    için değiştirilmemelidir.
+    """
+    key = (os.path.abspath(path), data_fingerprint(path), spec)
+    with _derived_lock:
+        cached = _derived_cache.get(key)
+    if cached is not None:
+        return cached
+
+    column = pd.Series(to_categorical(spec, load_data(path)[spec.column].to_numpy()), name=spec.column)
+    with _derived_lock:
+        # Eski veri sürümlerine ait sütunlar bırakılır
+        for stale in [k for k in _derived_cache if k[0] == key[0] and k[1] != key[1]]:
+            del _derived_cache[stale]
+        _derived_cache[key] = column
+    return column
@@ -0,0 +1,162 @@
+"""
+Hasta başına risk faktörleri: tek tek tahminler için özellik katkıları.
+
+- Rastgele Orman: ağaç yolu katkıları (Saabas). Her bölünmede kalp hastalığı
+  olasılığındaki değişim bölünen özelliğe yazılır; bir hastanın katkıları yolundaki
+  değişimlerin toplamıdır ve kök olasılığıyla birlikte tahmini tam olarak verir. Yol
+  toplamları her yaprak için model başına bir kez hesaplanır; bir hastanın katkıları
+  ağaç başına yaprak bulma ve tablo satırlarının toplamıdır.
+- Lojistik Regresyon: doğrusal katkılar coef_j * x_j (ölçeklenmiş eğitim ortalaması
+  0 olduğundan log-odds cinsinden tam ayrışım).
+- Diğer modeller (SVM, gradyan artırma): tıkama. Her özellik eğitim ortalamasına
+  çekildiğinde (kategori kodu sütunları eksik değere) riskteki değişim; tüm hastalar ve
+  özellikler tek bir tahmin çağrısında puanlanır.
+
+One-hot sütunların katkıları kaynak özelliklerinde toplanır; sonuç RAW_FEATURES'taki
+11 özellik içindir.
+"""
+import threading
+import weakref
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from core.preprocessing import RAW_FEATURES, category_columns
+from core.sensitivity import predict_risk
+
+TREE_PATH = 'ağaç yolu'
+LINEAR = 'doğrusal'
+OCCLUSION = 'tıkama'
+
+
+@dataclass
+class Attribution:
+    """
+    contributions[i, j], i. hastanın tahmininde j. özelliğin katkısıdır. Ağaç yolu ve
+    doğrusal katkılarda base + katkıların toplamı tahmine eşittir; tıkamada base,
+    tüm özellikler ortalamadayken verilen risktir.
+    """
+    features: list
+    contributions: np.ndarray  # (n, len(features))
+    base: np.ndarray  # (n,)
+    prediction: np.ndarray  # (n,)
+    method: str
+    unit: str  # 'olasılık' ya da 'log-odds'
+
+    def top(self, row=0, k=5):
+        """Hastanın katkısı mutlak değerce en büyük k özelliği (özellik, katkı) olarak."""
+        values = self.contributions[row]
+        order = np.argsort(-np.abs(values), kind='stable')[:k]
+        return [(self.features[j], float(values[j])) for j in order]
+
+    def mean_abs(self):
+        """Özellik başına ortalama mutlak katkı (toplu özet), azalan sırada."""
+        return pd.Series(np.abs(self.contributions).mean(axis=0), index=self.features).sort_values(ascending=False)
+
+
+def _group_matrix(trained):
+    """(model sütunu, ham özellik) göstergesi; one-hot sütunlarını kaynak özelliğe toplar."""
+    sources = trained.encoder.column_sources()
+    groups = np.zeros((len(sources), len(RAW_FEATURES)), dtype=np.float64)
+    known = sources >= 0
+    groups[np.flatnonzero(known), sources[known]] = 1.0
+    return groups
+
+
+_leaf_tables = weakref.WeakKeyDictionary()
+_leaf_lock = threading.Lock()
+
+
+def _leaf_table(forest, sources):
+    """
+    Tüm ağaçların düğümleri için (toplam düğüm, ham özellik) boyutlu katkı tablosu, ağaç
+    başına düğüm ofsetleri ve kök olasılığı. Bir düğümün satırı, kökten o düğüme giden
+    yoldaki olasılık değişimlerinin bölünen özelliklere göre toplamıdır (ağaç sayısına
+    bölünmüş); hastanın katkıları ulaştığı yaprakların satırlarının toplamıdır.
+    """
+    positive = list(forest.classes_).index(1)
+    n_trees = len(forest.estimators_)
+    offsets = np.cumsum([0] + [estimator.tree_.node_count for estimator in forest.estimators_])
+    table = np.zeros((offsets[-1], len(RAW_FEATURES)), dtype=np.float64)
+    bias = 0.0
+
+    for estimator, offset in zip(forest.estimators_, offsets):
+        tree = estimator.tree_
+        value = tree.value[:, 0, :]
+        proba = value[:, positive] / value.sum(axis=1)
+        cumulative = table[offset:offset + tree.node_count]
+        bias += proba[0]
+
+        # Kökten başlayarak seviye seviye: çocuğun satırı = ebeveynin satırı + bölünmenin katkısı
+        frontier = np.array([0], dtype=np.intp)
+        while frontier.size:
+            parents = frontier[tree.children_left[frontier] >= 0]
+            for children in (tree.children_left[parents], tree.children_right[parents]):
+                cumulative[children] = cumulative[parents]
+                source = sources[tree.feature[parents]]
+                known = source >= 0
+                cumulative[children[known], source[known]] += (proba[children] - proba[parents])[known] / n_trees
+            frontier = np.concatenate([tree.children_left[parents], tree.children_right[parents]])
+
+    return table, offsets[:-1], bias / n_trees
+
+
+def _explain_forest(trained, X):
+    forest = trained.model
+    with _leaf_lock:
+        cached = _leaf_tables.get(forest)
+        if cached is None:
+            cached = _leaf_table(forest, trained.encoder.column_sources())
+            _leaf_tables[forest] = cached
+    table, offsets, bias = cached
+
+    # Ağaçlar sklearn'deki gibi float32 girdiyle dolaşılır; her ağacın yaprakları tek apply çağrısıdır
+    X32 = np.ascontiguousarray(X, dtype=np.float32)
+    contributions = np.zeros((len(X), table.shape[1]), dtype=np.float64)
+    for estimator, offset in zip(forest.estimators_, offsets):
+        contributions += table[estimator.tree_.apply(X32) + offset]
+    base = np.full(len(X), bias)
+    return Attribution(list(RAW_FEATURES), contributions, base, base + contributions.sum(axis=1), TREE_PATH, 'olasılık')
+
+
+def _explain_linear(trained, X):
+    model = trained.model
+    contributions = (X * model.coef_[0]) @ _group_matrix(trained)
+    base = np.full(len(X), float(model.intercept_[0]))
+    return Attribution(list(RAW_FEATURES), contributions, base, base + contributions.sum(axis=1), LINEAR, 'log-odds')
+
+
+def _explain_occlusion(trained, X):
+    groups = _group_matrix(trained).T.astype(bool)  # (ham özellik, model sütunu)
+    n, n_groups = len(X), len(groups)
+
+    # Referans: ölçeklenmiş sütunlarda ortalama (0), kategori kodlarında eksik değer
+    reference = np.zeros(X.shape[1])
+    reference[category_columns(trained.feature_names)] = np.nan
+
+    # Her hasta için: kendisi, her özelliği ayrı ayrı referansa çekilmiş n_groups kopyası
+    # ve tüm özellikleri referansta olan satır; hepsi tek çağrıda puanlanır
+    batch = np.repeat(X[:, np.newaxis, :], n_groups + 2, axis=1)
+    batch[:, 1:n_groups + 1] = np.where(groups, reference, batch[:, 1:n_groups + 1])
+    batch[:, -1] = reference
+    risk = predict_risk(trained.model, batch.reshape(-1, X.shape[1])).reshape(n, n_groups + 2)
+
+    prediction = risk[:, 0]
+    contributions = prediction[:, np.newaxis] - risk[:, 1:n_groups + 1]
+    return Attribution(list(RAW_FEATURES), contributions, risk[:, -1], prediction, OCCLUSION, 'olasılık')
+
+
+def explain(trained, X_scaled):
+    """Ölçeklenmiş model girdisinin her satırı için özellik katkıları."""
+    X = np.atleast_2d(np.asarray(X_scaled, dtype=np.float64))
+    if hasattr(trained.model, 'estimators_') and hasattr(trained.model, 'decision_path'):
+        return _explain_forest(trained, X)
+    if hasattr(trained.model, 'coef_'):
+        return _explain_linear(trained, X)
+    return _explain_occlusion(trained, X)
+
+
+def explain_records(trained, records):
+    """Ham kayıtlar (sözlük listesi ya da DataFrame) için özellik katkıları."""
+    return explain(trained, trained.encode(records))
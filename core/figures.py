@@ -0,0 +1,131 @@
+"""
+Sunucu tarafı grafik önbelleği.
+
+Her grafik (grafik kimliği, parametreler, veri sürümü) anahtarı için bir kez çizilip PNG
+baytlarına dönüştürülür; sonraki sayfa görüntülemelerinde bu baytlar gönderilir. Önbellek
+toplam bayt sınırına göre en uzun süredir kullanılmayan girdiyi atar (LRU).
+
+Şekiller pyplot'un süreç geneli şekil listesine kaydedilmeden doğrudan
+matplotlib.figure.Figure olarak oluşturulur ve çizimden hemen sonra temizlenir; böylece
+sürekli trafikte açık şekil birikmez ve oturumlar pyplot'un paylaşılan durumuna dokunmaz.
+"""
+import io
+import json
+import threading
+from collections import OrderedDict
+
+from core.metrics import metrics
+
+# st.pyplot'un varsayılan kaydetme seçenekleriyle aynı
+SAVEFIG_OPTIONS = {'format': 'png', 'dpi': 200, 'bbox_inches': 'tight'}
+
+# Streamlit bundan geniş görüntüleri her gösterimde çözüp küçültür ve yeniden kodlar;
+# grafikler bir kez, önbelleğe yazılmadan önce bu genişliğe küçültülür
+MAX_WIDTH = 2 * 730
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def chart_key(chart_id, params=None, version=None):
+    return (chart_id, json.dumps(params, sort_keys=True, ensure_ascii=False, default=str), version)
+
+
+@metrics.timed('figure_render')
+def render_figure(draw, figsize=(10, 6)):
+    """draw(ax) ile çizilen tek eksenli şekli PNG baytlarına dönüştürür ve şekli kapatır."""
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize)
+    try:
+        draw(fig.subplots())
+        buffer = io.BytesIO()
+        fig.savefig(buffer, **SAVEFIG_OPTIONS)
+    finally:
+        # Eksenler ve sanatçılar arasındaki döngüler kırılır; bellek çöp toplayıcıyı beklemeden bırakılır
+        fig.clear()
+    return _fit_width(buffer.getvalue())
+
+
+def _fit_width(data, max_width=MAX_WIDTH):
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(data))
+    if image.width <= max_width:
+        return data
+    image = image.resize((max_width, int(image.height * max_width / image.width)), resample=Image.BILINEAR)
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+class FigureCache:
+    """Çizilmiş grafiklerin bayt sınırlı LRU önbelleği."""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = data
+            self._bytes += len(data)
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def render(self, chart_id, draw, params=None, version=None, figsize=(10, 6)):
+        """Grafiğin PNG baytları; önbellekte yoksa çizilir ve eklenir."""
+        key = chart_key(chart_id, params, version)
+        data = self.get(key)
+        if data is None:
+            data = render_figure(draw, figsize)
+            self.put(key, data)
+        return data
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+
+# Süreç geneli önbellek; tüm oturumlar paylaşır
+figure_cache = FigureCache()
+
+
+def show_chart(chart_id, draw, params=None, version=None, figsize=(10, 6)):
+    """Grafiği önbellekten (gerekirse çizerek) Streamlit sayfasında gösterir."""
+    import streamlit as st
+
+    st.image(figure_cache.render(chart_id, draw, params, version, figsize), width='stretch', output_format='PNG')
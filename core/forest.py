@@ -0,0 +1,181 @@
+"""
+Eğitilmiş Rastgele Orman'ın düz dizilere derlenmiş hali ve NumPy ile tahmini.
+
+RandomForestClassifier.predict_proba her çağrıda girdiyi doğrular ve ağaçları tek tek
+(joblib üzerinden) dolaşır; tek satırlık form tahminlerinde süre bu ek yükten gelir.
+Burada tüm ağaçların düğümleri tek bir dizi kümesinde birleştirilir (bölünen özellik,
+eşik, çocuklar, yaprak olasılıkları) ve bir satır grubu için tüm ağaçlar aynı anda,
+seviye seviye dolaşılır.
+
+scikit-learn girdiyi float32'ye çevirip float64 eşiklerle karşılaştırır. float32 bir x
+için x <= t, x <= (t'den küçük ya da eşit en büyük float32) ile aynıdır; eşikler bu
+şekilde float32'ye yuvarlanır ve karşılaştırmalar float32'de yapılır. Ağaç olasılıkları
+scikit-learn'deki sırayla toplanıp ağaç sayısına bölündüğü için sonuç predict_proba ile
+bit düzeyinde aynıdır.
+
+Tek çekirdekte derlenmiş yol küçük gruplarda (tek satırda ~20 kat) hızlıdır; ~1.000
+satırın üzerinde scikit-learn'ün C'deki ağaç dolaşımı öne geçer. predict_proba bu yüzden
+FLAT_MAX_ROWS satıra kadar derlenmiş yolu, daha büyük girdilerde modelin kendisini kullanır.
+"""
+import dataclasses
+import threading
+import weakref
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from core.quantize import is_missing, quantize, threshold_edges
+
+# Satırlar bu boyutta gruplar halinde dolaşılır (satır x ağaç düğüm indeksleri önbellekte kalır)
+CHUNK_ROWS = 4096
+
+# Dolaşım bu seviyeden başlayarak her COMPACT_EVERY seviyede bir yapraklara ulaşan
+# (satır, ağaç) çiftlerini bırakır (uygulamanın ormanında ortalama yaprak derinliği ~8)
+COMPACT_FROM = 6
+COMPACT_EVERY = 3
+
+# Bu satır sayısına kadar derlenmiş yol kullanılır (benchmarks/bench_forest.py)
+FLAT_MAX_ROWS = 1024
+
+
+def float32_thresholds(threshold):
+    """x (float32) <= t  <=>  x <= t'den büyük olmayan en büyük float32."""
+    t32 = threshold.astype(np.float32)
+    too_large = t32.astype(np.float64) > threshold
+    t32[too_large] = np.nextafter(t32[too_large], np.float32(-np.inf))
+    return t32
+
+
+@dataclass
+class FlatForest:
+    """Tüm ağaçların düğümleri; indeksler birleştirilmiş düğüm dizisindedir."""
+    feature: np.ndarray  # (düğüm,) intp; yapraklarda 0
+    threshold: np.ndarray  # (düğüm,) float32; kodlanmış ormanda uint8 eşik kodu
+    children: np.ndarray  # (2 * düğüm,) intp; 2i sol, 2i + 1 sağ çocuk, yapraklarda i
+    missing_left: np.ndarray  # (düğüm,) bool; eksik değerin gittiği yön
+    value: np.ndarray  # (düğüm, sınıf) float64 (azaltılmış duyarlıkta float32); yapraklarda sınıf olasılıkları
+    roots: np.ndarray  # (ağaç,) intp
+    depth: int
+    classes: np.ndarray
+    edges: list = None  # kodlanmış ormanda özellik başına eşik kenarları (core.quantize)
+    is_leaf: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.is_leaf = self.children[::2] == np.arange(len(self.feature))
+
+    @classmethod
+    def from_sklearn(cls, forest):
+        trees = [estimator.tree_ for estimator in forest.estimators_]
+        offsets = np.cumsum([0] + [tree.node_count for tree in trees])
+        n_nodes = int(offsets[-1])
+
+        # İndeksler NumPy'ın doğal indeks tipinde (intp) tutulur; her toplamada dönüşüm yapılmaz
+        feature = np.zeros(n_nodes, dtype=np.intp)
+        threshold = np.zeros(n_nodes, dtype=np.float32)
+        children = np.empty(2 * n_nodes, dtype=np.intp)
+        missing_left = np.zeros(n_nodes, dtype=bool)
+        value = np.zeros((n_nodes, len(forest.classes_)), dtype=np.float64)
+
+        for tree, offset in zip(trees, offsets):
+            nodes = slice(offset, offset + tree.node_count)
+            index = np.arange(offset, offset + tree.node_count, dtype=np.intp)
+            split = tree.children_left >= 0
+
+            feature[nodes] = np.where(split, tree.feature, 0)
+            threshold[nodes] = np.where(split, float32_thresholds(tree.threshold), 0.0)
+            children[2 * offset:2 * (offset + tree.node_count):2] = np.where(split, tree.children_left + offset, index)
+            children[2 * offset + 1:2 * (offset + tree.node_count):2] = np.where(split, tree.children_right + offset, index)
+            if hasattr(tree, 'missing_go_to_left'):
+                missing_left[nodes] = tree.missing_go_to_left.astype(bool) & split
+
+            # DecisionTreeClassifier.predict_proba ile aynı normalizasyon
+            leaf_value = tree.value[:, 0, :]
+            normalizer = leaf_value.sum(axis=1)[:, np.newaxis]
+            normalizer[normalizer == 0.0] = 1.0
+            value[nodes] = leaf_value / normalizer
+
+        return cls(feature, threshold, children, missing_left, value, offsets[:-1].astype(np.intp),
+                   max(tree.max_depth for tree in trees), np.asarray(forest.classes_))
+
+    def reduced(self, precision):
+        """
+        Azaltılmış duyarlıkta kopya: 'float32' yaprak olasılıklarını float32'de toplar,
+        'int8' ayrıca girdiyi ve eşikleri 8 bitlik kodlara indirir (core.quantize).
+        """
+        value = self.value.astype(np.float32)
+        if precision == 'float32':
+            return dataclasses.replace(self, value=value)
+        if precision == 'int8':
+            n_features = int(self.feature.max()) + 1
+            edges, codes, _ = threshold_edges(self.feature, self.threshold, ~self.is_leaf, n_features)
+            return dataclasses.replace(self, threshold=codes, value=value, edges=edges)
+        raise ValueError(f"Bilinmeyen duyarlık: {precision}")
+
+    def _leaves(self, X32):
+        """(satır, ağaç) boyutlu yaprak indeksleri; X32 float32 ya da kodlanmış (uint8) girdidir."""
+        n_rows, n_features = X32.shape
+        n_trees = len(self.roots)
+        flat = X32.ravel()
+        # (satır, ağaç) çiftleri düz dizide; satırın X içindeki başlangıcı + bölünen özellik = değerin konumu
+        base = np.repeat(np.arange(n_rows, dtype=np.intp) * n_features, n_trees)
+        nodes = np.tile(self.roots, n_rows)
+        missing = is_missing(flat).any()
+
+        leaves, active = None, None
+        for level in range(1, self.depth + 1):
+            x = flat[base + self.feature[nodes]]
+            go_right = x > self.threshold[nodes]
+            if missing:
+                go_right |= is_missing(x) & ~self.missing_left[nodes]
+            nodes = self.children[2 * nodes + go_right]
+
+            # Yapraklara ulaşan çiftler belirli seviyelerde ayrılır; derin yollar daha az çiftle sürer
+            if level >= COMPACT_FROM and (level - COMPACT_FROM) % COMPACT_EVERY == 0 and level < self.depth:
+                if leaves is None:
+                    leaves, active = nodes.copy(), np.arange(nodes.size)
+                else:
+                    leaves[active] = nodes
+                keep = ~self.is_leaf[nodes]
+                nodes, base, active = nodes[keep], base[keep], active[keep]
+
+        if leaves is None:
+            return nodes.reshape(n_rows, n_trees)
+        leaves[active] = nodes
+        return leaves.reshape(n_rows, n_trees)
+
+    def predict_proba(self, X):
+        X32 = np.ascontiguousarray(np.atleast_2d(X), dtype=np.float32)
+        proba = np.empty((len(X32), self.value.shape[1]), dtype=self.value.dtype)
+        for start in range(0, len(X32), CHUNK_ROWS):
+            chunk_X = X32[start:start + CHUNK_ROWS]
+            leaves = self._leaves(chunk_X if self.edges is None else quantize(chunk_X, self.edges))
+            # RandomForestClassifier gibi: ağaç olasılıkları sırayla toplanır, ağaç sayısına bölünür
+            chunk = np.zeros((len(leaves), self.value.shape[1]), dtype=self.value.dtype)
+            for tree in range(leaves.shape[1]):
+                chunk += self.value[leaves[:, tree]]
+            proba[start:start + len(leaves)] = chunk / leaves.shape[1]
+        return proba
+
+
+_compiled = weakref.WeakKeyDictionary()
+_compiled_lock = threading.Lock()
+
+
+def compile_forest(model):
+    """Model tek çıktılı bir RandomForestClassifier ise düz hali (model başına bir kez), değilse None."""
+    if type(model).__name__ != 'RandomForestClassifier' or getattr(model, 'n_outputs_', 1) != 1:
+        return None
+    with _compiled_lock:
+        flat = _compiled.get(model)
+        if flat is None:
+            flat = FlatForest.from_sklearn(model)
+            _compiled[model] = flat
+        return flat
+
+
+def predict_proba(model, X):
+    """model.predict_proba(X) ile aynı sonuç; küçük orman girdilerinde derlenmiş yol kullanılır."""
+    flat = compile_forest(model) if len(X) <= FLAT_MAX_ROWS else None
+    if flat is None:
+        return model.predict_proba(X)
+    return flat.predict_proba(X)
@@ -0,0 +1,288 @@
+"""
+Modelden bağımsız permütasyon önemi.
+
+Bir özelliğin önemi, test setinde o özelliğin değerleri hastalar arasında karıştırıldığında
+doğruluktaki düşüştür. One-hot sütunları kaynak özellikleriyle birlikte karıştırılır. Her
+özellik için tekrarların karıştırılmış kopyaları tek bir matriste birlikte puanlanır;
+özellikler iş parçacığı havuzunda paralel işlenir (NumPy ve ağaç tahmini GIL'i
+bıraktığı için model ve veri kopyalanmadan tüm çekirdekler kullanılır).
+
+Sonuçlar (model seçeneği, hiperparametreler, veri özeti) anahtarıyla süreç içinde ve
+cache/importance/ altında saklanır; görselleştirme ve tahmin sayfaları aynı sonuçları
+kullanır. Hesaplama arka planda yapılır, sayfalar sonucu beklerken bloklanmaz.
+
+Kullanım:
+    python -m core.importance --model "Rastgele Orman" --repeats 10
+"""
+import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+
+import numpy as np
+
+from core.data import DATA_PATH
+from core.models import DEFAULT_MODEL_OPTION, MODEL_OPTIONS, RANDOM_STATE, get_trained_model, load_split
+from core.preprocessing import RAW_FEATURES
+from core.sensitivity import predict_risk
+
+# Sonuçların yazıldığı klasör
+CACHE_DIR = os.path.join('cache', 'importance')
+
+# Özellik başına karıştırma sayısı
+N_REPEATS = 10
+
+# Sonuç beklenirken sayfadaki bölüm bu aralıkla yeniden çizilir (saniye)
+POLL_SECONDS = 1.0
+
+# İşçi başına karıştırma tamponunun en fazla hücre sayısı (~32 MB); tekrarlar bu
+# sınıra sığdığı kadar tek tahmin çağrısında puanlanır
+MAX_BATCH_CELLS = 4_000_000
+
+
+@dataclass
+class ImportanceResult:
+    """importances[j][r], j. özelliğin r. karıştırmada doğrulukta yol açtığı düşüştür."""
+    features: list
+    importances_mean: list
+    importances_std: list
+    importances: list
+    baseline_score: float
+    n_repeats: int
+    seconds: float
+
+    def ranking(self):
+        """(özellik, ortalama, std) üçlüleri, önem sırasına göre azalan."""
+        rows = zip(self.features, self.importances_mean, self.importances_std)
+        return sorted(rows, key=lambda row: -row[1])
+
+
+def _accuracy(model, X, y):
+    return float(np.mean((predict_risk(model, X) >= 0.5) == y))
+
+
+def _score_features(model, X, y, jobs, n_repeats, baseline):
+    """
+    Bir işçiye düşen özelliklerin (sütun grubu, tohum) doğruluk düşüşleri. Tekrarlar X'in
+    kopyalarından oluşan tek bir tamponda birlikte puanlanır; tampon işçi başına bir kez
+    ayrılır ve her özellikten sonra yalnızca onun sütunları eski haline getirilir.
+    """
+    n = len(X)
+    per_batch = max(1, min(n_repeats, MAX_BATCH_CELLS // X.size))
+    buffer = np.tile(X, (per_batch, 1))
+    y_batch = np.tile(y, per_batch)
+
+    results = []
+    for columns, seed in jobs:
+        rng = np.random.default_rng(seed)
+        drops = []
+        for start in range(0, n_repeats, per_batch):
+            repeats = min(per_batch, n_repeats - start)
+            for r in range(repeats):
+                buffer[r * n:(r + 1) * n, columns] = X[np.ix_(rng.permutation(n), columns)]
+            correct = (predict_risk(model, buffer[:repeats * n]) >= 0.5) == y_batch[:repeats * n]
+            drops.extend(baseline - correct.reshape(repeats, n).mean(axis=1))
+        buffer[:, columns] = np.tile(X[:, columns], (per_batch, 1))
+        results.append(drops)
+    return results
+
+
+def permutation_importance(model, X, y, groups, names, n_repeats=N_REPEATS,
+                           random_state=RANDOM_STATE, workers=None):
+    """
+    groups[j], names[j] özelliğinin X'teki sütun indeksleridir. Özellikler işçiler
+    arasında paylaştırılır; karıştırmalar özellik başına ayrı tohumlardan üretildiği için
+    sonuç işçi sayısından bağımsızdır.
+    """
+    start = time.perf_counter()
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    y = np.asarray(y)
+    baseline = _accuracy(model, X, y)
+    seeds = np.random.SeedSequence(random_state).spawn(len(groups))
+    jobs = list(zip([np.asarray(columns, dtype=np.intp) for columns in groups], seeds))
+
+    workers = min(workers or os.cpu_count(), len(jobs))
+    chunks = [jobs[i::workers] for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        scored = list(executor.map(lambda chunk: _score_features(model, X, y, chunk, n_repeats, baseline), chunks))
+
+    # İşçi i, i, i + workers, ... sıradaki özellikleri puanladı
+    drops = np.empty((len(jobs), n_repeats))
+    for i, chunk_drops in enumerate(scored):
+        drops[i::workers] = chunk_drops
+    return ImportanceResult(
+        list(names), drops.mean(axis=1).tolist(), drops.std(axis=1).tolist(), drops.tolist(),
+        baseline, n_repeats, time.perf_counter() - start)
+
+
+def feature_groups(trained):
+    """RAW_FEATURES sırasında, her ham özelliğin modeldeki sütunları (one-hot dahil)."""
+    sources = trained.encoder.column_sources()
+    names, groups = [], []
+    for i, name in enumerate(RAW_FEATURES):
+        columns = np.flatnonzero(sources == i)
+        if columns.size:
+            names.append(name)
+            groups.append(columns)
+    return groups, names
+
+
+def importance_key(trained, n_repeats=N_REPEATS):
+    spec = {
+        'fingerprint': trained.fingerprint,
+        'model_option': trained.model_option,
+        'params': trained.params,
+        'n_repeats': n_repeats,
+        'random_state': RANDOM_STATE,
+    }
+    return hashlib.sha256(json.dumps(spec, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def compute_importance(trained, n_repeats=N_REPEATS, workers=None, path=DATA_PATH):
+    """Eğitilmiş modelin test seti üzerindeki permütasyon önemi."""
+    split = load_split(path)
+    groups, names = feature_groups(trained)
+    return permutation_importance(trained.model, trained.encode(split.raw_test), split.y_test.to_numpy(),
+                                  groups, names, n_repeats, workers=workers)
+
+
+class ImportanceStore:
+    """
+    Permütasyon önemi sonuçları; süreç genelinde ve diskte saklanır. Her anahtar için
+    hesaplama bir kez, arka plandaki bir iş parçacığında yapılır.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, n_repeats=N_REPEATS, workers=None):
+        self.cache_dir = cache_dir
+        self.n_repeats = n_repeats
+        self.workers = workers
+        self._results = {}
+        self._running = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='importance')
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _read(self, key):
+        try:
+            with open(self._path(key), encoding='utf-8') as f:
+                return ImportanceResult(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _write(self, key, result):
+        path = self._path(key)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(asdict(result), f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def get(self, trained):
+        """Sonuç hazırsa döndürür; değilse None (hesaplama başlatılmaz)."""
+        key = importance_key(trained, self.n_repeats)
+        with self._lock:
+            result = self._results.get(key)
+            if result is None:
+                result = self._read(key)
+                if result is not None:
+                    self._results[key] = result
+            return result
+
+    def submit(self, trained):
+        """Sonucun Future'ı; hesaplama gerekiyorsa arka planda başlatılır."""
+        key = importance_key(trained, self.n_repeats)
+        with self._lock:
+            future = self._running.get(key)
+            if future is None:
+                future = self._executor.submit(self._compute, key, trained)
+                self._running[key] = future
+            return future
+
+    def result(self, trained, wait=False):
+        """Sonucu döndürür; yoksa hesaplamayı başlatır ve wait=False ise None döner."""
+        result = self.get(trained)
+        if result is not None:
+            return result
+        future = self.submit(trained)
+        return future.result() if wait else None
+
+    def _compute(self, key, trained):
+        try:
+            result = self.get(trained)
+            if result is None:
+                result = compute_importance(trained, self.n_repeats, self.workers)
+                self._write(key, result)
+                with self._lock:
+                    self._results[key] = result
+            return result
+        finally:
+            with self._lock:
+                self._running.pop(key, None)
+
+
+# Süreç genelindeki sonuç deposu; tüm oturumlar ve sayfalar paylaşır
+importance_store = ImportanceStore()
+
+
+def show_importance(trained, store=None):
+    """
+    Modelin permütasyon önemi grafiğini Streamlit sayfasında gösterir. Sonuç henüz yoksa
+    hesaplama arka planda başlatılır ve yalnızca bu bölüm sonuç gelene kadar yoklanır.
+    """
+    import streamlit as st
+
+    from core.figures import show_chart
+
+    store = store or importance_store
+    pending = store.result(trained) is None
+
+    @st.fragment(run_every=POLL_SECONDS if pending else None)
+    def section():
+        result = store.get(trained)
+        if result is None:
+            store.submit(trained)
+            st.info("Permütasyon önemi arka planda hesaplanıyor...")
+            return
+        if pending:
+            # Yoklama durdurulur; sonuç önbellekte olduğu için sayfa hemen çizilir
+            st.rerun()
+
+        ranking = result.ranking()[::-1]
+
+        def draw(ax):
+            ax.barh([row[0] for row in ranking], [row[1] for row in ranking], xerr=[row[2] for row in ranking],
+                    color='steelblue', edgecolor='black', capsize=3)
+            ax.axvline(x=0, color='black', linewidth=0.8)
+            ax.set_xlabel("Doğruluktaki Düşüş")
+            ax.set_ylabel("Özellik")
+            ax.set_title(f"Permütasyon Önemi ({trained.model_option}, test seti)")
+            ax.grid(axis='x', alpha=0.3)
+        show_chart('permutasyon_onemi', draw, params={'model': trained.model_option, 'params': trained.params},
+                   version=trained.fingerprint, figsize=(10, 6))
+        st.caption(f"Test doğruluğu {result.baseline_score:.4f}; her özellik {result.n_repeats} kez karıştırıldı.")
+
+    section()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Modelin test setindeki permütasyon önemini hesaplar.")
+    parser.add_argument('--model', choices=MODEL_OPTIONS, default=DEFAULT_MODEL_OPTION)
+    parser.add_argument('--repeats', type=int, default=N_REPEATS)
+    parser.add_argument('--workers', type=int, default=None, help="İş parçacığı sayısı (varsayılan: tüm çekirdekler)")
+    args = parser.parse_args(argv)
+
+    store = ImportanceStore(n_repeats=args.repeats, workers=args.workers)
+    result = store.result(get_trained_model(args.model), wait=True)
+    print(f"{args.model}: test doğruluğu {result.baseline_score:.4f}, {result.seconds:.2f}s")
+    for name, mean, std in result.ranking():
+        print(f"{name:<22}{mean:>9.4f} ± {std:.4f}")
+
+
+if __name__ == '__main__':
+    main()
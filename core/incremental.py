@@ -0,0 +1,332 @@
+"""
+Veri setine eklenen yeni hastalarla modellerin artımlı güncellenmesi.
+
+Tam yeniden eğitim (train_model) her güncellemede tüm geçmişi okuyup modeli baştan
+kurar. Bu modülde model, ölçekleyici ve dosyada kalınan konum artifacts/incremental/
+altında saklanır; bir sonraki çalıştırmada yalnızca dosyanın sonuna eklenen satırlar
+okunup modele katılır:
+
+- Lojistik Regresyon: log-loss ile SGDClassifier.partial_fit. Katsayılar ilk ölçeklemeye
+  göre öğrenildiğinden ölçekleyici ilk parçayla eğitildikten sonra sabitlenir; sonraki
+  parçalar yalnızca katsayıları günceller.
+- Rastgele Orman: warm_start ile her güncellemede yeni ağaçlar eklenir (en fazla
+  max_trees ağaç tutulur, en eskiler atılır). Yeni ağaçlar geçmişin sabit boyutlu
+  rastgele bir örneklemi (rezervuar) ile yeni satırlar üzerinde eğitilir. Eski ağaçların
+  eşikleri ilk ölçeklemeye göre olduğundan ölçekleyici ilk eğitimden sonra sabitlenir.
+
+Her yeni parça modele katılmadan önce puanlanır (prequential doğruluk); böylece
+ayrı bir test seti olmadan modelin yeni hastalardaki başarısı izlenir.
+
+Kullanım:
+    python -m core.incremental --model "Lojistik Regresyon"
+    python -m core.incremental --model "Rastgele Orman" --full
+"""
+import argparse
+import hashlib
+import io
+import os
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from core.data import DATA_PATH, TARGET_COLUMN
+from core.models import RANDOM_STATE, TrainedModel
+from core.preprocessing import FeatureEncoder, encoded_feature_names
+
+STATE_DIR = os.path.join('artifacts', 'incremental')
+
+# Dosya biçimi değiştiğinde artırılır; eski sürümdeki durumlar yok sayılır
+FORMAT_VERSION = 2
+
+# Artımlı güncellenebilen modeller ve dosya adları
+INCREMENTAL_MODELS = {
+    "Lojistik Regresyon": 'lojistik_regresyon_sgd',
+    "Rastgele Orman": 'rastgele_orman_warm',
+}
+
+DEFAULT_INCREMENTAL_PARAMS = {
+    "Lojistik Regresyon": {'alpha': 1e-2, 'epochs': 5, 'average': True},
+    "Rastgele Orman": {'n_estimators': 100, 'trees_per_update': 20, 'max_trees': 200,
+                       'reservoir_rows': 20_000},
+}
+
+# Yeni satırlar bu boyutta parçalar halinde okunur
+CHUNK_ROWS = 100_000
+
+# Dosyada kalınan konumun doğrulanması için konumdan önceki bu kadar bayt özetlenir
+TAIL_BYTES = 1 << 16
+
+CLASSES = np.array([0, 1])
+
+
+class IncrementalModel:
+    """
+    Artımlı güncellenen model ve ölçekleyici. partial_fit kodlanmış (ölçeklenmemiş)
+    özellik matrisini alır; sütun düzeni encoded_feature_names() ile sabittir.
+    """
+
+    def __init__(self, model_option, params=None, random_state=RANDOM_STATE):
+        if model_option not in INCREMENTAL_MODELS:
+            raise ValueError(f"Artımlı eğitim desteklenmiyor: {model_option}")
+        self.model_option = model_option
+        self.params = dict(DEFAULT_INCREMENTAL_PARAMS[model_option] if params is None else params)
+        self.random_state = random_state
+        self.feature_names = encoded_feature_names()
+        self.model = None
+        self.scaler = None
+        self.n_seen = 0
+        self.n_updates = 0
+        # Modele katılmadan önce puanlanan satırlar ve doğru tahmin sayısı
+        self.n_scored = 0
+        self.n_correct = 0
+        self._reservoir_X = None
+        self._reservoir_y = None
+        self._rng = np.random.default_rng(random_state)
+
+    @property
+    def is_forest(self):
+        return self.model_option == "Rastgele Orman"
+
+    @property
+    def prequential_accuracy(self):
+        return self.n_correct / self.n_scored if self.n_scored else float('nan')
+
+    def transform(self, X):
+        return (np.asarray(X, dtype=np.float64) - self.scaler.mean_) / self.scaler.scale_
+
+    def predict_proba(self, X):
+        return self.model.predict_proba(self.transform(X))
+
+    def partial_fit(self, X, y):
+        """Yeni satırları modele katar; model varsa satırlar önce puanlanır."""
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.int64)
+        if not len(y):
+            return self
+
+        if self.model is not None:
+            self.n_correct += int((self.model.predict(self.transform(X)) == y).sum())
+            self.n_scored += len(y)
+
+        if self.is_forest:
+            self._fit_forest(X, y)
+        else:
+            self._fit_sgd(X, y)
+        self.n_seen += len(y)
+        self.n_updates += 1
+        return self
+
+    def _fit_sgd(self, X, y):
+        from sklearn.linear_model import SGDClassifier
+        from sklearn.preprocessing import StandardScaler
+
+        if self.scaler is None:
+            self.scaler = StandardScaler().fit(X)
+        X_scaled = self.transform(X)
+
+        if self.model is None:
+            self.model = SGDClassifier(loss='log_loss', alpha=self.params['alpha'], average=self.params['average'],
+                                       random_state=self.random_state)
+        # Her parça üzerinden karıştırılarak birkaç geçiş yapılır
+        for _ in range(self.params['epochs']):
+            order = self._rng.permutation(len(y))
+            self.model.partial_fit(X_scaled[order], y[order], classes=CLASSES)
+
+    def _add_to_reservoir(self, X, y):
+        """Geçmişin her satırının rezervuarda eşit olasılıkla bulunduğu örneklem (Algoritma R)."""
+        capacity = self.params['reservoir_rows']
+        if self._reservoir_X is None:
+            self._reservoir_X = np.empty((0, X.shape[1]), dtype=np.float32)
+            self._reservoir_y = np.empty(0, dtype=np.int8)
+
+        free = max(0, capacity - len(self._reservoir_y))
+        self._reservoir_X = np.concatenate([self._reservoir_X, X[:free].astype(np.float32)])
+        self._reservoir_y = np.concatenate([self._reservoir_y, y[:free].astype(np.int8)])
+
+        # Kalan satırlar: i. satır capacity / (görülen satır sayısı) olasılıkla rastgele bir satırın yerine geçer
+        seen = self.n_seen + free + np.arange(len(y) - free) + 1
+        slots = (self._rng.random(len(seen)) * seen).astype(np.int64)
+        keep = slots < capacity
+        self._reservoir_X[slots[keep]] = X[free:][keep]
+        self._reservoir_y[slots[keep]] = y[free:][keep]
+
+    def _fit_forest(self, X, y):
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.preprocessing import StandardScaler
+
+        # Yeni ağaçlar rezervuar (geçmişin örneklemi) ve yeni satırlar üzerinde eğitilir
+        if self._reservoir_y is not None:
+            X_fit = np.concatenate([self._reservoir_X, X])
+            y_fit = np.concatenate([self._reservoir_y, y])
+        else:
+            X_fit, y_fit = X, y
+        self._add_to_reservoir(X, y)
+
+        if np.unique(y_fit).size < 2:
+            # İki sınıf da görülene kadar satırlar yalnızca rezervuarda bekletilir
+            return
+
+        if self.model is None:
+            self.scaler = StandardScaler().fit(X_fit)
+            self.model = RandomForestClassifier(
+                n_estimators=self.params['n_estimators'], warm_start=True, random_state=self.random_state)
+        else:
+            # warm_start yalnızca eklenen ağaçları eğitir; her güncellemede farklı tohum kullanılır
+            self.model.n_estimators = len(self.model.estimators_) + self.params['trees_per_update']
+            self.model.random_state = self.random_state + self.n_updates
+        self.model.fit(self.transform(X_fit), y_fit)
+
+        excess = len(self.model.estimators_) - self.params['max_trees']
+        if excess > 0:
+            del self.model.estimators_[:excess]
+            self.model.n_estimators = len(self.model.estimators_)
+
+    def to_trained(self, fingerprint=None, metrics=None):
+        """Sayfaların ve servisin kullandığı TrainedModel biçiminde model."""
+        if self.model is None:
+            raise ValueError("Model henüz eğitilmedi")
+        metrics = dict(metrics or {})
+        metrics.setdefault('prequential_accuracy', self.prequential_accuracy)
+        metrics.setdefault('n_train', self.n_seen)
+        return TrainedModel(f"{self.model_option} (artımlı)", dict(self.params), fingerprint, self.model,
+                            self.scaler, self.feature_names, metrics)
+
+
+# --- Veri dosyasından güncelleme -------------------------------------------------------
+
+class _RangeReader(io.RawIOBase):
+    """Açık bir dosyayı yalnızca end baytına kadar okutur (sonradan eklenen yarım satırlar okunmaz)."""
+
+    def __init__(self, f, end):
+        self._f = f
+        self._end = end
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = min(len(buffer), self._end - self._f.tell())
+        if size <= 0:
+            return 0
+        data = self._f.read(size)
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def _tail_hash(f, offset):
+    start = max(0, offset - TAIL_BYTES)
+    f.seek(start)
+    return hashlib.sha256(f.read(offset - start)).hexdigest()
+
+
+def _complete_end(f, size):
+    """Dosyadaki son tam satırın bittiği konum."""
+    position = size
+    while position > 0:
+        start = max(0, position - TAIL_BYTES)
+        f.seek(start)
+        block = f.read(position - start)
+        newline = block.rfind(b'\n')
+        if newline >= 0:
+            return start + newline + 1
+        position = start
+    return 0
+
+
+def iter_chunks(path, offset=0, end=None, chunk_rows=CHUNK_ROWS):
+    """
+    (kodlanmış X, y) parçaları; offset > 0 ise dosyanın başlığından sonra o konumdan
+    başlanır. Sütun düzeni encoded_feature_names() ile aynıdır.
+    """
+    encoder = FeatureEncoder(encoded_feature_names())
+    with open(path, 'rb') as f:
+        header = pd.read_csv(f, nrows=0).columns.tolist()
+        if end is None:
+            end = _complete_end(f, os.fstat(f.fileno()).st_size)
+        if offset == 0:
+            f.seek(0)
+            f.readline()
+            offset = f.tell()
+        f.seek(offset)
+        reader = io.BufferedReader(_RangeReader(f, end))
+        for chunk in pd.read_csv(reader, names=header, header=None, chunksize=chunk_rows):
+            yield encoder.encode_batch(chunk), chunk[TARGET_COLUMN].to_numpy()
+
+
+def _state_path(model_option, state_dir):
+    return os.path.join(state_dir, f"{INCREMENTAL_MODELS[model_option]}.joblib")
+
+
+def load_incremental(model_option, state_dir=STATE_DIR):
+    try:
+        payload = joblib.load(_state_path(model_option, state_dir))
+    except (OSError, EOFError, ValueError):
+        return None
+    return payload if payload.get('format_version') == FORMAT_VERSION else None
+
+
+def _save(payload, model_option, state_dir):
+    os.makedirs(state_dir, exist_ok=True)
+    path = _state_path(model_option, state_dir)
+    joblib.dump(payload, path + '.tmp')
+    os.replace(path + '.tmp', path)
+
+
+def update(model_option, path=DATA_PATH, state_dir=STATE_DIR, params=None, full=False, log=print):
+    """
+    Modeli dosyadaki yeni satırlarla günceller. Durum yoksa, dosya başka bir dosyaysa ya
+    da kalınan konumdan önceki içerik değiştiyse (satır silindi/düzenlendi) veya full
+    verilirse model tüm dosya üzerinden parça parça baştan eğitilir.
+    """
+    payload = None if full else load_incremental(model_option, state_dir)
+    if payload is not None and (payload['path'] != os.path.abspath(path)
+                                or (params is not None and payload['model'].params != params)):
+        payload = None
+
+    with open(path, 'rb') as f:
+        end = _complete_end(f, os.fstat(f.fileno()).st_size)
+        if payload is not None and (end < payload['offset'] or _tail_hash(f, payload['offset']) != payload['tail_hash']):
+            log("Dosyanın daha önce okunan kısmı değişmiş, model baştan eğitiliyor")
+            payload = None
+
+    if payload is None:
+        model, offset = IncrementalModel(model_option, params), 0
+    else:
+        model, offset = payload['model'], payload['offset']
+        if offset >= end:
+            log(f"{model_option}: yeni satır yok, model güncel ({model.n_seen} satır)")
+            return model
+
+    start = time.perf_counter()
+    rows = 0
+    for X, y in iter_chunks(path, offset, end):
+        model.partial_fit(X, y)
+        rows += len(y)
+    log(f"{model_option}: {rows} satır {'eklendi' if offset else 'ile eğitildi'} "
+        f"({time.perf_counter() - start:.2f}s, toplam {model.n_seen} satır, "
+        f"prequential doğruluk {model.prequential_accuracy:.4f})")
+
+    with open(path, 'rb') as f:
+        tail_hash = _tail_hash(f, end)
+    _save({'format_version': FORMAT_VERSION, 'path': os.path.abspath(path), 'offset': end,
+           'tail_hash': tail_hash, 'model': model}, model_option, state_dir)
+    return model
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Modelleri veri setine eklenen satırlarla artımlı günceller.")
+    parser.add_argument('--model', action='append', choices=list(INCREMENTAL_MODELS),
+                        help="Güncellenecek model (birden fazla verilebilir, varsayılan: hepsi)")
+    parser.add_argument('--data', default=DATA_PATH, help="Eğitim verisi (CSV)")
+    parser.add_argument('--state-dir', default=STATE_DIR, help="Model durumlarının saklandığı klasör")
+    parser.add_argument('--full', action='store_true', help="Kaydedilmiş durumu yok sayıp baştan eğit")
+    args = parser.parse_args(argv)
+
+    for model_option in args.model or INCREMENTAL_MODELS:
+        update(model_option, args.data, args.state_dir, full=args.full)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+"""
+Ağır kütüphanelerin ilk kullanımda içe aktarılması.
+
+Sayfalar seaborn gibi modülleri üst düzeyde `sns = lazy_import('seaborn')` ile tanımlar;
+modül yalnızca bir özniteliğine ilk erişildiğinde (ör. önbellekte olmayan bir grafik
+çizilirken) içe aktarılır. İçe aktarma importlib'in kilitleri altında yapıldığından
+aynı anda çalışan oturumlar için güvenlidir.
+"""
+import importlib
+import sys
+
+
+class LazyModule:
+    """Öznitelik erişiminde asıl modülü içe aktaran vekil."""
+
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, attr):
+        return getattr(importlib.import_module(self._name), attr)
+
+    def __repr__(self):
+        state = 'yüklü' if self._name in sys.modules else 'yüklenmedi'
+        return f"<LazyModule {self._name!r} ({state})>"
+
+
+def lazy_import(name):
+    """Modül zaten yüklüyse kendisini, değilse ilk kullanımda yüklenecek bir vekili döndürür."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
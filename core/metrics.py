@@ -0,0 +1,204 @@
+"""
+Tahmin hattının aşama süreleri.
+
+Her aşama (CSV yükleme, ön işleme, eğitim/test bölme, ölçekleme, eğitim, değerlendirme,
+grafik çizimi, predict_proba) bir zamanlayıcıyla sarılır:
+
+    with metrics.timer('scaling'):
+        ...
+
+ya da bütün bir fonksiyon için @metrics.timed('load_data'). Ölçüm kapalıyken zamanlayıcı
+paylaşılan boş bir bağlam yöneticisidir (saat okunmaz, kilit alınmaz).
+
+Süreler aşama başına Prometheus histogramlarında (kova sayıları, toplam, adet) ve son
+RECENT_LIMIT ölçümlük bir listede tutulur. prometheus() Prometheus metin biçimini döndürür;
+path verilmişse aynı metin en fazla WRITE_INTERVAL saniyede bir (ve süreç kapanırken) bu
+dosyaya yazılır. Servis aynı metni GET /metrics ile sunar.
+
+Süreç geneli nesne PIPELINE_METRICS=1 ya da PIPELINE_METRICS_PATH=<dosya> ortam
+değişkenleriyle açılır; oturumlar ölçümü açıp kapatamaz. Tahmin sayfasındaki salt okunur
+yönetici paneli yalnızca PIPELINE_METRICS_PANEL=1 verildiğinde gösterilir.
+"""
+import atexit
+import functools
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+
+# Ölçülen aşamalar (Prometheus 'stage' etiketi)
+STAGES = ['load_data', 'preprocess_data', 'train_test_split', 'scaling', 'train_model', 'evaluation',
+          'figure_render', 'predict_proba']
+
+# Histogram kova üst sınırları (saniye); tek satırlık tahminden model eğitimine kadar
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+RECENT_LIMIT = 500
+WRITE_INTERVAL = 5.0
+
+METRIC_NAME = 'pipeline_stage_seconds'
+
+_DISABLED = nullcontext()
+
+
+class Histogram:
+    """Birikimli olmayan kova sayıları, toplam süre ve adet."""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # son kova +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds):
+        i = 0
+        while i < len(self.buckets) and seconds > self.buckets[i]:
+            i += 1
+        self.counts[i] += 1
+        self.sum += seconds
+        self.count += 1
+
+
+class _Timer:
+    __slots__ = ('metrics', 'stage', 'start')
+
+    def __init__(self, metrics, stage):
+        self.metrics = metrics
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.observe(self.stage, time.perf_counter() - self.start)
+        return False
+
+
+class StageMetrics:
+    """Aşama başına süre histogramları ve son ölçümler."""
+
+    def __init__(self, enabled=False, path=None, buckets=BUCKETS):
+        self.enabled = enabled
+        self.path = path
+        self.buckets = buckets
+        self._histograms = {}
+        self._recent = deque(maxlen=RECENT_LIMIT)  # (zaman, aşama, saniye)
+        self._lock = threading.Lock()
+        self._last_write = 0.0
+
+    def timer(self, stage):
+        """Bloğun süresini stage aşamasına ekleyen bağlam yöneticisi."""
+        if not self.enabled:
+            return _DISABLED
+        return _Timer(self, stage)
+
+    def timed(self, stage):
+        """Fonksiyonun her çağrısını stage aşaması olarak ölçen dekoratör."""
+        def decorate(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Timer(self, stage):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def observe(self, stage, seconds):
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = Histogram(self.buckets)
+            histogram.observe(seconds)
+            self._recent.append((time.time(), stage, seconds))
+            write = self.path is not None and time.monotonic() - self._last_write >= WRITE_INTERVAL
+            if write:
+                self._last_write = time.monotonic()
+        if write:
+            self.write()
+
+    def recent(self, limit=None):
+        """Son ölçümler (en yenisi sonda) [(zaman, aşama, saniye), ...]."""
+        with self._lock:
+            items = list(self._recent)
+        return items if limit is None else items[-limit:]
+
+    def summary(self):
+        """Aşama başına adet, toplam ve ortalama süre ile son ölçümlerin ortanca ve %95 değeri."""
+        import numpy as np
+
+        with self._lock:
+            totals = {stage: (h.count, h.sum) for stage, h in self._histograms.items()}
+            recent = list(self._recent)
+        rows = []
+        for stage in sorted(totals, key=lambda s: STAGES.index(s) if s in STAGES else len(STAGES)):
+            count, total = totals[stage]
+            seconds = np.array([s for _, name, s in recent if name == stage])
+            rows.append({
+                'stage': stage,
+                'count': count,
+                'total_s': total,
+                'mean_ms': 1000 * total / count,
+                'p50_ms': 1000 * float(np.percentile(seconds, 50)) if len(seconds) else float('nan'),
+                'p95_ms': 1000 * float(np.percentile(seconds, 95)) if len(seconds) else float('nan'),
+            })
+        return rows
+
+    def prometheus(self):
+        """Histogramların Prometheus metin biçimi (exposition format 0.0.4)."""
+        with self._lock:
+            histograms = {stage: (list(h.counts), h.sum, h.count) for stage, h in self._histograms.items()}
+        lines = [
+            f"# HELP {METRIC_NAME} Tahmin hattı aşamalarının süresi (saniye).",
+            f"# TYPE {METRIC_NAME} histogram",
+        ]
+        for stage in sorted(histograms):
+            counts, total, count = histograms[stage]
+            cumulative = 0
+            for bound, n in zip([*self.buckets, '+Inf'], counts):
+                cumulative += n
+                le = bound if isinstance(bound, str) else repr(float(bound))
+                lines.append(f'{METRIC_NAME}_bucket{{stage="{stage}",le="{le}"}} {cumulative}')
+            lines.append(f'{METRIC_NAME}_sum{{stage="{stage}"}} {total!r}')
+            lines.append(f'{METRIC_NAME}_count{{stage="{stage}"}} {count}')
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path=None):
+        """Prometheus metnini dosyaya yazar (node_exporter textfile toplayıcısı için)."""
+        path = path or self.path
+        if path is None:
+            return
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Toplayıcının yarım yazılmış dosyayı okumaması için önce geçici dosyaya yazılır
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.prometheus())
+        os.replace(tmp_path, path)
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._recent.clear()
+
+
+def _flag(name):
+    return os.environ.get(name, '') not in ('', '0')
+
+
+# Tahmin sayfasında aşama süreleri panelinin gösterilip gösterilmeyeceği
+ADMIN_PANEL = _flag('PIPELINE_METRICS_PANEL')
+
+
+def _from_environment():
+    path = os.environ.get('PIPELINE_METRICS_PATH') or None
+    enabled = path is not None or _flag('PIPELINE_METRICS')
+    return StageMetrics(enabled=enabled, path=path)
+
+
+# Süreç geneli ölçümler; tüm oturumlar ve servis istekleri paylaşır
+metrics = _from_environment()
+atexit.register(metrics.write)
@@ -0,0 +1,366 @@
+import os
+import threading
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+# scikit-learn modülleri yalnızca eğitim/değerlendirme yapan fonksiyonlarda içe aktarılır;
+# modeli hazır olan (veya hiç model kullanmayan) sayfalar açılışta bu maliyeti ödemez.
+from core import forest
+from core.data import DATA_PATH, TARGET_COLUMN, data_fingerprint, load_data
+from core.metrics import metrics as stage_metrics
+from core.preprocessing import (RAW_FEATURES, FeatureEncoder, categorical_feature_names, category_columns,
+                                 encoded_feature_names, preprocess_data)
+
+# Uygulamadaki model seçenekleri
+MODEL_OPTIONS = ["Lojistik Regresyon", "Rastgele Orman", "Destek Vektör Makinesi", "Histogram Gradyan Artırma"]
+
+# Komut satırı araçlarında ve serviste model belirtilmezse kullanılan model
+DEFAULT_MODEL_OPTION = "Rastgele Orman"
+
+# Test veri seti boyutu ve random state değerleri
+TEST_SIZE = 0.20
+RANDOM_STATE = 40
+
+# Modellerin varsayılan hiperparametreleri. 'calibration' verilen modeller
+# olasılık üretmeden eğitilir ve ayrılan bir veri parçası üzerinde kalibre edilir.
+DEFAULT_PARAMS = {
+    "Lojistik Regresyon": {'max_iter': 1000},
+    "Rastgele Orman": {'n_estimators': 100},
+    "Destek Vektör Makinesi": {'calibration': 'sigmoid'},
+    "Histogram Gradyan Artırma": {'max_iter': 100},
+}
+
+# Kategorik özellikleri one-hot grupları yerine kod sütunu olarak alan modeller
+# (girdi düzeni categorical_feature_names; kod sütunları ölçeklenmez)
+CATEGORICAL_MODELS = ("Histogram Gradyan Artırma",)
+
+# Kalibrasyon için eğitim setinden ayrılan oran
+CALIBRATION_SIZE = 0.20
+
+
+def _split_calibration(params):
+    """Hiperparametreleri tahminci ve kalibrasyon ayarları olarak ayırır."""
+    estimator_params = dict(params)
+    calibration = estimator_params.pop('calibration', None)
+    calibration_size = estimator_params.pop('calibration_size', CALIBRATION_SIZE)
+    return estimator_params, calibration, calibration_size
+
+
+def model_feature_names(model_option, feature_names=None):
+    """
+    Modelin girdi sütunları: feature_names one-hot düzenidir (verilmezse
+    encoded_feature_names()); CATEGORICAL_MODELS için one-hot grupları kod sütunlarına iner.
+    """
+    if model_option in CATEGORICAL_MODELS:
+        return categorical_feature_names(feature_names)
+    return list(feature_names) if feature_names is not None else encoded_feature_names()
+
+
+def pass_codes(scaler, feature_names):
+    """Eğitilmiş ölçekleyicide kategori kodu sütunlarını ölçeklenmeden geçecek şekilde ayarlar."""
+    codes = category_columns(feature_names)
+    if codes:
+        scaler.mean_[codes] = 0.0
+        scaler.var_[codes] = 1.0
+        scaler.scale_[codes] = 1.0
+    return scaler
+
+
+def fit_scaler(X_train, feature_names):
+    """Eğitim verisiyle StandardScaler; kategori kodu sütunları olduğu gibi kalır."""
+    from sklearn.preprocessing import StandardScaler
+
+    return pass_codes(StandardScaler().fit(X_train), feature_names)
+
+
+def build_model(model_option, params=None, random_state=RANDOM_STATE, feature_names=None):
+    """
+    Seçilen model için eğitilmemiş bir tahminci oluşturur. feature_names, kategorik
+    özellikleri kod sütunlarından tanıyan modeller (gradyan artırma) içindir.
+    """
+    if params is None:
+        params = DEFAULT_PARAMS[model_option]
+    params, _, _ = _split_calibration(params)
+
+    if model_option == "Lojistik Regresyon":
+        from sklearn.linear_model import LogisticRegression
+        return LogisticRegression(random_state=random_state, **params)
+    elif model_option == "Rastgele Orman":
+        from sklearn.ensemble import RandomForestClassifier
+        return RandomForestClassifier(random_state=random_state, **params)
+    elif model_option == "Destek Vektör Makinesi":
+        from sklearn.svm import SVC
+        return SVC(random_state=random_state, **params)
+    elif model_option == "Histogram Gradyan Artırma":
+        from core.boosting import CategoricalHistGradientBoosting
+        return CategoricalHistGradientBoosting(feature_names=feature_names, random_state=random_state, **params)
+
+    raise ValueError(f"Bilinmeyen model: {model_option}")
+
+
+def calibrate_model(model, X_cal, y_cal, method='sigmoid'):
+    """
+    Eğitilmiş bir modelin olasılıklarını ayrı bir veri parçası üzerinde kalibre eder.
+    Model yeniden eğitilmez; farklı bir yöntemle tekrar kalibre etmek için de kullanılabilir.
+    """
+    from sklearn.calibration import CalibratedClassifierCV
+
+    try:
+        from sklearn.frozen import FrozenEstimator
+    except ImportError:  # scikit-learn < 1.6
+        FrozenEstimator = None
+
+    if FrozenEstimator is not None:
+        calibrated = CalibratedClassifierCV(FrozenEstimator(model), method=method)
+    else:
+        calibrated = CalibratedClassifierCV(model, method=method, cv='prefit')
+    return calibrated.fit(X_cal, y_cal)
+
+
+# Model seçimi ve eğitimi
+@stage_metrics.timed('train_model')
+def train_model(model_option, X_train, y_train, params=None, random_state=RANDOM_STATE, feature_names=None):
+    if params is None:
+        params = DEFAULT_PARAMS[model_option]
+    _, calibration, calibration_size = _split_calibration(params)
+
+    model = build_model(model_option, params, random_state, feature_names)
+    if calibration is None:
+        model.fit(X_train, y_train)
+        return model
+
+    from sklearn.model_selection import train_test_split
+
+    # Kalibrasyon parçası modelin eğitiminde kullanılmaz
+    X_fit, X_cal, y_fit, y_cal = train_test_split(
+        X_train, y_train, test_size=calibration_size, random_state=random_state, stratify=y_train)
+    model.fit(X_fit, y_fit)
+    return calibrate_model(model, X_cal, y_cal, calibration)
+
+
+@dataclass
+class DatasetSplit:
+    """Ön işlenmiş veri setinin eğitim/test bölünmesi."""
+    X_train: pd.DataFrame
+    X_test: pd.DataFrame
+    y_train: pd.Series
+    y_test: pd.Series
+    feature_names: list
+    fingerprint: str
+    # Aynı satırların ham özellikleri (RAW_FEATURES); one-hot dışı düzenler bunlardan kodlanır
+    raw_train: pd.DataFrame = None
+    raw_test: pd.DataFrame = None
+
+
+_split_cache = {}
+_split_lock = threading.Lock()
+
+
+def load_split(path=DATA_PATH):
+    """
+    Veri setini okuyup ön işler ve eğitim/test olarak böler.
+    Sonuç, dosyanın içerik özeti değişmedikçe yeniden hesaplanmaz.
+    """
+    fingerprint = data_fingerprint(path)
+
+    with _split_lock:
+        split = _split_cache.get(path)
+        if split is not None and split.fingerprint == fingerprint:
+            return split
+
+        from sklearn.model_selection import train_test_split
+
+        df = load_data(path)
+        df_processed = preprocess_data(df, is_training=True)
+
+        # Bağımsız değişkenler ve hedef değişken
+        X = df_processed.drop(TARGET_COLUMN, axis=1)
+        y = df_processed[TARGET_COLUMN]
+
+        with stage_metrics.timer('train_test_split'):
+            X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=TEST_SIZE, random_state=RANDOM_STATE)
+
+        raw = df[RAW_FEATURES]
+        split = DatasetSplit(X_train, X_test, y_train, y_test, X.columns.tolist(), fingerprint,
+                             raw.loc[X_train.index], raw.loc[X_test.index])
+        _split_cache[path] = split
+        return split
+
+
+@dataclass
+class TrainedModel:
+    """Eğitilmiş model, ona ait ölçekleyici ve test metrikleri."""
+    model_option: str
+    params: dict
+    fingerprint: str
+    model: object
+    scaler: object  # eğitilmiş sklearn StandardScaler
+    feature_names: list
+    metrics: dict = field(default_factory=dict)
+    encoder: FeatureEncoder = None
+
+    def __post_init__(self):
+        if self.encoder is None:
+            self.encoder = FeatureEncoder(self.feature_names)
+
+    def transform(self, X):
+        # StandardScaler.transform ile aynı işlem, scikit-learn'ün girdi doğrulaması olmadan
+        return (np.asarray(X, dtype=np.float64) - self.scaler.mean_) / self.scaler.scale_
+
+    def encode(self, records):
+        """Ham kayıtları ölçeklenmiş model girdisine dönüştürür."""
+        return self.transform(self.encoder.encode_batch(records))
+
+    @stage_metrics.timed('predict_proba')
+    def predict_proba(self, X_scaled):
+        return forest.predict_proba(self.model, X_scaled)
+
+
+@stage_metrics.timed('evaluation')
+def evaluate_model(model, X_test_scaled, y_test):
+    """
+    Test seti üzerinde doğruluk, karmaşıklık matrisi ve sınıflandırma raporunu hesaplar.
+    """
+    from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
+
+    y_pred = model.predict(X_test_scaled)
+    return {
+        'accuracy': accuracy_score(y_test, y_pred),
+        'confusion_matrix': confusion_matrix(y_test, y_pred),
+        'classification_report': classification_report(y_test, y_pred, output_dict=True),
+    }
+
+
+def fit_trained_model(model_option, params=None, path=DATA_PATH):
+    """
+    Ölçekleyiciyi ve seçilen modeli eğitir, test metrikleriyle birlikte döndürür.
+    """
+    if params is None:
+        params = DEFAULT_PARAMS[model_option]
+
+    split = load_split(path)
+    feature_names = model_feature_names(model_option, split.feature_names)
+    if feature_names == split.feature_names:
+        X_train, X_test = split.X_train, split.X_test
+    else:
+        # Kategorik modeller: kodlar ham özelliklerden alınır, one-hot matrisi kurulmaz
+        encoder = FeatureEncoder(feature_names)
+        X_train, X_test = encoder.encode_batch(split.raw_train), encoder.encode_batch(split.raw_test)
+
+    # Veri ölçeklendirme
+    with stage_metrics.timer('scaling'):
+        scaler = fit_scaler(X_train, feature_names)
+        X_train_scaled = scaler.transform(X_train)
+        X_test_scaled = scaler.transform(X_test)
+
+    model = train_model(model_option, X_train_scaled, split.y_train, params, feature_names=feature_names)
+
+    metrics = evaluate_model(model, X_test_scaled, split.y_test)
+    metrics['n_train'] = len(split.y_train)
+    metrics['n_test'] = len(split.y_test)
+
+    return TrainedModel(model_option, dict(params), split.fingerprint, model, scaler, feature_names, metrics)
+
+
+def params_key(params):
+    return tuple(sorted(params.items()))
+
+
+class ModelRegistry:
+    """
+    Eğitilmiş modelleri süreç genelinde (tüm oturumlar için) saklar.
+
+    Anahtar (model seçeneği, hiperparametreler, veri özeti, model dosyasının damgası)
+    dörtlüsüdür. Her anahtar için model yalnızca bir kez hazırlanır; aynı anda gelen
+    istekler aynı işlemi bekler. Veri özeti uyan bir model dosyası varsa eğitim yapılmadan
+    yüklenir. Veri dosyası değiştiğinde eski özete ait modeller atılır; model dosyası
+    (ör. python -m core.train ile) yeniden yazıldığında damgası (mtime, boyut) değişir ve
+    model bir sonraki istekte dosyadan yeniden yüklenir.
+    """
+
+    def __init__(self, path=DATA_PATH, artifact_dir='artifacts'):
+        self.path = path
+        self.artifact_dir = artifact_dir
+        self._models = {}
+        self._key_locks = {}
+        self._lock = threading.Lock()
+        self._fingerprint = None
+
+    def get(self, model_option, params=None):
+        if params is None:
+            params = DEFAULT_PARAMS[model_option]
+
+        fingerprint = data_fingerprint(self.path)
+        self._drop_stale(fingerprint)
+        key = (model_option, params_key(params), fingerprint, self._artifact_stamp(model_option))
+
+        with self._lock:
+            trained = self._models.get(key)
+            if trained is not None:
+                return trained
+            # Aynı model için eski dosya damgasına ait girdiler atılır
+            for stale in [k for k in self._models if k[:3] == key[:3]]:
+                del self._models[stale]
+            for stale in [k for k in self._key_locks if k[:3] == key[:3] and k != key]:
+                del self._key_locks[stale]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                trained = self._models.get(key)
+            if trained is None:
+                trained = self._build(model_option, params, fingerprint)
+                with self._lock:
+                    self._models[key] = trained
+        return trained
+
+    def _artifact_stamp(self, model_option):
+        """Model dosyasının (mtime, boyut) damgası; dosya yoksa None."""
+        if self.artifact_dir is None:
+            return None
+        # core.artifacts bu modülü içe aktardığı için burada yüklenir
+        from core.artifacts import artifact_path
+
+        try:
+            stat = os.stat(artifact_path(model_option, self.artifact_dir))
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _build(self, model_option, params, fingerprint):
+        # core.artifacts bu modülü içe aktardığı için burada yüklenir
+        from core.artifacts import load_artifact
+
+        trained = None
+        if self.artifact_dir is not None:
+            trained = load_artifact(model_option, fingerprint, params, self.artifact_dir)
+        if trained is None:
+            trained = fit_trained_model(model_option, params, self.path)
+        return trained
+
+    def invalidate(self):
+        """Tüm modelleri atar; bir sonraki istekte yeniden eğitilirler."""
+        with self._lock:
+            self._models.clear()
+            self._key_locks.clear()
+            self._fingerprint = None
+
+    def _drop_stale(self, fingerprint):
+        with self._lock:
+            if fingerprint == self._fingerprint:
+                return
+            for key in [k for k in self._models if k[2] != fingerprint]:
+                del self._models[key]
+            for key in [k for k in self._key_locks if k[2] != fingerprint]:
+                del self._key_locks[key]
+            self._fingerprint = fingerprint
+
+
+# Süreç genelindeki model kayıt defteri
+registry = ModelRegistry()
+
+
+def get_trained_model(model_option, params=None):
+    return registry.get(model_option, params)
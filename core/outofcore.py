@@ -0,0 +1,338 @@
+"""
+Belleğe sığmayan veri setleri için eğitim.
+
+Sayfalardaki yol (load_data -> preprocess_data -> train_test_split -> StandardScaler)
+aynı anda verinin birkaç tam kopyasını float64 olarak bellekte tutar. Bu modülde CSV
+parça parça okunur ve her parça FeatureEncoder ile doğrudan diskteki float32 .npy
+matrislerine yazılır; bellekte aynı anda yalnızca bir parça bulunur:
+
+1. Satırlar sayılır ve eğitim/test dosyaları (X_train, X_test, y_train, y_test)
+   son boyutlarıyla ayrılır.
+2. CSV parça parça kodlanıp dosyalara yazılır; ölçekleyici eğitim satırlarıyla
+   StandardScaler.partial_fit ile güncellenir.
+3. Matrisler parça parça yerinde ölçeklenir; böylece model, sayfalardaki gibi
+   TrainedModel.transform ile ölçeklenmiş girdiyle çalışır.
+
+Parçalar dosyadan okunup yazılır (belleğe eşlenmez); dokunulan sayfalar sürecin
+belleğinde birikmez, yalnızca işletim sisteminin dosya önbelleğinde kalır.
+
+Modeller:
+- Lojistik Regresyon: log-loss ile SGDClassifier, eğitim matrisi üzerinden parça parça
+  birkaç geçiş (bellek kullanımı veri boyutundan bağımsızdır).
+- Histogram Gradyan Artırma: uygulamadaki model (core.boosting). Matrisler bu model
+  için one-hot grupları yerine ölçeklenmemiş kategori kodu sütunlarıyla ayrıca yazılır.
+  HistGradientBoostingClassifier tüm eğitim matrisini float64 olarak ister (satır başına
+  8 x 11 bayt); matris parça parça bu diziye okunur, float32 dosya ve float64 kopya aynı
+  anda bellekte tutulmaz. Sütunlar 1 baytlık kutulara bölünerek eğitilir.
+
+Kodlanmış matrisler veri dosyasının içerik özetine göre cache/outofcore/ altında
+saklanır; aynı dosya ile ikinci eğitim CSV'yi yeniden okumaz.
+
+Kullanım:
+    python -m core.outofcore --data kayitlar.csv --model "Lojistik Regresyon"
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from core.data import DATA_PATH, TARGET_COLUMN, data_fingerprint
+from core.models import RANDOM_STATE, TEST_SIZE, TrainedModel, build_model, model_feature_names, pass_codes
+from core.preprocessing import FeatureEncoder, encoded_feature_names
+
+CACHE_DIR = os.path.join('cache', 'outofcore')
+OUTPUT_DIR = os.path.join('artifacts', 'outofcore')
+
+# CSV bu boyutta parçalar halinde okunur (en fazla 18 sütun x 4 bayt ~ 14 MB)
+CHUNK_ROWS = 200_000
+
+# Parça parça eğitilebilen modeller ve dosya adları
+OUT_OF_CORE_MODELS = {
+    "Lojistik Regresyon": 'lojistik_regresyon_sgd',
+    "Histogram Gradyan Artırma": 'histogram_gradyan_artirma',
+}
+
+DEFAULT_OUT_OF_CORE_PARAMS = {
+    "Lojistik Regresyon": {'alpha': 1e-4, 'epochs': 3, 'average': True},
+    "Histogram Gradyan Artırma": {'max_iter': 100, 'early_stopping': False},
+}
+
+
+def peak_rss_mb():
+    """Sürecin şimdiye kadarki en yüksek yerleşik belleği (MB); ölçülemiyorsa None."""
+    try:
+        import resource
+    except ImportError:
+        # resource modülü yalnızca Unix'te var; Windows'ta psutil (kuruluysa) kullanılır
+        try:
+            import psutil
+        except ImportError:
+            return None
+        info = psutil.Process().memory_info()
+        return getattr(info, 'peak_wset', info.rss) / (1 << 20)
+    # ru_maxrss Linux'ta KB, macOS'ta bayt cinsindendir
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / (1 << 20) if sys.platform == 'darwin' else max_rss / 1024
+
+
+def count_rows(path):
+    """Başlık hariç satır sayısı; dosya ayrıştırılmadan satır sonları sayılır."""
+    lines, last = 0, b'\n'
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 24), b''):
+            lines += block.count(b'\n')
+            last = block[-1:]
+    return lines - 1 + (last != b'\n')
+
+
+def _create_npy(path, dtype, shape):
+    """Boş bir .npy dosyası oluşturur ve verinin başladığı bayt konumunu döndürür."""
+    dtype = np.dtype(dtype)
+    with open(path, 'wb') as f:
+        np.lib.format.write_array_header_1_0(
+            f, {'descr': np.lib.format.dtype_to_descr(dtype), 'fortran_order': False, 'shape': shape})
+        offset = f.tell()
+        f.truncate(offset + int(np.prod(shape)) * dtype.itemsize)
+    return offset
+
+
+def _skip_npy_header(f):
+    """Açık bir .npy dosyasında başlığı okuyup verinin başına gelir; dizinin boyutunu döndürür."""
+    np.lib.format.read_magic(f)
+    shape, _, _ = np.lib.format.read_array_header_1_0(f)
+    return shape
+
+
+def _test_masks(n_rows, chunk_rows, test_size, random_state):
+    """Parça başına test satırı maskeleri; parça boyutundan bağımsız olarak aynı satırlar seçilir."""
+    rng = np.random.default_rng(random_state)
+    for start in range(0, n_rows, chunk_rows):
+        yield rng.random(min(chunk_rows, n_rows - start)) < test_size
+
+
+class EncodedDataset:
+    """
+    Diskte, ölçeklenmiş float32 olarak tutulan eğitim/test matrisleri. Parçalar belleğe
+    eşlenmeden dosyadan okunur; okunan sayfalar sürecin belleğinde birikmez.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, 'meta.json'), encoding='utf-8') as f:
+            self.meta = json.load(f)
+        self.feature_names = self.meta['feature_names']
+        self.scaler = joblib.load(os.path.join(directory, 'scaler.joblib'))
+
+    def _path(self, name):
+        return os.path.join(self.directory, f"{name}.npy")
+
+    def array(self, name):
+        """Dosyanın salt okunur bellek eşlemesi."""
+        return np.load(self._path(name), mmap_mode='r')
+
+    def chunks(self, part, chunk_rows=CHUNK_ROWS):
+        """(X, y) parçaları; X ölçeklenmiş float32, y int8."""
+        with open(self._path(f"X_{part}"), 'rb') as f_X, open(self._path(f"y_{part}"), 'rb') as f_y:
+            n_rows, n_columns = _skip_npy_header(f_X)
+            _skip_npy_header(f_y)
+            for start in range(0, n_rows, chunk_rows):
+                rows = min(chunk_rows, n_rows - start)
+                X = np.fromfile(f_X, dtype=np.float32, count=rows * n_columns).reshape(rows, n_columns)
+                yield X, np.fromfile(f_y, dtype=np.int8, count=rows)
+
+    def load(self, part, dtype=np.float32):
+        """Matrisi parça parça tek bir diziye okur (float64 istenirse dönüşüm parça başına yapılır)."""
+        n_rows = self.meta['rows'] - self.meta['test_rows'] if part == 'train' else self.meta['test_rows']
+        X = np.empty((n_rows, len(self.feature_names)), dtype=dtype)
+        y = np.empty(n_rows, dtype=np.int8)
+        start = 0
+        for X_chunk, y_chunk in self.chunks(part):
+            X[start:start + len(y_chunk)] = X_chunk
+            y[start:start + len(y_chunk)] = y_chunk
+            start += len(y_chunk)
+        return X, y
+
+
+def encode_dataset(path=DATA_PATH, directory=CACHE_DIR, chunk_rows=CHUNK_ROWS,
+                   test_size=TEST_SIZE, random_state=RANDOM_STATE, feature_names=None):
+    """
+    CSV'yi parça parça kodlayıp ölçeklenmiş float32 eğitim/test matrislerine yazar.
+    feature_names sütun düzenidir (verilmezse encoded_feature_names()); kategori kodu
+    sütunları ölçeklenmez. Dosyanın içerik özeti ve düzeni aynı olan bir kopya varsa
+    yeniden oluşturulmaz.
+    """
+    from sklearn.preprocessing import StandardScaler
+
+    if feature_names is None:
+        feature_names = encoded_feature_names()
+    fingerprint = data_fingerprint(path)
+    name = os.path.splitext(os.path.basename(path))[0]
+    if feature_names != encoded_feature_names():
+        layout = hashlib.sha256(json.dumps(feature_names).encode('utf-8')).hexdigest()[:8]
+        name = f"{name}-{layout}"
+    target = os.path.join(directory, f"{name}-{fingerprint[:16]}")
+    if os.path.exists(os.path.join(target, 'meta.json')):
+        return EncodedDataset(target)
+
+    n_columns = len(feature_names)
+    encoder = FeatureEncoder(feature_names)
+    n_rows = count_rows(path)
+    n_test = int(sum(mask.sum() for mask in _test_masks(n_rows, chunk_rows, test_size, random_state)))
+    sizes = {'train': n_rows - n_test, 'test': n_test}
+
+    tmp_target = f"{target}.tmp{os.getpid()}"
+    os.makedirs(tmp_target, exist_ok=True)
+    files, offsets = {}, {}
+    for part, rows in sizes.items():
+        for array_name, dtype, shape in ((f"X_{part}", np.float32, (rows, n_columns)), (f"y_{part}", np.int8, (rows,))):
+            array_path = os.path.join(tmp_target, f"{array_name}.npy")
+            offsets[array_name] = _create_npy(array_path, dtype, shape)
+            files[array_name] = open(array_path, 'r+b')
+            files[array_name].seek(offsets[array_name])
+
+    try:
+        # 1. geçiş: kodlanmış (ölçeklenmemiş) satırlar sırayla yazılır, ölçekleyici güncellenir
+        scaler = StandardScaler()
+        buffer = np.empty((chunk_rows, n_columns), dtype=np.float64)
+        masks = _test_masks(n_rows, chunk_rows, test_size, random_state)
+        for chunk, chunk_test in zip(pd.read_csv(path, chunksize=chunk_rows), masks):
+            X = encoder.encode_batch(chunk, out=buffer)
+            y = chunk[TARGET_COLUMN].to_numpy()
+            scaler.partial_fit(X[~chunk_test])
+            for part, mask in (('train', ~chunk_test), ('test', chunk_test)):
+                X[mask].astype(np.float32).tofile(files[f"X_{part}"])
+                y[mask].astype(np.int8).tofile(files[f"y_{part}"])
+
+        # 2. geçiş: matrisler eğitim istatistikleriyle parça parça yerinde ölçeklenir
+        pass_codes(scaler, feature_names)
+        mean, scale = scaler.mean_.astype(np.float32), scaler.scale_.astype(np.float32)
+        for part, rows in sizes.items():
+            f = files[f"X_{part}"]
+            for start in range(0, rows, chunk_rows):
+                count = min(chunk_rows, rows - start)
+                position = offsets[f"X_{part}"] + start * n_columns * 4
+                f.seek(position)
+                block = np.fromfile(f, dtype=np.float32, count=count * n_columns).reshape(count, n_columns)
+                block -= mean
+                block /= scale
+                f.seek(position)
+                block.tofile(f)
+    finally:
+        for f in files.values():
+            f.close()
+
+    joblib.dump(scaler, os.path.join(tmp_target, 'scaler.joblib'))
+    meta = {'source': os.path.basename(path), 'fingerprint': fingerprint, 'rows': n_rows,
+            'test_rows': n_test, 'feature_names': feature_names}
+    with open(os.path.join(tmp_target, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+
+    try:
+        os.replace(tmp_target, target)
+    except OSError:
+        # Başka bir süreç aynı kopyayı daha önce yazdı
+        shutil.rmtree(tmp_target, ignore_errors=True)
+    return EncodedDataset(target)
+
+
+def _fit_sgd(dataset, params, random_state):
+    from sklearn.linear_model import SGDClassifier
+
+    model = SGDClassifier(loss='log_loss', alpha=params['alpha'], average=params['average'],
+                          random_state=random_state)
+    rng = np.random.default_rng(random_state)
+    classes = np.array([0, 1])
+    for _ in range(params['epochs']):
+        for X, y in dataset.chunks('train'):
+            order = rng.permutation(len(y))
+            model.partial_fit(X[order], y[order], classes=classes)
+    return model
+
+
+def _fit_hgb(dataset, params, random_state):
+    # scikit-learn girdiyi float64'e çevirir; dönüşüm burada parça parça yapılır ki
+    # dosyanın float32 tam kopyası ve float64 kopya aynı anda bellekte tutulmasın
+    X, y = dataset.load('train', dtype=np.float64)
+    model = build_model("Histogram Gradyan Artırma", params, random_state, dataset.feature_names)
+    return model.fit(X, y)
+
+
+def evaluate_chunked(model, dataset):
+    """Test matrisi üzerinde parça parça doğruluk ve karmaşıklık matrisi."""
+    confusion = np.zeros((2, 2), dtype=np.int64)
+    for X, y in dataset.chunks('test'):
+        y_pred = model.predict(X)
+        np.add.at(confusion, (y.astype(np.intp), y_pred.astype(np.intp)), 1)
+    total = confusion.sum()
+    return {'accuracy': float(np.trace(confusion) / total) if total else float('nan'),
+            'confusion_matrix': confusion, 'n_test': int(total)}
+
+
+def fit_out_of_core(model_option, path=DATA_PATH, params=None, directory=CACHE_DIR,
+                    random_state=RANDOM_STATE):
+    """
+    Modeli veri setinin tamamını belleğe almadan eğitir. Sonuç, sayfaların ve servisin
+    kullandığı TrainedModel biçimindedir.
+    """
+    if model_option not in OUT_OF_CORE_MODELS:
+        raise ValueError(f"Parça parça eğitim desteklenmiyor: {model_option}")
+    if params is None:
+        params = DEFAULT_OUT_OF_CORE_PARAMS[model_option]
+
+    dataset = encode_dataset(path, directory, feature_names=model_feature_names(model_option))
+    if model_option == "Lojistik Regresyon":
+        model = _fit_sgd(dataset, params, random_state)
+    else:
+        model = _fit_hgb(dataset, params, random_state)
+
+    metrics = evaluate_chunked(model, dataset)
+    metrics['n_train'] = dataset.meta['rows'] - dataset.meta['test_rows']
+    return TrainedModel(model_option, dict(params), dataset.meta['fingerprint'], model, dataset.scaler,
+                        dataset.feature_names, metrics)
+
+
+def save_out_of_core(trained, directory=OUTPUT_DIR):
+    """Modeli core.artifacts biçiminde, parça parça eğitime özgü dosya adıyla yazar."""
+    from core.artifacts import save_artifact
+
+    return save_artifact(trained, directory, slug=OUT_OF_CORE_MODELS[trained.model_option])
+
+
+def load_out_of_core(model_option, fingerprint=None, params=None, directory=OUTPUT_DIR):
+    """
+    save_out_of_core ile yazılmış modeli yükler. Dosya yoksa ya da veri özeti,
+    hiperparametreler, dosya biçimi veya scikit-learn sürümü uyuşmuyorsa None döner.
+    """
+    from core.artifacts import load_artifact
+
+    if params is None:
+        params = DEFAULT_OUT_OF_CORE_PARAMS[model_option]
+    return load_artifact(model_option, fingerprint, params, directory, slug=OUT_OF_CORE_MODELS[model_option])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Büyük veri setleri için parça parça eğitim.")
+    parser.add_argument('--model', choices=list(OUT_OF_CORE_MODELS), default="Lojistik Regresyon")
+    parser.add_argument('--data', default=DATA_PATH, help="Eğitim verisi (CSV)")
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help="Kodlanmış matrislerin klasörü")
+    parser.add_argument('--output', default=OUTPUT_DIR, help="Modelin yazılacağı klasör")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    trained = fit_out_of_core(args.model, args.data, directory=args.cache_dir)
+    path = save_out_of_core(trained, args.output)
+    peak_mb = peak_rss_mb()
+    rss = f", en yüksek RSS={peak_mb:.0f} MB" if peak_mb is not None else ''
+    print(f"{args.model}: {trained.metrics['n_train']:,} eğitim satırı, doğruluk={trained.metrics['accuracy']:.4f} "
+          f"süre={time.perf_counter() - start:.2f}s{rss} -> {path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,295 @@
+"""
+Ham Kaggle heart.csv dosyasından heart_cleaned.csv üreten veri hattı.
+
+Not defterindeki adımların aynısı uygulanır:
+    sütun adlarını Türkçeleştirme -> aykırı değerleri düzeltme -> etiket kodlama -> yazma
+
+- Aykırı değerler: get_outlier_bounds (katsayi=0.75) sınırlarının dışındaki değerler,
+  aynı sütunun aykırı olmayan değerlerinin moduyla değiştirilir (fill_outliers_with_mode).
+- Etiket kodlama: LabelEncoder ile aynı şekilde, sınıflar sıralanarak 0..n-1 kodlanır.
+
+Her aşamanın anahtarı girdisinin içerik özetinden ve parametrelerinden türetilir;
+anahtarı değişmeyen aşamalar atlanır. Sınırlar, modlar ve kodlayıcı sınıfları
+artifacts/pipeline/state.json dosyasında saklanır. Ham dosyanın sonuna yeni satırlar
+eklendiyse yalnızca yeni satırlar, saklanan sınırlar ve sınıflarla işlenip çıktıya eklenir.
+
+Kullanım:
+    python -m core.pipeline --raw heart.csv --output heart_cleaned.csv
+    python -m core.pipeline --raw heart.csv --full
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import pickle
+
+import pandas as pd
+
+from core.data import DATA_PATH
+
+RAW_PATH = 'heart.csv'
+STATE_DIR = os.path.join('artifacts', 'pipeline')
+STAGE_CACHE_DIR = os.path.join('cache', 'pipeline')
+
+RENAME_MAP = {
+    "Age": "Yaş",
+    "Sex": "Cinsiyet",
+    "ChestPainType": "GöğüsAğrısıTürü",
+    "RestingBP": "İstirahatKanBasıncı",
+    "Cholesterol": "Kolesterol",
+    "FastingBS": "AçlıkKanŞekeri",
+    "RestingECG": "İstirahatEKG",
+    "MaxHR": "MaksimumKalpHızı",
+    "ExerciseAngina": "EgzersizAnginası",
+    "Oldpeak": "STDepresyonu",
+    "ST_Slope": "ST_Eğimi",
+    "HeartDisease": "KalpHastalığı"
+}
+
+# Aykırı değer düzeltmesi yapılan sütunlar ve IQR katsayısı
+OUTLIER_COLS = ['İstirahatKanBasıncı', 'Kolesterol', 'STDepresyonu']
+OUTLIER_COEFFICIENT = 0.75
+
+# Etiket kodlanan kategorik sütunlar
+CATEGORICAL_COLS = ['ST_Eğimi', 'EgzersizAnginası', 'İstirahatEKG', 'Cinsiyet', 'GöğüsAğrısıTürü']
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _stage_key(previous_key, stage, params):
+    spec = json.dumps({'previous': previous_key, 'stage': stage, 'params': params}, sort_keys=True)
+    return _sha256(spec.encode('utf-8'))
+
+
+# --- Aşamalar -------------------------------------------------------------------------
+
+def rename_columns(df):
+    return df.rename(columns=RENAME_MAP)
+
+
+def fit_outlier_bounds(df, cols=OUTLIER_COLS, coefficient=OUTLIER_COEFFICIENT):
+    """
+    Tüm hedef sütunlar için alt/üst sınırları ve aykırı olmayan değerlerin modunu
+    tek seferde hesaplar.
+    """
+    values = df[cols]
+    quartiles = values.quantile([0.25, 0.75])
+    iqr = quartiles.loc[0.75] - quartiles.loc[0.25]
+    lower = quartiles.loc[0.25] - coefficient * iqr
+    upper = quartiles.loc[0.75] + coefficient * iqr
+
+    outliers = values.lt(lower, axis=1) | values.gt(upper, axis=1)
+    modes = values.mask(outliers).mode().iloc[0]
+
+    return {
+        col: {'lower': float(lower[col]), 'upper': float(upper[col]), 'mode': modes[col].item()}
+        for col in cols if pd.notna(modes[col])
+    }
+
+
+def apply_outlier_bounds(df, bounds):
+    """Sınırların dışındaki değerleri saklanan modlarla değiştirir."""
+    cols = list(bounds)
+    if not cols:
+        return df
+
+    values = df[cols]
+    lower = pd.Series({col: b['lower'] for col, b in bounds.items()})
+    upper = pd.Series({col: b['upper'] for col, b in bounds.items()})
+    modes = pd.Series({col: b['mode'] for col, b in bounds.items()})
+
+    outliers = values.lt(lower, axis=1) | values.gt(upper, axis=1)
+    df = df.copy()
+    df[cols] = values.mask(outliers, modes, axis=1).astype(values.dtypes.to_dict())
+    return df
+
+
+def fit_label_encoders(df, cols=CATEGORICAL_COLS):
+    """LabelEncoder.fit ile aynı: her sütunun sıralı benzersiz değerleri."""
+    return {col: sorted(df[col].dropna().unique().tolist()) for col in cols}
+
+
+def apply_label_encoders(df, classes):
+    """
+    Kategorik değerleri sınıf sırasındaki indekslerine dönüştürür. Bilinmeyen bir
+    değer görülürse ValueError verilir.
+    """
+    df = df.copy()
+    for col, col_classes in classes.items():
+        codes = pd.Categorical(df[col], categories=col_classes).codes
+        unknown = (codes == -1) & df[col].notna().to_numpy()
+        if unknown.any():
+            values = sorted(df.loc[unknown, col].astype(str).unique())
+            raise ValueError(f"{col} sütununda bilinmeyen değerler: {', '.join(values)}")
+        df[col] = codes
+    return df
+
+
+# --- Durum ve aşama önbelleği -------------------------------------------------------------
+
+def _state_path(state_dir):
+    return os.path.join(state_dir, 'state.json')
+
+
+def load_state(state_dir=STATE_DIR):
+    try:
+        with open(_state_path(state_dir), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_state(state, state_dir):
+    os.makedirs(state_dir, exist_ok=True)
+    tmp_path = _state_path(state_dir) + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, _state_path(state_dir))
+
+
+def _cached_stage(cache_dir, stage, key, compute, log):
+    """Aşama çıktısı önbellekte varsa okunur, yoksa hesaplanıp yazılır."""
+    path = os.path.join(cache_dir, f"{stage}-{key[:16]}.pkl")
+    if os.path.exists(path):
+        log(f"{stage}: girdiler değişmedi, atlandı")
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+    result = compute()
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(path + '.tmp', 'wb') as f:
+        pickle.dump(result, f)
+    os.replace(path + '.tmp', path)
+    log(f"{stage}: çalıştırıldı")
+    return result
+
+
+def _file_hash(path):
+    with open(path, 'rb') as f:
+        return _sha256(f.read())
+
+
+def _write_csv(df, path, append=False):
+    df.to_csv(path, index=False, mode='a' if append else 'w', header=not append)
+
+
+# --- Çalıştırma ---------------------------------------------------------------------------
+
+def run_full(raw_path=RAW_PATH, output_path=DATA_PATH, state_dir=STATE_DIR,
+             cache_dir=STAGE_CACHE_DIR, log=print):
+    """Tüm ham dosyayı işler; girdisi değişmeyen aşamaları atlar."""
+    with open(raw_path, 'rb') as f:
+        raw_bytes = f.read()
+
+    rename_key = _stage_key(_sha256(raw_bytes), 'rename', RENAME_MAP)
+    renamed = _cached_stage(cache_dir, 'rename', rename_key,
+                            lambda: rename_columns(pd.read_csv(io.BytesIO(raw_bytes))), log)
+
+    outlier_params = {'cols': OUTLIER_COLS, 'coefficient': OUTLIER_COEFFICIENT}
+    outlier_key = _stage_key(rename_key, 'outliers', outlier_params)
+
+    def compute_outliers():
+        bounds = fit_outlier_bounds(renamed, OUTLIER_COLS, OUTLIER_COEFFICIENT)
+        return apply_outlier_bounds(renamed, bounds), bounds
+
+    cleaned, bounds = _cached_stage(cache_dir, 'outliers', outlier_key, compute_outliers, log)
+
+    encode_key = _stage_key(outlier_key, 'encode', CATEGORICAL_COLS)
+
+    def compute_encoding():
+        classes = fit_label_encoders(cleaned, CATEGORICAL_COLS)
+        return apply_label_encoders(cleaned, classes), classes
+
+    encoded, classes = _cached_stage(cache_dir, 'encode', encode_key, compute_encoding, log)
+
+    state = load_state(state_dir)
+    if (state is not None and state.get('encode_key') == encode_key and os.path.exists(output_path)
+            and _file_hash(output_path) == state.get('output_hash')):
+        log("write: çıktı güncel, atlandı")
+    else:
+        _write_csv(encoded, output_path)
+        log(f"write: {len(encoded)} satır yazıldı -> {output_path}")
+
+    state = {
+        'encode_key': encode_key,
+        'raw_bytes': len(raw_bytes),
+        'raw_hash': _sha256(raw_bytes),
+        'rows': len(encoded),
+        'output_path': os.path.abspath(output_path),
+        'output_hash': _file_hash(output_path),
+        'bounds': bounds,
+        'classes': classes,
+    }
+    _save_state(state, state_dir)
+    return state
+
+
+def run_incremental(raw_path=RAW_PATH, output_path=DATA_PATH, state_dir=STATE_DIR, log=print):
+    """
+    Ham dosyaya yalnızca satır eklendiyse yeni satırları saklanan sınırlar ve
+    sınıflarla işleyip çıktının sonuna ekler. Bu mümkün değilse None döner.
+    """
+    state = load_state(state_dir)
+    if state is None or not os.path.exists(output_path):
+        return None
+    if state.get('output_path') != os.path.abspath(output_path) or _file_hash(output_path) != state['output_hash']:
+        return None
+
+    with open(raw_path, 'rb') as f:
+        raw_bytes = f.read()
+    if len(raw_bytes) < state['raw_bytes'] or _sha256(raw_bytes[:state['raw_bytes']]) != state['raw_hash']:
+        return None
+
+    new_bytes = raw_bytes[state['raw_bytes']:]
+    if not new_bytes.strip():
+        log("Yeni satır yok, çıktı güncel")
+        return state
+
+    # Yeni satırlar ham dosyanın başlığıyla birlikte okunur
+    header = raw_bytes.split(b'\n', 1)[0] + b'\n'
+    new_rows = pd.read_csv(io.BytesIO(header + new_bytes))
+
+    processed = rename_columns(new_rows)
+    processed = apply_outlier_bounds(processed, state['bounds'])
+    processed = apply_label_encoders(processed, state['classes'])
+    _write_csv(processed, output_path, append=True)
+    log(f"{len(processed)} yeni satır işlendi ve {output_path} dosyasına eklendi")
+
+    state.update({
+        'encode_key': None,
+        'raw_bytes': len(raw_bytes),
+        'raw_hash': _sha256(raw_bytes),
+        'rows': state['rows'] + len(processed),
+        'output_hash': _file_hash(output_path),
+    })
+    _save_state(state, state_dir)
+    return state
+
+
+def run(raw_path=RAW_PATH, output_path=DATA_PATH, state_dir=STATE_DIR, cache_dir=STAGE_CACHE_DIR,
+        full=False, log=print):
+    if not full:
+        state = run_incremental(raw_path, output_path, state_dir, log)
+        if state is not None:
+            return state
+    return run_full(raw_path, output_path, state_dir, cache_dir, log)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ham heart.csv dosyasından heart_cleaned.csv üretir.")
+    parser.add_argument('--raw', default=RAW_PATH, help="Ham Kaggle veri seti")
+    parser.add_argument('--output', default=DATA_PATH, help="Temizlenmiş veri setinin yazılacağı dosya")
+    parser.add_argument('--state-dir', default=STATE_DIR, help="Sınırların ve kodlayıcıların saklandığı klasör")
+    parser.add_argument('--cache-dir', default=STAGE_CACHE_DIR, help="Aşama çıktılarının önbellek klasörü")
+    parser.add_argument('--full', action='store_true',
+                        help="Eklenen satırları ayrı işlemek yerine tüm geçmişi yeniden işle")
+    args = parser.parse_args(argv)
+
+    run(args.raw, args.output, args.state_dir, args.cache_dir, full=args.full)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,219 @@
+"""
+Eğitilmiş modellerin scikit-learn'süz çalıştırılabilen taşınabilir biçime aktarılması.
+
+Her model tek bir .npz dosyasına yazılır: JSON meta verisi (biçim adı ve sürümü, model,
+veri özeti, sütun adları, test metrikleri) ve yalnızca sayısal diziler (kodlayıcı indeksleri,
+StandardScaler ortalama/ölçek, model parametreleri). Dosya pickle içermez ve core.runtime
+ile yalnızca NumPy kullanılarak yüklenir.
+
+- Lojistik Regresyon: katsayılar ve sabit terim
+- Rastgele Orman: core.forest'taki düz düğüm dizileri
+- Destek Vektör Makinesi: destek vektörleri, dual katsayılar, gamma ve sigmoid kalibrasyonu
+- Histogram Gradyan Artırma: ağaç düğümleri, kategori bitset'leri ve başlangıç değeri
+
+Kullanım:
+    python -m core.portable
+    python -m core.portable --model "Rastgele Orman" --output artifacts/portable
+"""
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+
+from core.artifacts import ARTIFACT_DIR, MODEL_SLUGS
+from core.forest import FlatForest
+from core.models import MODEL_OPTIONS, get_trained_model, load_split
+from core.runtime import FORMAT_NAME, FORMAT_VERSION, load_portable
+
+# Taşınabilir model dosyalarının varsayılan klasörü
+PORTABLE_DIR = os.path.join(ARTIFACT_DIR, 'portable')
+
+
+def portable_path(model_option, directory=PORTABLE_DIR):
+    return os.path.join(directory, f"{MODEL_SLUGS[model_option]}.npz")
+
+
+def _encoder_arrays(encoder):
+    return {
+        'enc_pass_out': encoder._pass_out,
+        'enc_pass_src': encoder._pass_src,
+        'enc_hot_out': encoder._hot_out,
+        'enc_hot_src': encoder._hot_src,
+        'enc_hot_val': encoder._hot_val,
+        'enc_fill': encoder._fill,
+    }
+
+
+def _logistic_arrays(model):
+    if len(model.classes_) != 2:
+        raise ValueError("Yalnızca ikili lojistik regresyon dışa aktarılabilir")
+    return 'lojistik', {'lr_coef': model.coef_, 'lr_intercept': model.intercept_}
+
+
+def _forest_arrays(model):
+    flat = FlatForest.from_sklearn(model)
+    return 'orman', {
+        'rf_feature': flat.feature, 'rf_threshold': flat.threshold, 'rf_children': flat.children,
+        'rf_missing_left': flat.missing_left, 'rf_value': flat.value, 'rf_roots': flat.roots,
+        'rf_depth': np.array(flat.depth), 'rf_classes': flat.classes,
+    }
+
+
+def _svm_arrays(model):
+    from core.sensitivity import _rbf_svc
+
+    pairs = _rbf_svc(model)
+    if pairs is None or any(not hasattr(calibrator, 'a_') for _, calibrator in pairs):
+        raise ValueError("Yalnızca sigmoid ile kalibre edilmiş RBF çekirdekli SVM dışa aktarılabilir")
+    svcs = [svc for svc, _ in pairs]
+    return 'rbf_svm', {
+        'svm_sizes': np.array([len(svc.support_vectors_) for svc in svcs]),
+        'svm_support': np.concatenate([svc.support_vectors_ for svc in svcs]),
+        'svm_dual_coef': np.concatenate([svc.dual_coef_[0] for svc in svcs]),
+        'svm_intercept': np.array([svc.intercept_[0] for svc in svcs]),
+        'svm_gamma': np.array([svc._gamma for svc in svcs]),
+        'svm_sigmoid': np.array([[calibrator.a_, calibrator.b_] for _, calibrator in pairs]),
+    }
+
+
+def _hist_gradient_boosting_arrays(model):
+    inner = model.model_
+    if inner.n_trees_per_iteration_ != 1:
+        raise ValueError("Yalnızca ikili gradyan artırma dışa aktarılabilir")
+    predictors = [iteration[0] for iteration in inner._predictors]
+    offsets = np.cumsum([0] + [len(p.nodes) for p in predictors])
+
+    feature, threshold, children, missing_left, is_categorical, bitset, value = [], [], [], [], [], [], []
+    for predictor, offset in zip(predictors, offsets):
+        nodes = predictor.nodes
+        index = np.arange(offset, offset + len(nodes), dtype=np.intp)
+        leaf = nodes['is_leaf'].astype(bool)
+        categorical = nodes['is_categorical'].astype(bool)
+
+        feature.append(np.where(leaf, 0, nodes['feature_idx']).astype(np.intp))
+        threshold.append(nodes['num_threshold'])
+        pair = np.empty(2 * len(nodes), dtype=np.intp)
+        pair[0::2] = np.where(leaf, index, nodes['left'].astype(np.intp) + offset)
+        pair[1::2] = np.where(leaf, index, nodes['right'].astype(np.intp) + offset)
+        children.append(pair)
+        missing_left.append(nodes['missing_go_to_left'].astype(bool))
+        is_categorical.append(categorical & ~leaf)
+        # Kategorik olmayan düğümlerde kullanılmaz; 0. satıra işaret eder
+        node_bitsets = np.zeros((len(nodes), 8), dtype=np.uint32)
+        node_bitsets[categorical] = predictor.raw_left_cat_bitsets[nodes['bitset_idx'][categorical]]
+        bitset.append(node_bitsets)
+        value.append(nodes['value'])
+
+    known, f_idx_map = inner._bin_mapper.make_known_categories_bitsets()
+    if len(known):
+        known_by_feature = known[f_idx_map]
+    else:
+        known_by_feature = np.zeros((len(f_idx_map), 8), dtype=np.uint32)
+
+    # Ağaçlar tree_positions() sırasındaki sütunlara ve kategorilerin sıra numaralarına göre bölünür
+    position = model.tree_positions()
+    columns = model.categorical_columns_
+    if inner._preprocessor is None:
+        # Ön işlemci yoksa ağaçlar girdideki kodlarla çalışır (kod = sıra numarası)
+        categories = [np.arange(256, dtype=np.float64) for _ in columns]
+    else:
+        categories = [np.asarray(values, dtype=np.float64)
+                      for values in inner._preprocessor.named_transformers_['encoder'].categories_]
+
+    return 'gradyan_artirma', {
+        'hgb_positions': position,
+        'hgb_category_columns': np.asarray(columns, dtype=np.intp),
+        'hgb_category_sizes': np.array([len(values) for values in categories], dtype=np.intp),
+        'hgb_category_values': np.concatenate(categories) if categories else np.empty(0),
+        'hgb_feature': np.concatenate(feature),
+        'hgb_threshold': np.concatenate(threshold),
+        'hgb_children': np.concatenate(children),
+        'hgb_missing_left': np.concatenate(missing_left),
+        'hgb_is_categorical': np.concatenate(is_categorical),
+        'hgb_bitset': np.concatenate(bitset),
+        'hgb_known_bitset': known_by_feature,
+        'hgb_value': np.concatenate(value),
+        'hgb_roots': offsets[:-1].astype(np.intp),
+        'hgb_depth': np.array(max(p.get_max_depth() for p in predictors)),
+        'hgb_baseline': np.array(float(np.ravel(inner._baseline_prediction)[0])),
+    }
+
+
+EXPORTERS = {
+    "Lojistik Regresyon": _logistic_arrays,
+    "Rastgele Orman": _forest_arrays,
+    "Destek Vektör Makinesi": _svm_arrays,
+    "Histogram Gradyan Artırma": _hist_gradient_boosting_arrays,
+}
+
+
+def export_model(trained, path=None, directory=PORTABLE_DIR):
+    """TrainedModel'i taşınabilir .npz dosyasına yazar ve dosya yolunu döndürür."""
+    import sklearn
+
+    if path is None:
+        os.makedirs(directory, exist_ok=True)
+        path = portable_path(trained.model_option, directory)
+
+    kind, arrays = EXPORTERS[trained.model_option](trained.model)
+    metrics = {key: float(trained.metrics[key]) for key in ('accuracy',) if key in trained.metrics}
+    meta = {
+        'format': FORMAT_NAME,
+        'format_version': FORMAT_VERSION,
+        'kind': kind,
+        'model_option': trained.model_option,
+        'params': trained.params,
+        'fingerprint': trained.fingerprint,
+        'sklearn_version': sklearn.__version__,
+        'feature_names': trained.feature_names,
+        'raw_features': trained.encoder.raw_features,
+        'metrics': metrics,
+    }
+    arrays.update(_encoder_arrays(trained.encoder))
+    arrays['scaler_mean'] = trained.scaler.mean_
+    arrays['scaler_scale'] = trained.scaler.scale_
+    arrays['meta'] = np.frombuffer(json.dumps(meta, ensure_ascii=False).encode('utf-8'), dtype=np.uint8)
+
+    # Yarım yazılmış dosyanın okunmaması için önce geçici dosyaya yazılır
+    tmp_path = path + '.tmp.npz'
+    np.savez(tmp_path, **arrays)
+    os.replace(tmp_path, path)
+    return path
+
+
+def parity(trained, portable, X_scaled):
+    """Taşınabilir modelle scikit-learn modelinin olasılıkları arasındaki en büyük fark."""
+    return float(np.abs(portable.predict_proba(X_scaled) - trained.model.predict_proba(X_scaled)).max())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Modelleri taşınabilir (.npz) biçime aktarır.")
+    parser.add_argument('--model', action='append', choices=MODEL_OPTIONS,
+                        help="Aktarılacak model (birden fazla verilebilir, varsayılan: hepsi)")
+    parser.add_argument('--output', default=PORTABLE_DIR, help="Dosyaların yazılacağı klasör")
+    parser.add_argument('--tolerance', type=float, default=1e-9,
+                        help="Test setinde izin verilen en büyük olasılık farkı")
+    args = parser.parse_args(argv)
+
+    X_test = load_split().raw_test
+    failed = False
+    for model_option in args.model or MODEL_OPTIONS:
+        trained = get_trained_model(model_option)
+        path = export_model(trained, directory=args.output)
+
+        start = time.perf_counter()
+        portable = load_portable(path)
+        load_ms = (time.perf_counter() - start) * 1000
+        max_diff = parity(trained, portable, trained.encode(X_test))
+        failed |= max_diff > args.tolerance
+        print(f"{model_option}: {os.path.getsize(path) / 1024:.0f} KB, yükleme {load_ms:.1f} ms, "
+              f"test setinde maks |Δp| = {max_diff:.2e} -> {path}")
+
+    if failed:
+        raise SystemExit(f"Olasılık farkı {args.tolerance:g} sınırını aşıyor")
+
+
+if __name__ == '__main__':
+    main()
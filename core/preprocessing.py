@@ -0,0 +1,231 @@
+import numpy as np
+import pandas as pd
+
+from core.metrics import metrics
+
+
+def _fill_code(column, value):
+    # Eksik değer içeren sütunlar float okunur; kodlar tam sayıya döndürülmezse one-hot
+    # sütunları 'GöğüsAğrısıTürü_0.0' gibi adlandırılır ve eğitimdeki sütunlarla eşleşmez
+    return pd.to_numeric(column.fillna(value), downcast='integer')
+
+
+# Veri ön işleme fonksiyonu - VERİ SETİNİZLE UYUMLU HALE GETİRİLDİ
+@metrics.timed('preprocess_data')
+def preprocess_data(df, is_training=True, reference_columns=None):
+    """
+    Veri ön işleme fonksiyonu
+    """
+    df_processed = df.copy()
+    
+    # Cinsiyet dönüşümü (1: Erkek, 0: Kadın)
+    if 'Cinsiyet' in df_processed.columns:
+        # Zaten sayısal format, sadece eksik değerleri kontrol et
+        if df_processed['Cinsiyet'].isnull().any():
+            df_processed['Cinsiyet'] = df_processed['Cinsiyet'].fillna(1)
+    
+    # Göğüs ağrısı tipi dönüşümü
+    if 'GöğüsAğrısıTürü' in df_processed.columns:
+        # Eksik değerleri doldurma
+        df_processed['GöğüsAğrısıTürü'] = _fill_code(df_processed['GöğüsAğrısıTürü'], 0)
+        
+        # One-hot encoding
+        chest_pain_dummies = pd.get_dummies(df_processed['GöğüsAğrısıTürü'], prefix='GöğüsAğrısıTürü')
+        df_processed = pd.concat([df_processed, chest_pain_dummies], axis=1)
+        df_processed = df_processed.drop('GöğüsAğrısıTürü', axis=1)
+    
+    # İstirahat EKG dönüşümü
+    if 'İstirahatEKG' in df_processed.columns:
+        # Eksik değerleri doldurma
+        df_processed['İstirahatEKG'] = _fill_code(df_processed['İstirahatEKG'], 0)
+        
+        # One-hot encoding
+        ecg_dummies = pd.get_dummies(df_processed['İstirahatEKG'], prefix='İstirahatEKG')
+        df_processed = pd.concat([df_processed, ecg_dummies], axis=1)
+        df_processed = df_processed.drop('İstirahatEKG', axis=1)
+    
+    # Egzersiz angina dönüşümü (1: Var, 0: Yok)
+    if 'EgzersizAnginası' in df_processed.columns:
+        if df_processed['EgzersizAnginası'].isnull().any():
+            df_processed['EgzersizAnginası'] = df_processed['EgzersizAnginası'].fillna(0)
+    
+    # ST eğimi dönüşümü
+    if 'ST_Eğimi' in df_processed.columns:
+        # Eksik değerleri doldurma
+        df_processed['ST_Eğimi'] = _fill_code(df_processed['ST_Eğimi'], 1)
+        
+        # One-hot encoding
+        st_slope_dummies = pd.get_dummies(df_processed['ST_Eğimi'], prefix='ST_Eğimi')
+        df_processed = pd.concat([df_processed, st_slope_dummies], axis=1)
+        df_processed = df_processed.drop('ST_Eğimi', axis=1)
+    
+    # Sayısal değişkenlerdeki eksik değerleri doldurma
+    numeric_cols = ['Yaş', 'İstirahatKanBasıncı', 'Kolesterol', 'AçlıkKanŞekeri', 'MaksimumKalpHızı', 'STDepresyonu']
+    for col in numeric_cols:
+        if col in df_processed.columns and df_processed[col].isnull().any():
+            df_processed[col] = df_processed[col].fillna(df_processed[col].mean() if len(df_processed) > 1 else 0)
+    
+    # Eğitim verisi değilse, referans sütunlara göre düzenleme
+    if not is_training and reference_columns is not None:
+        # Eksik sütunları ekle
+        for col in reference_columns:
+            if col not in df_processed.columns:
+                df_processed[col] = 0
+        
+        # Sütun sırasını düzenle
+        df_processed = df_processed[reference_columns]
+    
+    return df_processed
+
+
+# Modelin girdisi olan ham özellikler (veri setindeki sırayla)
+RAW_FEATURES = [
+    'Yaş', 'Cinsiyet', 'GöğüsAğrısıTürü', 'İstirahatKanBasıncı', 'Kolesterol', 'AçlıkKanŞekeri',
+    'İstirahatEKG', 'MaksimumKalpHızı', 'EgzersizAnginası', 'STDepresyonu', 'ST_Eğimi'
+]
+
+# One-hot kodlanan kategorik özellikler
+ONE_HOT_FEATURES = ['GöğüsAğrısıTürü', 'İstirahatEKG', 'ST_Eğimi']
+
+# One-hot kodlanan özelliklerin kodları (heart_cleaned.csv'deki etiket kodlaması). Veri
+# setinin tamamı okunmadan sabit bir sütun düzeni gereken yerlerde (artımlı eğitim) kullanılır.
+ONE_HOT_CODES = {'GöğüsAğrısıTürü': (0, 1, 2, 3), 'İstirahatEKG': (0, 1, 2), 'ST_Eğimi': (0, 1, 2)}
+
+
+def encoded_feature_names(codes=ONE_HOT_CODES):
+    """preprocess_data'nın tüm kodları içeren bir veri setinde ürettiği sütun düzeni."""
+    names = [name for name in RAW_FEATURES if name not in codes]
+    for name in ONE_HOT_FEATURES:
+        names.extend(f"{name}_{code}" for code in codes[name])
+    return names
+
+
+def categorical_feature_names(feature_names=None):
+    """
+    Kategorik özelliklerin one-hot grupları yerine tek bir kod sütunuyla temsil edildiği
+    sütun düzeni (gradyan artırma): one-hot olmayan sütunlar aynı sırada, ardından
+    ONE_HOT_FEATURES sırasında kod sütunları. FeatureEncoder bu sütunlara ham kodu yazar.
+    """
+    if feature_names is None:
+        feature_names = encoded_feature_names()
+    plain = [name for name in feature_names
+             if name not in ONE_HOT_FEATURES and name.rpartition('_')[0] not in ONE_HOT_FEATURES]
+    present = {name.rpartition('_')[0] for name in feature_names}
+    return plain + [name for name in ONE_HOT_FEATURES if name in present or name in feature_names]
+
+
+def category_columns(feature_names):
+    """Sütun düzenindeki kategori kodu sütunlarının sırası (one-hot düzeninde boş)."""
+    return [i for i, name in enumerate(feature_names) if name in ONE_HOT_FEATURES]
+
+
+# Eksik değerler için preprocess_data ile aynı doldurma değerleri.
+# Sayısal sütunlar, preprocess_data'nın tek satırlık davranışındaki gibi 0 ile doldurulur.
+FILL_VALUES = {'Cinsiyet': 1, 'GöğüsAğrısıTürü': 0, 'İstirahatEKG': 0, 'EgzersizAnginası': 0, 'ST_Eğimi': 1}
+
+
+class FeatureEncoder:
+    """
+    Ham kayıtları, eğitimde kullanılan sütun düzenindeki float64 özellik vektörüne
+    dönüştürür. Dönüşüm preprocess_data(..., is_training=False, reference_columns=...)
+    ile aynı sütunları üretir, ancak pandas yerine önceden hesaplanmış indekslerle çalışır.
+
+    Kayıtlar RAW_FEATURES sırasında bir NumPy satırı/dizisi, sözlük ya da DataFrame olabilir.
+    """
+
+    def __init__(self, feature_names, raw_features=RAW_FEATURES):
+        self.feature_names = list(feature_names)
+        self.raw_features = list(raw_features)
+        self.n_features = len(self.feature_names)
+
+        raw_index = {name: i for i, name in enumerate(self.raw_features)}
+        pass_out, pass_src = [], []
+        hot_out, hot_src, hot_val = [], [], []
+
+        for out_idx, name in enumerate(self.feature_names):
+            if name in raw_index:
+                pass_out.append(out_idx)
+                pass_src.append(raw_index[name])
+                continue
+
+            # 'GöğüsAğrısıTürü_2' -> ('GöğüsAğrısıTürü', 2.0)
+            prefix, _, value = name.rpartition('_')
+            if prefix in ONE_HOT_FEATURES and prefix in raw_index:
+                hot_out.append(out_idx)
+                hot_src.append(raw_index[prefix])
+                hot_val.append(float(value))
+            # Diğer sütunlar preprocess_data'da olduğu gibi 0 kalır
+
+        self._pass_out = np.array(pass_out, dtype=np.intp)
+        self._pass_src = np.array(pass_src, dtype=np.intp)
+        self._hot_out = np.array(hot_out, dtype=np.intp)
+        self._hot_src = np.array(hot_src, dtype=np.intp)
+        self._hot_val = np.array(hot_val, dtype=np.float64)
+        self._zero_out = np.setdiff1d(np.arange(self.n_features), np.concatenate([self._pass_out, self._hot_out]))
+        self._fill = np.array([FILL_VALUES.get(name, 0) for name in self.raw_features], dtype=np.float64)
+
+    def column_sources(self):
+        """
+        Her çıktı sütununun türetildiği ham özelliğin RAW_FEATURES içindeki sırası
+        (one-hot sütunları kaynak özelliğe bağlanır; hiçbir özellikten gelmeyen sütunlar -1).
+        """
+        sources = np.full(self.n_features, -1, dtype=np.intp)
+        sources[self._pass_out] = self._pass_src
+        sources[self._hot_out] = self._hot_src
+        return sources
+
+    def column_index(self, name):
+        """Ham bir sayısal özelliğin çıktı vektöründeki sırası."""
+        return self.feature_names.index(name)
+
+    def _raw_row(self, record):
+        if isinstance(record, dict):
+            return np.array([record[name] for name in self.raw_features], dtype=np.float64)
+        return np.asarray(record, dtype=np.float64)
+
+    def _raw_matrix(self, records):
+        if isinstance(records, pd.DataFrame):
+            return records[self.raw_features].to_numpy(dtype=np.float64)
+        if isinstance(records, (list, tuple)) and records and isinstance(records[0], dict):
+            return np.array([[r[name] for name in self.raw_features] for r in records], dtype=np.float64)
+        return np.asarray(records, dtype=np.float64).reshape(-1, len(self.raw_features))
+
+    def encode(self, record, out=None):
+        """Tek bir kaydı (n_features,) boyutlu vektöre dönüştürür."""
+        raw = self._raw_row(record)
+        missing = np.isnan(raw)
+        if missing.any():
+            raw = np.where(missing, self._fill, raw)
+
+        if out is None:
+            out = np.zeros(self.n_features, dtype=np.float64)
+        else:
+            out.fill(0.0)
+        out[self._pass_out] = raw[self._pass_src]
+        out[self._hot_out] = raw[self._hot_src] == self._hot_val
+        return out
+
+    def encode_batch(self, records, out=None):
+        """
+        N kaydı tek geçişte (N, n_features) boyutlu matrise dönüştürür.
+
+        Sütunlar bellekte art arda yazılabilsin diye sonuç Fortran sıralıdır
+        (özellik başına bitişik). out verilirse sonuç onun içine yazılır.
+        """
+        raw_t = np.ascontiguousarray(self._raw_matrix(records).T)
+        missing = np.isnan(raw_t)
+        if missing.any():
+            raw_t = np.where(missing, self._fill[:, np.newaxis], raw_t)
+
+        n_rows = raw_t.shape[1]
+        if out is None:
+            out_t = np.empty((self.n_features, n_rows), dtype=np.float64)
+        else:
+            out_t = out[:n_rows].T
+
+        for out_idx, src_idx in zip(self._pass_out, self._pass_src):
+            out_t[out_idx] = raw_t[src_idx]
+        for out_idx, src_idx, value in zip(self._hot_out, self._hot_src, self._hot_val):
+            np.equal(raw_t[src_idx], value, out=out_t[out_idx])
+        out_t[self._zero_out] = 0.0
+        return out_t.T
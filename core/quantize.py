@@ -0,0 +1,71 @@
+"""
+Ağaç modelleri için girdinin 8 bitlik kodlara indirgenmesi.
+
+Bir ağaç düğümü yalnızca x'in eşiğe göre hangi tarafta olduğuna bakar. Bir özelliğin
+ağaçlardaki tüm eşikleri sıralı kenarlar (e_0 < e_1 < ...) olarak tutulursa x yerine
+kendisinden küçük kenarların sayısı (kod) kullanılabilir:
+
+    x <= e_j  <=>  kod(x) <= j
+
+Özellik başına en fazla MAX_EDGES kenar bir uint8'e sığar; MISSING_CODE eksik değerdir.
+Daha fazla farklı eşiği olan özelliklerde kenarlar eşiklerin yüzdeliklerinden seçilir ve
+her eşik en yakın kenara taşınır; bu özelliklerde kararlar yaklaşıktır.
+
+Kategorik özellikler (gradyan artırma) kenar yerine doğrudan kategori numarasıyla kodlanır.
+"""
+import numpy as np
+
+# Eksik (ya da geçersiz kategori) değerin kodu; eşik kodları bundan küçüktür
+MISSING_CODE = 255
+MAX_EDGES = 254
+
+
+def is_missing(values):
+    """Kayan noktalı girdide NaN, kodlanmış girdide MISSING_CODE."""
+    if values.dtype == np.uint8:
+        return values == MISSING_CODE
+    return np.isnan(values)
+
+
+def threshold_edges(feature, threshold, split, n_features, categorical=(), max_edges=MAX_EDGES):
+    """
+    Özellik başına sıralı kenarlar (kategorik özelliklerde None), her düğümün eşik kodu
+    (uint8; yapraklarda ve kategorik düğümlerde 0) ve tüm özelliklerin kayıpsız kodlanıp
+    kodlanmadığı.
+    """
+    edges = []
+    codes = np.zeros(len(threshold), dtype=np.uint8)
+    exact = True
+    for j in range(n_features):
+        if j in categorical:
+            edges.append(None)
+            continue
+        nodes = np.flatnonzero(split & (feature == j))
+        values = np.unique(threshold[nodes])
+        if len(values) <= max_edges:
+            codes[nodes] = np.searchsorted(values, threshold[nodes])
+        else:
+            exact = False
+            values = np.unique(np.quantile(values, np.linspace(0.0, 1.0, max_edges), method='nearest'))
+            # En yakın kenar
+            right = np.clip(np.searchsorted(values, threshold[nodes]), 1, len(values) - 1)
+            nearer_left = threshold[nodes] - values[right - 1] <= values[right] - threshold[nodes]
+            codes[nodes] = np.where(nearer_left, right - 1, right)
+        edges.append(values)
+    return edges, codes, exact
+
+
+def quantize(X, edges, out=None):
+    """(satır, özellik) girdiyi uint8 kodlara dönüştürür."""
+    if out is None:
+        out = np.zeros(X.shape, dtype=np.uint8)
+    for j, column_edges in enumerate(edges):
+        column = X[:, j]
+        if column_edges is None:
+            # Kategori numarası; negatif, çok büyük ya da eksik değerler eksik sayılır
+            invalid = ~((column >= 0) & (column < MISSING_CODE))
+            out[:, j] = np.where(invalid, MISSING_CODE, column)
+        else:
+            out[:, j] = np.searchsorted(column_edges, column)
+            out[np.isnan(column), j] = MISSING_CODE
+    return out
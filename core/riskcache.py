@@ -0,0 +1,241 @@
+"""
+Tahmin sonuçlarının süreç geneli önbelleği.
+
+Tahmin formunun girdi uzayı küçüktür (tam sayı yaş, kategorik kodlar, 0.1 adımlı ST
+depresyonu) ve aynı kayıtlar tekrar tekrar gönderilir. Her kayıt RAW_FEATURES sırasındaki
+11 alanlık bir demete indirilir (45 ile 45.0 aynı anahtardır, eksik değer None olur) ve
+modelin sürümüyle birlikte anahtar olarak kullanılır; sonuç olarak kalp hastalığı olasılığı
+saklanır.
+
+Model sürümü model seçeneği, hiperparametreler, veri özeti ve modelin içeriğinin özetinden
+(joblib.hash) oluşur. Veri ya da model dosyası (ör. python -m core.train ile) değiştiğinde
+kayıt defteri yeni bir model döndürür (anahtarında dosyanın mtime/boyut damgası vardır),
+sürüm değişir ve o modelin eski sürüme ait girdileri (bellekte ve diskte) silinir.
+
+Bellekteki girdiler sayı sınırına göre en uzun süredir kullanılmayan sırayla (LRU) ve
+ttl saniyeden eskiyse atılır. path verilirse sonuçlar ayrıca bir SQLite dosyasına yazılır;
+bellekte bulunmayan anahtarlar önce bu dosyada aranır, böylece sonuçlar süreç yeniden
+başlatıldığında da kullanılır. Süreç geneli önbellek PREDICTION_CACHE_PATH ortam değişkeni
+verilmişse o dosyayı kullanır.
+"""
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+
+from core.models import params_key
+from core.preprocessing import RAW_FEATURES
+
+DEFAULT_MAX_ENTRIES = 100_000
+DEFAULT_TTL = 24 * 60 * 60
+
+# Kayan noktalı alanlar bu kadar ondalığa yuvarlanır (form 0.1 adımlıdır; 1.2000000000000002 -> 1.2)
+CANONICAL_DECIMALS = 6
+
+_versions = weakref.WeakKeyDictionary()
+_versions_lock = threading.Lock()
+
+
+def canonical_record(record):
+    """Kaydın RAW_FEATURES sırasındaki 11 alanlık anahtarı; eksik alan KeyError verir."""
+    values = []
+    for name in RAW_FEATURES:
+        value = record[name]
+        if value is None:
+            values.append(None)
+            continue
+        value = float(value)
+        if math.isnan(value):
+            values.append(None)
+        elif value.is_integer():
+            values.append(int(value))
+        else:
+            values.append(round(value, CANONICAL_DECIMALS))
+    return tuple(values)
+
+
+def model_version(trained):
+    """Modelin sürüm dizgesi (model nesnesi başına bir kez hesaplanır)."""
+    import joblib
+
+    with _versions_lock:
+        digest = _versions.get(trained.model)
+        if digest is None:
+            digest = joblib.hash(trained.model)
+            _versions[trained.model] = digest
+    return f"{trained.model_option}|{params_key(trained.params)}|{trained.fingerprint}|{digest}"
+
+
+class PredictionCache:
+    """(model sürümü, kanonik kayıt) -> olasılık; sayı ve süre sınırlı LRU, isteğe bağlı SQLite."""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, ttl=DEFAULT_TTL, path=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.path = path
+        self._entries = OrderedDict()  # (sürüm, kayıt) -> (olasılık, yazılma zamanı)
+        self._current = {}  # model seçeneği -> güncel sürüm
+        self._lock = threading.Lock()
+        self._db = None
+        if path is not None:
+            self._open(path)
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.lookup_seconds = 0.0
+        self.compute_seconds = 0.0
+
+    def _open(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Bağlantı tüm iş parçacıklarınca kilit altında kullanılır
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS predictions ('
+            ' model TEXT NOT NULL, version TEXT NOT NULL, record TEXT NOT NULL,'
+            ' probability REAL NOT NULL, stored_at REAL NOT NULL,'
+            ' PRIMARY KEY (version, record))'
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS predictions_stored_at ON predictions (stored_at)')
+
+    def key(self, trained, record):
+        version = model_version(trained)
+        if self._current.get(trained.model_option) != version:
+            self._retire(trained.model_option, version)
+        return version, canonical_record(record)
+
+    def _retire(self, model_option, version):
+        """Modelin güncel sürümünü kaydeder, eski sürümlerin girdilerini siler."""
+        with self._lock:
+            if self._current.get(model_option) == version:
+                return
+            prefix = f"{model_option}|"
+            for key in [k for k in self._entries if k[0].startswith(prefix) and k[0] != version]:
+                del self._entries[key]
+            if self._db is not None:
+                self._db.execute('DELETE FROM predictions WHERE model = ? AND version != ?', (model_option, version))
+            self._current[model_option] = version
+
+    def _expired(self, stored_at, now):
+        return self.ttl is not None and now - stored_at > self.ttl
+
+    def _get_locked(self, key, now):
+        entry = self._entries.get(key)
+        if entry is not None:
+            if not self._expired(entry[1], now):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            del self._entries[key]
+            self.expirations += 1
+
+        if self._db is not None:
+            version, record = key
+            row = self._db.execute('SELECT probability, stored_at FROM predictions WHERE version = ? AND record = ?',
+                                   (version, json.dumps(record))).fetchone()
+            if row is not None and not self._expired(row[1], now):
+                self._insert_locked(key, row[0], row[1])
+                self.disk_hits += 1
+                return row[0]
+
+        self.misses += 1
+        return None
+
+    def _insert_locked(self, key, probability, stored_at):
+        self._entries[key] = (probability, stored_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key):
+        """Önbellekteki olasılık; yoksa ya da süresi dolmuşsa None."""
+        return self.get_many([key])[0]
+
+    def get_many(self, keys):
+        """Anahtarların olasılıkları; bulunmayanlar None."""
+        start = time.perf_counter()
+        now = time.time()
+        with self._lock:
+            values = [self._get_locked(key, now) for key in keys]
+            self.lookup_seconds += time.perf_counter() - start
+        return values
+
+    def put(self, key, probability):
+        self.put_many([key], [probability])
+
+    def put_many(self, keys, probabilities):
+        now = time.time()
+        with self._lock:
+            for key, probability in zip(keys, probabilities):
+                self._insert_locked(key, float(probability), now)
+            if self._db is not None:
+                self._db.execute('BEGIN')
+                self._db.executemany(
+                    'INSERT OR REPLACE INTO predictions VALUES (?, ?, ?, ?, ?)',
+                    [(version.partition('|')[0], version, json.dumps(record), float(probability), now)
+                     for (version, record), probability in zip(keys, probabilities)])
+                if self.ttl is not None:
+                    self._db.execute('DELETE FROM predictions WHERE stored_at < ?', (now - self.ttl,))
+                self._db.execute('COMMIT')
+
+    def record_compute(self, seconds):
+        """Önbellekte bulunamayan kayıtların puanlanma süresini sayaçlara ekler."""
+        with self._lock:
+            self.compute_seconds += seconds
+
+    def predict(self, trained, records, keys=None):
+        """
+        Kayıtların (sözlük listesi) kalp hastalığı olasılıkları. Önbellekte bulunmayanlar
+        tek bir predict_proba çağrısıyla puanlanıp önbelleğe eklenir.
+        """
+        if keys is None:
+            keys = [self.key(trained, record) for record in records]
+        values = self.get_many(keys)
+        missing = [i for i, value in enumerate(values) if value is None]
+        probabilities = np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+        if missing:
+            start = time.perf_counter()
+            scored = trained.predict_proba(trained.encode([records[i] for i in missing]))[:, 1]
+            self.record_compute(time.perf_counter() - start)
+            probabilities[missing] = scored
+            self.put_many([keys[i] for i in missing], scored)
+        return probabilities
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._current.clear()
+            if self._db is not None:
+                self._db.execute('DELETE FROM predictions')
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'mean_lookup_ms': 1000 * self.lookup_seconds / lookups if lookups else 0.0,
+                'mean_compute_ms': 1000 * self.compute_seconds / self.misses if self.misses else 0.0,
+            }
+
+
+# Süreç geneli önbellek; tüm oturumlar ve servis istekleri paylaşır
+prediction_cache = PredictionCache(path=os.environ.get('PREDICTION_CACHE_PATH') or None)
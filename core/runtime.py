@@ -0,0 +1,257 @@
+"""
+core.portable ile dışa aktarılmış modellerin yalnızca NumPy ile çalıştırılması.
+
+Bu modül pandas, scikit-learn ya da Streamlit içe aktarmaz; kiosklarda ve toplu iş
+sunucularında yalnızca NumPy, core/runtime.py, core/forest.py ve core/sensitivity.py ile
+çalışır. Dosyadaki kodlayıcı dizileri ham kayıtları FeatureEncoder ile aynı sütunlara,
+ölçekleyici dizileri StandardScaler ile aynı değerlere dönüştürür; model dizileri
+modelin türüne göre (lojistik, orman, RBF SVM, gradyan artırma) değerlendirilir.
+
+Duyarlık model başına yükleme sırasında seçilir (dosya değişmez):
+- 'float64': scikit-learn ile aynı sonuç (varsayılan)
+- 'float32': girdi, katsayılar, destek vektörleri ve yaprak değerleri float32; ağaç
+  eşikleri float32'ye aşağı yuvarlandığı için ağaç kararları değişmez
+- 'int8': yalnızca ağaç modelleri; girdi özellik başına eşik kenarlarına göre uint8
+  kodlara indirilir (core.quantize)
+
+Kullanım:
+    from core.runtime import load_portable
+    model = load_portable('artifacts/portable/rastgele_orman.npz', precision='int8')
+    risk = model.predict_risk([{'Yaş': 45, 'Cinsiyet': 1, ...}])
+"""
+import json
+
+import numpy as np
+
+from core.forest import CHUNK_ROWS, FlatForest, float32_thresholds
+from core.quantize import MISSING_CODE, is_missing, quantize, threshold_edges
+from core.sensitivity import rbf_decision
+
+# Dosya biçiminin adı ve sürümü; biçim değiştiğinde sürüm artırılır, eski dosyalar yüklenmez
+FORMAT_NAME = 'kalp-riski-tasinabilir-model'
+FORMAT_VERSION = 2
+
+# Model türü -> desteklenen duyarlıklar
+PRECISIONS = {
+    'lojistik': ('float64', 'float32'),
+    'orman': ('float64', 'float32', 'int8'),
+    'rbf_svm': ('float64', 'float32'),
+    'gradyan_artirma': ('float64', 'float32', 'int8'),
+}
+
+
+def _expit(x):
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+def _two_columns(positive):
+    return np.column_stack([1.0 - positive, positive])
+
+
+class _Logistic:
+    def __init__(self, arrays, precision):
+        dtype = np.float64 if precision == 'float64' else np.float32
+        self.coef = arrays['lr_coef'].astype(dtype)  # (1, özellik)
+        self.intercept = arrays['lr_intercept'].astype(dtype)
+
+    def predict_proba(self, X):
+        # LogisticRegression.predict_proba (ikili): expit(X @ coef.T + intercept)
+        return _two_columns(_expit((X @ self.coef.T + self.intercept).ravel()))
+
+
+class _Forest:
+    def __init__(self, arrays, precision):
+        self.flat = FlatForest(
+            arrays['rf_feature'], arrays['rf_threshold'], arrays['rf_children'], arrays['rf_missing_left'],
+            arrays['rf_value'], arrays['rf_roots'], int(arrays['rf_depth']), arrays['rf_classes'])
+        if precision != 'float64':
+            self.flat = self.flat.reduced(precision)
+
+    def predict_proba(self, X):
+        return self.flat.predict_proba(X)
+
+
+class _SigmoidSVM:
+    def __init__(self, arrays, precision):
+        # Kalibre edilmiş her SVC için bir parça (CalibratedClassifierCV olasılıkların ortalamasını alır)
+        dtype = np.float64 if precision == 'float64' else np.float32
+        sections = np.cumsum(arrays['svm_sizes'])[:-1]
+        self.support = np.split(arrays['svm_support'].astype(dtype), sections)
+        self.dual_coef = np.split(arrays['svm_dual_coef'].astype(dtype), sections)
+        self.intercept = arrays['svm_intercept']
+        self.gamma = arrays['svm_gamma']
+        self.sigmoid = arrays['svm_sigmoid']  # (svc, 2): a, b
+
+    def predict_proba(self, X):
+        probas = []
+        for i in range(len(self.intercept)):
+            # Python float'ları float32 çekirdek matrisini float64'e yükseltmez
+            decision = rbf_decision(X, self.support[i], self.dual_coef[i], float(self.intercept[i]),
+                                    float(self.gamma[i]))
+            a, b = self.sigmoid[i]
+            probas.append(_two_columns(_expit(-(a * decision + b))))
+        return np.mean(probas, axis=0)
+
+
+class _HistGradientBoosting:
+    def __init__(self, arrays, precision):
+        # Girdi sütunları ağaçların gördüğü sıraya yazılır; kategori kodları eğitimdeki
+        # kategorilerin (sıralı) listesindeki sıra numarasına çevrilir, bilinmeyen kodlar eksiktir
+        self.positions = arrays['hgb_positions']
+        self.category_columns = arrays['hgb_category_columns']
+        self.categories = np.split(arrays['hgb_category_values'], np.cumsum(arrays['hgb_category_sizes'])[:-1])
+
+        self.feature = arrays['hgb_feature']
+        self.threshold = arrays['hgb_threshold']
+        self.children = arrays['hgb_children']  # 2i sol, 2i + 1 sağ, yapraklarda i
+        self.missing_left = arrays['hgb_missing_left']
+        self.is_categorical = arrays['hgb_is_categorical']
+        self.bitset = arrays['hgb_bitset']  # düğüm başına sola giden kategoriler (8 x 32 bit)
+        self.known = arrays['hgb_known_bitset']  # özellik başına eğitimde görülen kategoriler
+        self.value = arrays['hgb_value']
+        self.roots = arrays['hgb_roots']
+        self.depth = int(arrays['hgb_depth'])
+        self.baseline = float(arrays['hgb_baseline'])
+
+        self.dtype = np.float64
+        self.edges = None
+        if precision != 'float64':
+            self.dtype = np.float32
+            self.value = self.value.astype(np.float32)
+            self.threshold = float32_thresholds(self.threshold)
+        if precision == 'int8':
+            split = self.children[::2] != np.arange(len(self.feature))
+            self.edges, self.threshold, _ = threshold_edges(
+                self.feature, self.threshold, split & ~self.is_categorical, len(self.positions),
+                categorical=set(self.positions[self.category_columns].tolist()))
+
+    def _ordered(self, X):
+        out = np.empty((len(X), len(self.positions)), dtype=self.dtype)
+        out[:, self.positions] = X
+        for column, categories in zip(self.category_columns, self.categories):
+            codes = X[:, column]
+            index = np.minimum(np.searchsorted(categories, codes), len(categories) - 1)
+            out[:, self.positions[column]] = np.where(categories[index] == codes, index, np.nan)
+        return out
+
+    @staticmethod
+    def _in_bitset(bitsets, rows, codes):
+        return (bitsets[rows, codes >> 5] >> (codes & 31)) & 1 == 1
+
+    def _leaves(self, X):
+        """Tüm ağaçlar satırlar üzerinde aynı anda dolaşılır (core.forest gibi)."""
+        n_rows, n_features = X.shape
+        n_trees = len(self.roots)
+        flat = X.ravel()
+        base = np.repeat(np.arange(n_rows, dtype=np.intp) * n_features, n_trees)
+        nodes = np.tile(self.roots, n_rows)
+        for _ in range(self.depth):
+            feature = self.feature[nodes]
+            x = flat[base + feature]
+            go_left = x <= self.threshold[nodes]
+
+            # Kategorik düğümler: sola giden kümede ise sol, eğitimde görülmüşse sağ, değilse eksik
+            categorical = self.is_categorical[nodes]
+            if categorical.any():
+                cat_x = x[categorical]
+                valid = (cat_x >= 0) & (cat_x < MISSING_CODE)
+                codes = np.where(valid, cat_x, 0).astype(np.intp)
+                left = self._in_bitset(self.bitset, nodes[categorical], codes)
+                known = self._in_bitset(self.known, feature[categorical], codes)
+                missing = ~valid | (~left & ~known)
+                go_left[categorical] = np.where(missing, self.missing_left[nodes[categorical]], left)
+
+            missing = is_missing(x)
+            go_left[missing] = self.missing_left[nodes[missing]]
+            nodes = self.children[2 * nodes + ~go_left]
+        return nodes.reshape(n_rows, n_trees)
+
+    def predict_proba(self, X):
+        raw = np.full(len(X), self.baseline, dtype=self.value.dtype)
+        for start in range(0, len(X), CHUNK_ROWS):
+            ordered = self._ordered(X[start:start + CHUNK_ROWS])
+            leaves = self._leaves(ordered if self.edges is None else quantize(ordered, self.edges))
+            # HistGradientBoostingClassifier gibi: başlangıç değerine iterasyon sırasıyla eklenir
+            chunk = raw[start:start + CHUNK_ROWS]
+            for tree in range(leaves.shape[1]):
+                chunk += self.value[leaves[:, tree]]
+        return _two_columns(_expit(raw))
+
+
+KINDS = {
+    'lojistik': _Logistic,
+    'orman': _Forest,
+    'rbf_svm': _SigmoidSVM,
+    'gradyan_artirma': _HistGradientBoosting,
+}
+
+
+class PortableModel:
+    """Dışa aktarılmış bir model: kodlayıcı, ölçekleyici ve tahminci."""
+
+    def __init__(self, meta, arrays, precision='float64'):
+        if precision not in PRECISIONS[meta['kind']]:
+            raise ValueError(f"{meta['model_option']} için desteklenmeyen duyarlık: {precision} "
+                             f"(desteklenenler: {', '.join(PRECISIONS[meta['kind']])})")
+        self.meta = meta
+        self.precision = precision
+        self.dtype = np.float64 if precision == 'float64' else np.float32
+        self.model_option = meta['model_option']
+        self.fingerprint = meta['fingerprint']
+        self.feature_names = meta['feature_names']
+        self.raw_features = meta['raw_features']
+        self.metrics = meta.get('metrics', {})
+
+        self._pass_out = arrays['enc_pass_out']
+        self._pass_src = arrays['enc_pass_src']
+        self._hot_out = arrays['enc_hot_out']
+        self._hot_src = arrays['enc_hot_src']
+        self._hot_val = arrays['enc_hot_val']
+        self._fill = arrays['enc_fill']
+        self.mean = arrays['scaler_mean'].astype(self.dtype)
+        self.scale = arrays['scaler_scale'].astype(self.dtype)
+        self.estimator = KINDS[meta['kind']](arrays, precision)
+
+    def _raw_matrix(self, records):
+        if hasattr(records, 'columns'):  # DataFrame (pandas içe aktarılmadan)
+            return np.asarray(records[self.raw_features], dtype=np.float64)
+        if isinstance(records, dict):
+            records = [records]
+        if isinstance(records, (list, tuple)) and records and isinstance(records[0], dict):
+            return np.array([[r[name] for name in self.raw_features] for r in records], dtype=np.float64)
+        return np.asarray(records, dtype=np.float64).reshape(-1, len(self.raw_features))
+
+    def transform(self, X):
+        return (np.asarray(X, dtype=self.dtype) - self.mean) / self.scale
+
+    def encode(self, records):
+        """Ham kayıtları (sözlük, sözlük listesi, RAW_FEATURES sıralı dizi) ölçeklenmiş model girdisine dönüştürür."""
+        raw = self._raw_matrix(records)
+        missing = np.isnan(raw)
+        if missing.any():
+            raw = np.where(missing, self._fill, raw)
+        X = np.zeros((len(raw), len(self.feature_names)), dtype=self.dtype)
+        X[:, self._pass_out] = raw[:, self._pass_src]
+        X[:, self._hot_out] = raw[:, self._hot_src] == self._hot_val
+        return self.transform(X)
+
+    def predict_proba(self, X_scaled):
+        return self.estimator.predict_proba(np.atleast_2d(np.asarray(X_scaled, dtype=self.dtype)))
+
+    def predict_risk(self, records):
+        """Her kayıt için kalp hastalığı olasılığı."""
+        return self.predict_proba(self.encode(records))[:, 1]
+
+
+def load_portable(path, precision='float64'):
+    """
+    core.portable.export_model ile yazılmış dosyayı verilen duyarlıkla yükler; biçim
+    uyuşmuyorsa ya da duyarlık model türünce desteklenmiyorsa ValueError.
+    """
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {name: data[name] for name in data.files}
+    meta = json.loads(arrays.pop('meta').tobytes().decode('utf-8'))
+    if meta.get('format') != FORMAT_NAME or meta.get('format_version') != FORMAT_VERSION:
+        raise ValueError(f"{path}: desteklenmeyen dosya biçimi "
+                         f"({meta.get('format')} sürüm {meta.get('format_version')})")
+    return PortableModel(meta, arrays, precision)
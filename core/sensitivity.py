@@ -0,0 +1,221 @@
+"""
+Tek bir hasta için duyarlılık (what-if) analizi.
+
+Hastanın kaydı bir kez kodlanıp ölçeklenir; seçilen bir ya da iki sayısal özelliğin
+ızgarasındaki tüm değerler bu satırın kopyalarına yazılarak tek bir matris oluşturulur
+ve risk tek bir tahmin çağrısıyla hesaplanır. 200x200'lük iki özellikli bir ızgara
+(40.000 satır) böylece sayfa yeniden eğitim ya da form tekrar gönderilmeden puanlanır.
+
+Ağaç modellerinde taranan sütunun iki değeri, ağaçların o sütundaki eşiklerinin aynı
+aralığına düşüyorsa her ağaçta aynı yaprağa gider; ızgaranın yalnızca farklı aralıklardaki
+noktaları puanlanıp sonuç tüm ızgaraya yayılır. RBF SVM'de çekirdek, taranan sütunların
+çarpanlarına ayrılır: exp(-γ||x - sv||²) sabit sütunların ve her taranan sütunun
+terimlerinin çarpımıdır, böylece 40.000 x destek vektörü üstel yerine 2 x 200 x destek
+vektörü üstel hesaplanır. Her iki yol da ızgaranın satır satır puanlanmasıyla aynı riski
+verir; hedef, her model için 200x200 ızgarada 200 ms'nin altıdır
+(benchmarks/bench_sensitivity.py).
+"""
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+
+import numpy as np
+
+from core import forest
+
+# Taranabilen özellikler ve tahmin formundaki sınırları
+SWEEP_FEATURES = {
+    'Kolesterol': (100, 600),
+    'İstirahatKanBasıncı': (80, 200),
+    'MaksimumKalpHızı': (60, 220),
+}
+
+# Özellik başına ızgara noktası sayısı
+DEFAULT_STEPS = 200
+
+# RBF çekirdek matrisi bu kadar satırlık parçalar halinde hesaplanır (~10 MB)
+KERNEL_CHUNK_ROWS = 4096
+
+
+@dataclass
+class SensitivityResult:
+    """Izgara değerleri ve her ızgara noktasındaki kalp hastalığı riski."""
+    features: list
+    grids: list
+    risk: np.ndarray  # (len(grids[0]),) ya da (len(grids[0]), len(grids[1]))
+    baseline: float
+    seconds: float
+
+
+def sweep_grid(feature, steps=DEFAULT_STEPS, value_range=None):
+    low, high = value_range if value_range is not None else SWEEP_FEATURES[feature]
+    return np.linspace(low, high, steps)
+
+
+def sweep_matrix(trained, record, features, grids):
+    """
+    Izgaranın her noktası için ölçeklenmiş model girdisi (satırlar ilk özelliğe göre
+    dış, ikinciye göre iç döngü sırasındadır). Yalnızca taranan sütunlar yeniden ölçeklenir.
+    """
+    columns = [trained.encoder.column_index(feature) for feature in features]
+    return _grid_rows(_base_row(trained, record), columns, _scaled_grids(trained, columns, grids))
+
+
+def _base_row(trained, record):
+    return trained.transform(trained.encoder.encode(record)[np.newaxis, :])[0]
+
+
+def _scaled_grids(trained, columns, grids):
+    return [(np.asarray(grid, dtype=np.float64) - trained.scaler.mean_[col]) / trained.scaler.scale_[col]
+            for col, grid in zip(columns, grids)]
+
+
+def _grid_rows(base, columns, values):
+    """base satırının kopyaları; columns sütunlarına values ızgarasının noktaları (ij sırası) yazılır."""
+    mesh = np.meshgrid(*values, indexing='ij')
+    X = np.empty((mesh[0].size, base.size), dtype=np.float64)
+    X[:] = base
+    for col, column_values in zip(columns, mesh):
+        X[:, col] = column_values.ravel()
+    return X
+
+
+_thresholds = weakref.WeakKeyDictionary()
+_thresholds_lock = threading.Lock()
+
+
+def split_thresholds(model, column):
+    """
+    Ağaç modelinin column sütununda kullandığı eşikler (sıralı, tekil) ve karşılaştırmanın
+    yapıldığı tip; model eşikleri okunabilen bir ağaç modeli değilse None. Model başına
+    bir kez hesaplanır.
+    """
+    with _thresholds_lock:
+        cached = _thresholds.setdefault(model, {})
+        if column not in cached:
+            flat = forest.compile_forest(model)
+            if flat is not None:
+                # Orman girdiyi float32'de karşılaştırır (core.forest)
+                thresholds = flat.threshold[~flat.is_leaf & (flat.feature == column)]
+                cached[column] = np.unique(thresholds), np.float32
+            elif hasattr(model, 'numeric_thresholds'):
+                cached[column] = model.numeric_thresholds(column), np.float64
+            else:
+                cached[column] = None
+        return cached[column]
+
+
+def _distinct_points(model, columns, values):
+    """
+    Her taranan sütun için ağaçlarda ayırt edilebilen değerler ve ızgaradaki her noktanın
+    bu değerlerdeki sırası; model bir ağaç modeli değilse None.
+    """
+    distinct, index = [], []
+    for col, column_values in zip(columns, values):
+        split = split_thresholds(model, col)
+        if split is None:
+            return None
+        thresholds, dtype = split
+        # x <= t karşılaştırmaları, x'ten küçük eşik sayısı aynı olan değerlerde aynıdır
+        interval = np.searchsorted(thresholds, column_values.astype(dtype), side='left')
+        _, first, inverse = np.unique(interval, return_index=True, return_inverse=True)
+        distinct.append(column_values[first])
+        index.append(inverse)
+    return distinct, index
+
+
+def _rbf_svc(model):
+    """
+    Sigmoid ile kalibre edilmiş RBF çekirdekli SVC ise (svc, kalibratörler) döner.
+    libsvm tahmini tek çekirdekte satır satır çalışır; bu modeller için karar
+    fonksiyonu aşağıda matris çarpımıyla hesaplanır.
+    """
+    calibrated = getattr(model, 'calibrated_classifiers_', None)
+    if not calibrated:
+        return None
+    pairs = []
+    for classifier in calibrated:
+        svc = getattr(classifier.estimator, 'estimator', classifier.estimator)  # FrozenEstimator
+        if getattr(svc, 'kernel', None) != 'rbf' or len(classifier.calibrators) != 1:
+            return None
+        pairs.append((svc, classifier.calibrators[0]))
+    return pairs
+
+
+def rbf_decision(X, support, dual_coef, intercept, gamma):
+    """İkili RBF SVC'nin karar fonksiyonu (yalnızca NumPy; core.runtime de kullanır)."""
+    # ||x - sv||² = ||x||² + ||sv||² - 2 x·sv; karar = K @ dual_coef + intercept
+    support_sq = np.einsum('ij,ij->i', support, support)
+    decision = np.empty(len(X), dtype=np.float64)
+    for start in range(0, len(X), KERNEL_CHUNK_ROWS):
+        chunk = X[start:start + KERNEL_CHUNK_ROWS]
+        dist = np.einsum('ij,ij->i', chunk, chunk)[:, np.newaxis] + support_sq - 2.0 * (chunk @ support.T)
+        np.maximum(dist, 0.0, out=dist)
+        np.exp(-gamma * dist, out=dist)
+        decision[start:start + len(chunk)] = dist @ dual_coef + intercept
+    return decision
+
+
+def _rbf_decision(svc, X):
+    return rbf_decision(X, svc.support_vectors_, svc.dual_coef_[0], svc.intercept_[0], svc._gamma)
+
+
+def _rbf_grid_decision(svc, base, columns, values):
+    """
+    Izgaranın tüm noktalarında karar fonksiyonu, (len(values[0]), ...) boyutunda.
+    exp(-γ||x - sv||²), sabit sütunların ve her taranan sütunun üstellerinin çarpımıdır.
+    """
+    support, gamma = svc.support_vectors_, svc._gamma
+    fixed = np.ones(base.size, dtype=bool)
+    fixed[columns] = False
+    weight = svc.dual_coef_[0] * np.exp(-gamma * ((support[:, fixed] - base[fixed]) ** 2).sum(axis=1))
+
+    factors = [np.exp(-gamma * (column_values[:, np.newaxis] - support[:, col]) ** 2)
+               for col, column_values in zip(columns, values)]
+    if len(factors) == 1:
+        return factors[0] @ weight + svc.intercept_[0]
+    return (factors[0] * weight) @ factors[1].T + svc.intercept_[0]
+
+
+def predict_risk(model, X):
+    """Her satır için kalp hastalığı olasılığı (predict_proba(X)[:, 1] ile aynı)."""
+    pairs = _rbf_svc(model)
+    if pairs is None:
+        return forest.predict_proba(model, X)[:, 1]
+    # CalibratedClassifierCV.predict_proba gibi: kalibre edilmiş olasılıkların ortalaması
+    return np.mean([calibrator.predict(_rbf_decision(svc, X)) for svc, calibrator in pairs], axis=0)
+
+
+def sensitivity_sweep(trained, record, features, steps=DEFAULT_STEPS, ranges=None):
+    """
+    Kaydın bir ya da iki özelliği ızgara boyunca değiştirildiğinde modelin verdiği riski
+    hesaplar. ranges, özellik -> (alt, üst) sözlüğüdür; verilmezse form sınırları kullanılır.
+    """
+    if not 1 <= len(features) <= 2:
+        raise ValueError("Duyarlılık analizi bir ya da iki özellik için yapılır")
+    ranges = ranges or {}
+
+    start = time.perf_counter()
+    grids = [sweep_grid(feature, steps, ranges.get(feature)) for feature in features]
+    columns = [trained.encoder.column_index(feature) for feature in features]
+    base = _base_row(trained, record)
+    values = _scaled_grids(trained, columns, grids)
+
+    shape = [len(grid) for grid in grids]
+    pairs = _rbf_svc(trained.model)
+    points = None if pairs is not None else _distinct_points(trained.model, columns, values)
+    if pairs is not None:
+        # predict_risk gibi: kalibre edilmiş olasılıkların ortalaması
+        risk = np.mean([calibrator.predict(_rbf_grid_decision(svc, base, columns, values).ravel())
+                        for svc, calibrator in pairs], axis=0).reshape(shape)
+    elif points is not None:
+        distinct, index = points
+        risk = predict_risk(trained.model, _grid_rows(base, columns, distinct))
+        risk = risk.reshape([len(column_values) for column_values in distinct])[np.ix_(*index)]
+    else:
+        risk = predict_risk(trained.model, _grid_rows(base, columns, values)).reshape(shape)
+    seconds = time.perf_counter() - start
+
+    baseline = float(predict_risk(trained.model, trained.encode([record]))[0])
+    return SensitivityResult(list(features), grids, risk, baseline, seconds)
@@ -0,0 +1,330 @@
+"""
+Tahmin modellerini HTTP/JSON üzerinden sunan hafif, asenkron servis.
+
+Streamlit sayfasıyla aynı ön işleme, ölçekleyici ve model kayıt defterini kullanır;
+modeller süreç boyunca bellekte kalır. Aynı anda gelen tek kayıtlık istekler kısa
+bir süre (varsayılan 2 ms) biriktirilip tek bir predict_proba çağrısıyla puanlanır.
+Daha önce puanlanmış kayıtların sonuçları sayfayla ortak tahmin önbelleğinden
+(core.riskcache) verilir; önbellek sayaçları /health yanıtındadır. Aşama süreleri
+(core.metrics) açıksa /metrics Prometheus metin biçiminde döndürülür.
+
+Uç noktalar:
+    GET  /health
+    GET  /metrics
+    POST /predict        {"model": "Rastgele Orman", "record": {"Yaş": 45, ...}}
+    POST /predict/batch  {"model": "Rastgele Orman", "records": [{...}, ...]}
+
+Kullanım:
+    python -m core.service --host 127.0.0.1 --port 8000
+"""
+import argparse
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+
+import numpy as np
+
+from core.batch import HIGH_RISK_LABEL, LOW_RISK_LABEL, RISK_THRESHOLD
+from core.metrics import metrics
+from core.models import DEFAULT_MODEL_OPTION, MODEL_OPTIONS, get_trained_model
+from core.riskcache import prediction_cache
+
+# Bir istek gövdesinin izin verilen en büyük boyutu (bayt)
+MAX_BODY_SIZE = 16 * 1024 * 1024
+
+
+class RequestError(Exception):
+    """İstemciye 4xx olarak döndürülen hata."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _content_length(headers):
+    """Content-Length başlığı; sayı değilse ya da negatifse 400, çok büyükse 413 RequestError."""
+    value = headers.get('content-length', '')
+    if not value:
+        return 0
+    if not (value.isascii() and value.isdigit()):
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"Geçersiz Content-Length: {value}")
+    length = int(value)
+    if length > MAX_BODY_SIZE:
+        raise RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "İstek gövdesi çok büyük")
+    return length
+
+
+def _result(model_option, probability):
+    return {
+        'model': model_option,
+        'probability': float(probability),
+        'label': HIGH_RISK_LABEL if probability >= RISK_THRESHOLD else LOW_RISK_LABEL,
+    }
+
+
+class MicroBatcher:
+    """
+    Tek kayıtlık istekleri biriktirip toplu olarak puanlar.
+
+    İlk kayıt geldikten sonra en fazla max_delay saniye ya da max_batch kayıt
+    dolana kadar beklenir, ardından hepsi tek bir matris olarak puanlanır. Her kayıt
+    kodlandığı TrainedModel ile birlikte gönderilir ve o modelle puanlanır; veri dosyası
+    değiştiğinde aynı toplu işte iki model sürümü varsa her biri kendi modeliyle puanlanır.
+    """
+
+    def __init__(self, model_option, executor, max_batch=256, max_delay=0.002):
+        self.model_option = model_option
+        self.executor = executor
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue = asyncio.Queue()
+        self._task = None
+
+    async def submit(self, trained, row):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((trained, row, future))
+        return await future
+
+    @staticmethod
+    def _score(groups):
+        # Model kayıt defterinden yeniden alınmaz; kayıtlar kodlandıkları modelle puanlanır
+        return [trained.predict_proba(trained.transform(np.vstack(rows)))[:, 1] for trained, rows in groups]
+
+    async def _collect(self):
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_delay
+        while len(batch) < self.max_batch:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            groups = {}  # model nesnesi -> (model, satırlar, future'lar)
+            for trained, row, future in batch:
+                _, rows, futures = groups.setdefault(id(trained), (trained, [], []))
+                rows.append(row)
+                futures.append(future)
+            try:
+                scored = await loop.run_in_executor(
+                    self.executor, self._score, [(trained, rows) for trained, rows, _ in groups.values()])
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, _, futures), probabilities in zip(groups.values(), scored):
+                for future, probability in zip(futures, probabilities):
+                    if not future.done():
+                        future.set_result(probability)
+
+
+class PredictionService:
+    """Uç noktaların işlendiği ve toplayıcıların tutulduğu servis nesnesi."""
+
+    def __init__(self, max_batch=256, max_delay=0.002, workers=2):
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._batchers = {}
+
+    async def warm_up(self, model_options):
+        loop = asyncio.get_running_loop()
+        for model_option in model_options:
+            await loop.run_in_executor(self.executor, get_trained_model, model_option)
+
+    def _batcher(self, model_option):
+        batcher = self._batchers.get(model_option)
+        if batcher is None:
+            batcher = MicroBatcher(model_option, self.executor, self.max_batch, self.max_delay)
+            self._batchers[model_option] = batcher
+        return batcher
+
+    async def _trained(self, payload):
+        model_option = payload.get('model', DEFAULT_MODEL_OPTION)
+        if model_option not in MODEL_OPTIONS:
+            raise RequestError(HTTPStatus.BAD_REQUEST, f"Bilinmeyen model: {model_option}")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, get_trained_model, model_option)
+
+    @staticmethod
+    def _keys(trained, records):
+        try:
+            return [prediction_cache.key(trained, record) for record in records]
+        except KeyError as e:
+            raise RequestError(HTTPStatus.BAD_REQUEST, f"Eksik alan: {e.args[0]}")
+        except (TypeError, ValueError) as e:
+            raise RequestError(HTTPStatus.BAD_REQUEST, f"Geçersiz kayıt: {e}")
+
+    @staticmethod
+    def _encode(trained, records):
+        try:
+            return trained.encoder.encode_batch(records)
+        except KeyError as e:
+            raise RequestError(HTTPStatus.BAD_REQUEST, f"Eksik alan: {e.args[0]}")
+        except (TypeError, ValueError) as e:
+            raise RequestError(HTTPStatus.BAD_REQUEST, f"Geçersiz kayıt: {e}")
+
+    async def predict(self, payload):
+        record = payload.get('record')
+        if not isinstance(record, dict):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "'record' alanı bir JSON nesnesi olmalıdır")
+        trained = await self._trained(payload)
+        key, = self._keys(trained, [record])
+        probability = prediction_cache.get(key)
+        if probability is None:
+            row = self._encode(trained, [record])
+            start = time.perf_counter()
+            probability = await self._batcher(trained.model_option).submit(trained, row)
+            prediction_cache.record_compute(time.perf_counter() - start)
+            prediction_cache.put(key, probability)
+        return _result(trained.model_option, probability)
+
+    async def predict_batch(self, payload):
+        records = payload.get('records')
+        if not isinstance(records, list) or not all(isinstance(r, dict) for r in records):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "'records' alanı JSON nesnelerinden oluşan bir liste olmalıdır")
+        trained = await self._trained(payload)
+        if not records:
+            return {'model': trained.model_option, 'results': []}
+
+        keys = self._keys(trained, records)
+        loop = asyncio.get_running_loop()
+        probabilities = await loop.run_in_executor(self.executor, prediction_cache.predict, trained, records, keys)
+        return {
+            'model': trained.model_option,
+            'results': [_result(trained.model_option, p) for p in probabilities],
+        }
+
+    async def dispatch(self, method, path, body):
+        if path == '/health':
+            if method != 'GET':
+                raise RequestError(HTTPStatus.METHOD_NOT_ALLOWED, "Yalnızca GET desteklenir")
+            return {'status': 'ok', 'prediction_cache': prediction_cache.stats()}
+        if path == '/metrics':
+            if method != 'GET':
+                raise RequestError(HTTPStatus.METHOD_NOT_ALLOWED, "Yalnızca GET desteklenir")
+            return metrics.prometheus()
+
+        routes = {'/predict': self.predict, '/predict/batch': self.predict_batch}
+        handler = routes.get(path)
+        if handler is None:
+            raise RequestError(HTTPStatus.NOT_FOUND, f"Bulunamadı: {path}")
+        if method != 'POST':
+            raise RequestError(HTTPStatus.METHOD_NOT_ALLOWED, "Yalnızca POST desteklenir")
+
+        try:
+            payload = json.loads(body or b'{}')
+        except ValueError:
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Geçersiz JSON")
+        if not isinstance(payload, dict):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "İstek gövdesi bir JSON nesnesi olmalıdır")
+        return await handler(payload)
+
+    async def handle_connection(self, reader, writer):
+        """Bir bağlantı üzerindeki HTTP/1.1 isteklerini (keep-alive) sırayla işler."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, path, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = (headers.get('connection', '').lower() != 'close'
+                              and version.upper() == 'HTTP/1.1')
+
+                try:
+                    length = _content_length(headers)
+                except RequestError as e:
+                    # Gövdenin nerede bittiği bilinmediğinden bağlantı kapatılır
+                    status, response = e.status, {'error': e.message}
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length) if length else b''
+                    try:
+                        status, response = HTTPStatus.OK, await self.dispatch(method, path.split('?')[0], body)
+                    except RequestError as e:
+                        status, response = e.status, {'error': e.message}
+                    except Exception as e:
+                        status, response = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': str(e)}
+
+                if isinstance(response, str):
+                    data, content_type = response.encode('utf-8'), 'text/plain; version=0.0.4; charset=utf-8'
+                else:
+                    data = json.dumps(response, ensure_ascii=False).encode('utf-8')
+                    content_type = 'application/json; charset=utf-8'
+                writer.write(
+                    f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host, port, max_batch, max_delay, workers, warm_up=True):
+    service = PredictionService(max_batch=max_batch, max_delay=max_delay, workers=workers)
+    if warm_up:
+        await service.warm_up(MODEL_OPTIONS)
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    print(f"Tahmin servisi http://{host}:{port} adresinde çalışıyor", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kalp hastalığı risk tahmini HTTP servisi.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--max-batch', type=int, default=256,
+                        help="Birleştirilen en fazla tek kayıtlık istek sayısı (1: birleştirme kapalı)")
+    parser.add_argument('--max-delay-ms', type=float, default=2.0,
+                        help="İlk istekten sonra diğer istekler için beklenecek en uzun süre")
+    parser.add_argument('--workers', type=int, default=2, help="Puanlama iş parçacığı sayısı")
+    parser.add_argument('--metrics', action='store_true', help="Aşama sürelerini ölç (GET /metrics)")
+    args = parser.parse_args(argv)
+
+    if args.metrics:
+        metrics.enabled = True
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.max_batch, args.max_delay_ms / 1000, args.workers))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
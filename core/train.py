@@ -0,0 +1,34 @@
+"""
+Uygulamadaki modelleri çevrimdışı eğitip artifacts/ klasörüne kaydeder.
+
+Kullanım:
+    python -m core.train
+    python -m core.train --model "Rastgele Orman" --output artifacts
+"""
+import argparse
+import time
+
+from core.artifacts import ARTIFACT_DIR, save_artifact
+from core.data import DATA_PATH
+from core.models import MODEL_OPTIONS, fit_trained_model
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Modelleri eğitir ve model dosyalarını yazar.")
+    parser.add_argument('--model', action='append', choices=MODEL_OPTIONS,
+                        help="Eğitilecek model (birden fazla verilebilir, varsayılan: hepsi)")
+    parser.add_argument('--data', default=DATA_PATH, help="Eğitim verisi (CSV)")
+    parser.add_argument('--output', default=ARTIFACT_DIR, help="Model dosyalarının yazılacağı klasör")
+    args = parser.parse_args(argv)
+
+    for model_option in args.model or MODEL_OPTIONS:
+        start = time.perf_counter()
+        trained = fit_trained_model(model_option, path=args.data)
+        path = save_artifact(trained, args.output)
+        elapsed = time.perf_counter() - start
+        print(f"{model_option}: doğruluk={trained.metrics['accuracy']:.4f} "
+              f"süre={elapsed:.2f}s -> {path}")
+
+
+if __name__ == '__main__':
+    main()
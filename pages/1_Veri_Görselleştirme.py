@@ -1,9 +1,17 @@
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
 
+from core.aggregates import DIMENSIONS, load_cube
+from core.data import data_fingerprint, load_data
+from core.derived import derived_column
+from core.figures import show_chart
+from core.importance import show_importance
+from core.lazy import lazy_import
+from core.models import DEFAULT_MODEL_OPTION, MODEL_OPTIONS, get_trained_model
+
+# Yalnızca önbellekte olmayan bir grafik çizilirken içe aktarılır
+sns = lazy_import('seaborn')
+
 # Sayfa yapılandırması
 st.set_page_config(
     page_title="Veri Görselleştirme - Kalp Hastalığı Analiz Platformu",
@@ -15,14 +23,15 @@ st.set_page_config(
 st.title("📊 Veri Görselleştirme")
 st.markdown("Bu sayfada kalp hastalığı veri setini çeşitli grafiklerle analiz edebilirsiniz.")
 
-# Veri setini yükleme
-@st.cache_data
-def load_data():
-    data = pd.read_csv('heart_cleaned.csv')
-    return data
-
+# Veri setini yükleme (sütunlu kopyadan, süreç içinde paylaşılır)
 df = load_data()
 
+# Grafikler (grafik, veri sürümü) başına bir kez çizilir ve önbellekten gösterilir
+data_version = data_fingerprint()
+
+# Gruplama grafikleri, veri setinin her sürümü için bir kez hesaplanan toplam küpünün dilimleridir
+cube = load_cube()
+
 # Sidebar oluşturma
 st.sidebar.header("Görselleştirme Seçenekleri")
 
@@ -48,93 +57,85 @@ if visualization_category == "Demografik Analizler":
         col1, col2 = st.columns(2)
         
         with col1:
-            fig, ax = plt.subplots(figsize=(10, 6))
-            sns.histplot(data=df, x='Yaş', bins=20, kde=True, ax=ax)
-            ax.set_title("Yaş Dağılımı")
-            ax.set_xlabel("Yaş")
-            ax.set_ylabel("Frekans")
-            st.pyplot(fig)
+            def draw(ax):
+                sns.histplot(data=df, x='Yaş', bins=20, kde=True, ax=ax)
+                ax.set_title("Yaş Dağılımı")
+                ax.set_xlabel("Yaş")
+                ax.set_ylabel("Frekans")
+            show_chart('yas_dagilimi', draw, version=data_version)
         
         with col2:
-            fig, ax = plt.subplots(figsize=(10, 6))
-            sns.histplot(data=df, x='Yaş', hue='KalpHastalığı', bins=20, kde=True, ax=ax)
-            ax.set_title("Yaş Dağılımı ve Kalp Hastalığı İlişkisi")
-            ax.set_xlabel("Yaş")
-            ax.set_ylabel("Frekans")
-            st.pyplot(fig)
+            def draw(ax):
+                sns.histplot(data=df, x='Yaş', hue='KalpHastalığı', bins=20, kde=True, ax=ax)
+                ax.set_title("Yaş Dağılımı ve Kalp Hastalığı İlişkisi")
+                ax.set_xlabel("Yaş")
+                ax.set_ylabel("Frekans")
+            show_chart('yas_dagilimi_hedef', draw, version=data_version)
         
         # Yaş gruplarına göre analiz
         st.subheader("Yaş Gruplarına Göre Kalp Hastalığı Oranı")
         
-        # Yaş grupları oluşturma
-        df_temp = df.copy()
-        df_temp['AgeGroup'] = pd.cut(df_temp['Yaş'], bins=[20, 30, 40, 50, 60, 70, 80], labels=['20-30', '30-40', '40-50', '50-60', '60-70', '70-80'])
-        
         # Yaş gruplarına göre kalp hastalığı oranı
-        age_group_heart_disease = df_temp.groupby('AgeGroup')['KalpHastalığı'].mean() * 100
-        
-        fig, ax = plt.subplots(figsize=(10, 6))
-        age_group_heart_disease.plot(kind='bar', ax=ax, color='coral')
-        ax.set_title("Yaş Gruplarına Göre Kalp Hastalığı Oranı (%)")
-        ax.set_xlabel("Yaş Grubu")
-        ax.set_ylabel("Kalp Hastalığı Oranı (%)")
-        ax.set_ylim(0, 100)
-        
-        # Değerleri çubukların üzerine ekleme
-        for i, v in enumerate(age_group_heart_disease):
-            ax.text(i, v + 2, f"{v:.1f}%", ha='center')
-            
-        st.pyplot(fig)
+        age_group_heart_disease = cube.rates('YaşGrubu')
+        
+        def draw(ax):
+            age_group_heart_disease.plot(kind='bar', ax=ax, color='coral')
+            ax.set_title("Yaş Gruplarına Göre Kalp Hastalığı Oranı (%)")
+            ax.set_xlabel("Yaş Grubu")
+            ax.set_ylabel("Kalp Hastalığı Oranı (%)")
+            ax.set_ylim(0, 100)
+
+            # Değerleri çubukların üzerine ekleme
+            for i, v in enumerate(age_group_heart_disease):
+                ax.text(i, v + 2, f"{v:.1f}%", ha='center')
+        show_chart('yas_grubu_oran', draw, version=data_version)
         
         # Yaş istatistikleri
         st.subheader("Yaş İstatistikleri")
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.metric("Ortalama Yaş", f"{df['Yaş'].mean():.1f}")
+            st.metric("Ortalama Yaş", f"{cube.summary['Yaş']['mean']:.1f}")
         
         with col2:
-            st.metric("Minimum Yaş", int(df['Yaş'].min()))
+            st.metric("Minimum Yaş", int(cube.summary['Yaş']['min']))
         
         with col3:
-            st.metric("Maksimum Yaş", int(df['Yaş'].max()))
+            st.metric("Maksimum Yaş", int(cube.summary['Yaş']['max']))
     
     elif demographic_option == "Cinsiyet Dağılımı":
         st.subheader("Cinsiyet Dağılımı ve Kalp Hastalığı İlişkisi")
         
         col1, col2 = st.columns(2)
         
+        # Cinsiyet ve kalp hastalığı sayıları
+        gender_heart_disease = cube.table('Cinsiyet')
+        
         with col1:
-            # Veri çerçevesinin bir kopyasını oluştur
-            df_gender = df.copy()
-            
-            # Sayısal değerler yerine metin değerlerini kullan
-            df_gender['Cinsiyet_Label'] = df_gender['Cinsiyet'].map({1: 'Erkek', 0: 'Kadın'})
-                
             # Cinsiyet dağılımı
-            gender_count = df_gender['Cinsiyet_Label'].value_counts()
-            fig, ax = plt.subplots(figsize=(8, 8))
-            ax.pie(gender_count, labels=gender_count.index, autopct='%1.1f%%', startangle=90, colors=['#66b3ff', '#ff9999'])
-            ax.set_title("Cinsiyet Dağılımı")
-            st.pyplot(fig)
+            gender_count = cube.totals('Cinsiyet')
+            def draw(ax):
+                ax.pie(gender_count, labels=gender_count.index, autopct='%1.1f%%', startangle=90, colors=['#66b3ff', '#ff9999'])
+                ax.set_title("Cinsiyet Dağılımı")
+            show_chart('cinsiyet_dagilimi', draw, version=data_version, figsize=(8, 8))
             
             # Cinsiyet sayıları
             for gender, count in gender_count.items():
-                st.write(f"**{gender}:** {count} kişi ({count/len(df_gender)*100:.1f}%)")
+                st.write(f"**{gender}:** {count} kişi ({count/cube.rows*100:.1f}%)")
         
         with col2:
             # Cinsiyet ve kalp hastalığı ilişkisi
-            fig, ax = plt.subplots(figsize=(8, 6))
-            sns.countplot(data=df_gender, x='Cinsiyet_Label', hue='KalpHastalığı', ax=ax)
-            ax.set_title("Cinsiyet ve Kalp Hastalığı İlişkisi")
-            ax.set_xlabel("Cinsiyet")
-            ax.set_ylabel("Kişi Sayısı")
-            st.pyplot(fig)
+            def draw(ax):
+                sns.barplot(data=gender_heart_disease.stack().rename('count').reset_index(),
+                            x='Cinsiyet', y='count', hue='KalpHastalığı', ax=ax)
+                ax.set_title("Cinsiyet ve Kalp Hastalığı İlişkisi")
+                ax.set_xlabel("Cinsiyet")
+                ax.set_ylabel("Kişi Sayısı")
+            show_chart('cinsiyet_hedef', draw, version=data_version, figsize=(8, 6))
         
         # Cinsiyet bazında kalp hastalığı oranları
         st.subheader("Cinsiyet Bazında Kalp Hastalığı Oranları")
         
-        gender_heart_disease = df_gender.groupby(['Cinsiyet_Label', 'KalpHastalığı']).size().unstack()
         gender_heart_disease_percent = gender_heart_disease.div(gender_heart_disease.sum(axis=1), axis=0) * 100
         
         col1, col2 = st.columns(2)
@@ -148,57 +149,52 @@ if visualization_category == "Demografik Analizler":
             st.dataframe(gender_heart_disease_percent.round(1))
         
         # Cinsiyet bazında kalp hastalığı oranları grafiği
-        fig, ax = plt.subplots(figsize=(10, 6))
-        gender_heart_disease_percent[1].plot(kind='bar', ax=ax, color='coral')
-        ax.set_title("Cinsiyet Bazında Kalp Hastalığı Oranı (%)")
-        ax.set_xlabel("Cinsiyet")
-        ax.set_ylabel("Kalp Hastalığı Oranı (%)")
-        ax.set_ylim(0, 100)
-        
-        # Değerleri çubukların üzerine ekleme
-        for i, v in enumerate(gender_heart_disease_percent[1]):
-            ax.text(i, v + 2, f"{v:.1f}%", ha='center')
-            
-        st.pyplot(fig)
+        def draw(ax):
+            gender_heart_disease_percent[1].plot(kind='bar', ax=ax, color='coral')
+            ax.set_title("Cinsiyet Bazında Kalp Hastalığı Oranı (%)")
+            ax.set_xlabel("Cinsiyet")
+            ax.set_ylabel("Kalp Hastalığı Oranı (%)")
+            ax.set_ylim(0, 100)
+
+            # Değerleri çubukların üzerine ekleme
+            for i, v in enumerate(gender_heart_disease_percent[1]):
+                ax.text(i, v + 2, f"{v:.1f}%", ha='center')
+        show_chart('cinsiyet_oran', draw, version=data_version)
     
     elif demographic_option == "Yaş ve Cinsiyet İlişkisi":
         st.subheader("Yaş ve Cinsiyet İlişkisi")
         
-        # Veri hazırlama
-        df_temp = df.copy()
-        df_temp['Cinsiyet_Label'] = df_temp['Cinsiyet'].map({1: 'Erkek', 0: 'Kadın'})
+        # Cinsiyet etiketleri (veri çerçevesine sütun eklenmez)
+        gender_labels = derived_column(DIMENSIONS['Cinsiyet'])
         
         # Cinsiyete göre yaş dağılımı
-        fig, ax = plt.subplots(figsize=(10, 6))
-        sns.boxplot(data=df_temp, x='Cinsiyet_Label', y='Yaş', ax=ax)
-        ax.set_title("Cinsiyete Göre Yaş Dağılımı")
-        ax.set_xlabel("Cinsiyet")
-        ax.set_ylabel("Yaş")
-        st.pyplot(fig)
+        def draw(ax):
+            sns.boxplot(x=gender_labels, y=df['Yaş'], ax=ax)
+            ax.set_title("Cinsiyete Göre Yaş Dağılımı")
+            ax.set_xlabel("Cinsiyet")
+            ax.set_ylabel("Yaş")
+        show_chart('cinsiyet_yas_kutu', draw, version=data_version)
         
         # Cinsiyete ve kalp hastalığına göre yaş dağılımı
-        fig, ax = plt.subplots(figsize=(10, 6))
-        sns.boxplot(data=df_temp, x='Cinsiyet_Label', y='Yaş', hue='KalpHastalığı', ax=ax)
-        ax.set_title("Cinsiyete ve Kalp Hastalığına Göre Yaş Dağılımı")
-        ax.set_xlabel("Cinsiyet")
-        ax.set_ylabel("Yaş")
-        st.pyplot(fig)
+        def draw(ax):
+            sns.boxplot(x=gender_labels, y=df['Yaş'], hue=df['KalpHastalığı'], ax=ax)
+            ax.set_title("Cinsiyete ve Kalp Hastalığına Göre Yaş Dağılımı")
+            ax.set_xlabel("Cinsiyet")
+            ax.set_ylabel("Yaş")
+        show_chart('cinsiyet_yas_hedef_kutu', draw, version=data_version)
         
         # Yaş grupları ve cinsiyet dağılımı
         st.subheader("Yaş Grupları ve Cinsiyet Dağılımı")
         
-        # Yaş grupları oluşturma
-        df_temp['AgeGroup'] = pd.cut(df_temp['Yaş'], bins=[20, 30, 40, 50, 60, 70, 80], labels=['20-30', '30-40', '40-50', '50-60', '60-70', '70-80'])
-        
         # Yaş grupları ve cinsiyet dağılımı
-        age_gender_distribution = pd.crosstab(df_temp['AgeGroup'], df_temp['Cinsiyet_Label'])
-        
-        fig, ax = plt.subplots(figsize=(12, 6))
-        age_gender_distribution.plot(kind='bar', ax=ax)
-        ax.set_title("Yaş Grupları ve Cinsiyet Dağılımı")
-        ax.set_xlabel("Yaş Grubu")
-        ax.set_ylabel("Kişi Sayısı")
-        st.pyplot(fig)
+        age_gender_distribution = cube.table('YaşGrubu', 'Cinsiyet').sum(axis=1).unstack(fill_value=0)
+        
+        def draw(ax):
+            age_gender_distribution.plot(kind='bar', ax=ax)
+            ax.set_title("Yaş Grupları ve Cinsiyet Dağılımı")
+            ax.set_xlabel("Yaş Grubu")
+            ax.set_ylabel("Kişi Sayısı")
+        show_chart('yas_grubu_cinsiyet', draw, version=data_version, figsize=(12, 6))
 
 # Sağlık Parametreleri
 elif visualization_category == "Sağlık Parametreleri":
@@ -226,37 +222,33 @@ elif visualization_category == "Sağlık Parametreleri":
        Fiziksel aktiviteyle artan, dinlenmeyle azalan klasik göğüs ağrısı; kalp hastalığı ile yüksek oranda ilişkilidir.
        """)
         
-        # Veri çerçevesinin bir kopyasını oluştur
-        df_chest_pain = df.copy()
-        
-        # Sayısal değerler yerine metin değerlerini kullan
-        chest_pain_mapping = {0: 'ASY', 1: 'ATA', 2: 'NAP', 3: 'TA'}
-        df_chest_pain['GöğüsAğrısı_Label'] = df_chest_pain['GöğüsAğrısıTürü'].map(chest_pain_mapping)
+        # Göğüs ağrısı tipi ve kalp hastalığı sayıları
+        chest_pain_heart_disease = cube.table('GöğüsAğrısıTürü')
         
         col1, col2 = st.columns(2)
         
         with col1:
             # Göğüs ağrısı tipi dağılımı
-            chest_pain_count = df_chest_pain['GöğüsAğrısı_Label'].value_counts()
-            fig, ax = plt.subplots(figsize=(8, 8))
-            ax.pie(chest_pain_count, labels=chest_pain_count.index, autopct='%1.1f%%', startangle=90, 
-                  colors=['#ff9999', '#66b3ff', '#99ff99', '#ffcc99'])
-            ax.set_title("Göğüs Ağrısı Tipi Dağılımı")
-            st.pyplot(fig)
+            chest_pain_count = cube.totals('GöğüsAğrısıTürü')
+            def draw(ax):
+                ax.pie(chest_pain_count, labels=chest_pain_count.index, autopct='%1.1f%%', startangle=90, 
+                      colors=['#ff9999', '#66b3ff', '#99ff99', '#ffcc99'])
+                ax.set_title("Göğüs Ağrısı Tipi Dağılımı")
+            show_chart('gogus_agrisi_dagilimi', draw, version=data_version, figsize=(8, 8))
         
         with col2:
             # Göğüs ağrısı tipi ve kalp hastalığı ilişkisi
-            fig, ax = plt.subplots(figsize=(10, 6))
-            sns.countplot(data=df_chest_pain, x='GöğüsAğrısı_Label', hue='KalpHastalığı', ax=ax)
-            ax.set_title("Göğüs Ağrısı Tipi ve Kalp Hastalığı İlişkisi")
-            ax.set_xlabel("Göğüs Ağrısı Tipi")
-            ax.set_ylabel("Kişi Sayısı")
-            st.pyplot(fig)
+            def draw(ax):
+                sns.barplot(data=chest_pain_heart_disease.stack().rename('count').reset_index(),
+                            x='GöğüsAğrısıTürü', y='count', hue='KalpHastalığı', ax=ax)
+                ax.set_title("Göğüs Ağrısı Tipi ve Kalp Hastalığı İlişkisi")
+                ax.set_xlabel("Göğüs Ağrısı Tipi")
+                ax.set_ylabel("Kişi Sayısı")
+            show_chart('gogus_agrisi_hedef', draw, version=data_version)
         
         # Göğüs ağrısı tipine göre kalp hastalığı oranı
         st.subheader("Göğüs Ağrısı Tipine Göre Kalp Hastalığı Oranı")
         
-        chest_pain_heart_disease = df_chest_pain.groupby(['GöğüsAğrısı_Label', 'KalpHastalığı']).size().unstack()
         chest_pain_heart_disease_percent = chest_pain_heart_disease.div(chest_pain_heart_disease.sum(axis=1), axis=0) * 100
         
         col1, col2 = st.columns(2)
@@ -270,18 +262,17 @@ elif visualization_category == "Sağlık Parametreleri":
             st.dataframe(chest_pain_heart_disease_percent.round(1))
         
         # Göğüs ağrısı tipine göre kalp hastalığı oranı grafiği
-        fig, ax = plt.subplots(figsize=(10, 6))
-        chest_pain_heart_disease_percent[1].plot(kind='bar', ax=ax, color='coral')
-        ax.set_title("Göğüs Ağrısı Tipine Göre Kalp Hastalığı Oranı (%)")
-        ax.set_xlabel("Göğüs Ağrısı Tipi")
-        ax.set_ylabel("Kalp Hastalığı Oranı (%)")
-        ax.set_ylim(0, 100)
-        
-        # Değerleri çubukların üzerine ekleme
-        for i, v in enumerate(chest_pain_heart_disease_percent[1]):
-            ax.text(i, v + 2, f"{v:.1f}%", ha='center')
-            
-        st.pyplot(fig)
+        def draw(ax):
+            chest_pain_heart_disease_percent[1].plot(kind='bar', ax=ax, color='coral')
+            ax.set_title("Göğüs Ağrısı Tipine Göre Kalp Hastalığı Oranı (%)")
+            ax.set_xlabel("Göğüs Ağrısı Tipi")
+            ax.set_ylabel("Kalp Hastalığı Oranı (%)")
+            ax.set_ylim(0, 100)
+
+            # Değerleri çubukların üzerine ekleme
+            for i, v in enumerate(chest_pain_heart_disease_percent[1]):
+                ax.text(i, v + 2, f"{v:.1f}%", ha='center')
+        show_chart('gogus_agrisi_oran', draw, version=data_version)
     
     elif health_param_option == "Kolesterol ve Kan Basıncı":
         st.subheader("Kolesterol ve Kan Basıncı Analizi")
@@ -290,41 +281,41 @@ elif visualization_category == "Sağlık Parametreleri":
         
         with col1:
             # Kolesterol dağılımı
-            fig, ax = plt.subplots(figsize=(10, 6))
-            sns.histplot(data=df, x='Kolesterol', bins=20, kde=True, ax=ax)
-            ax.set_title("Kolesterol Dağılımı")
-            ax.set_xlabel("Kolesterol (mg/dl)")
-            ax.set_ylabel("Frekans")
-            st.pyplot(fig)
+            def draw(ax):
+                sns.histplot(data=df, x='Kolesterol', bins=20, kde=True, ax=ax)
+                ax.set_title("Kolesterol Dağılımı")
+                ax.set_xlabel("Kolesterol (mg/dl)")
+                ax.set_ylabel("Frekans")
+            show_chart('kolesterol_dagilimi', draw, version=data_version)
             
             # Kolesterol istatistikleri
-            st.write(f"**Ortalama Kolesterol:** {df['Kolesterol'].mean():.1f} mg/dl")
-            st.write(f"**Minimum Kolesterol:** {df['Kolesterol'].min()} mg/dl")
-            st.write(f"**Maksimum Kolesterol:** {df['Kolesterol'].max()} mg/dl")
+            st.write(f"**Ortalama Kolesterol:** {cube.summary['Kolesterol']['mean']:.1f} mg/dl")
+            st.write(f"**Minimum Kolesterol:** {cube.summary['Kolesterol']['min']} mg/dl")
+            st.write(f"**Maksimum Kolesterol:** {cube.summary['Kolesterol']['max']} mg/dl")
         
         with col2:
             # Kan basıncı dağılımı
-            fig, ax = plt.subplots(figsize=(10, 6))
-            sns.histplot(data=df, x='İstirahatKanBasıncı', bins=20, kde=True, ax=ax)
-            ax.set_title("İstirahat Kan Basıncı Dağılımı")
-            ax.set_xlabel("İstirahat Kan Basıncı (mm Hg)")
-            ax.set_ylabel("Frekans")
-            st.pyplot(fig)
+            def draw(ax):
+                sns.histplot(data=df, x='İstirahatKanBasıncı', bins=20, kde=True, ax=ax)
+                ax.set_title("İstirahat Kan Basıncı Dağılımı")
+                ax.set_xlabel("İstirahat Kan Basıncı (mm Hg)")
+                ax.set_ylabel("Frekans")
+            show_chart('kan_basinci_dagilimi', draw, version=data_version)
             
             # Kan basıncı istatistikleri
-            st.write(f"**Ortalama Kan Basıncı:** {df['İstirahatKanBasıncı'].mean():.1f} mm Hg")
-            st.write(f"**Minimum Kan Basıncı:** {df['İstirahatKanBasıncı'].min()} mm Hg")
-            st.write(f"**Maksimum Kan Basıncı:** {df['İstirahatKanBasıncı'].max()} mm Hg")
+            st.write(f"**Ortalama Kan Basıncı:** {cube.summary['İstirahatKanBasıncı']['mean']:.1f} mm Hg")
+            st.write(f"**Minimum Kan Basıncı:** {cube.summary['İstirahatKanBasıncı']['min']} mm Hg")
+            st.write(f"**Maksimum Kan Basıncı:** {cube.summary['İstirahatKanBasıncı']['max']} mm Hg")
         
         # Kolesterol ve kan basıncı ilişkisi
         st.subheader("Kolesterol ve Kan Basıncı İlişkisi")
         
-        fig, ax = plt.subplots(figsize=(10, 6))
-        sns.scatterplot(data=df, x='Kolesterol', y='İstirahatKanBasıncı', hue='KalpHastalığı', ax=ax)
-        ax.set_title("Kolesterol ve Kan Basıncı İlişkisi")
-        ax.set_xlabel("Kolesterol (mg/dl)")
-        ax.set_ylabel("İstirahat Kan Basıncı (mm Hg)")
-        st.pyplot(fig)
+        def draw(ax):
+            sns.scatterplot(data=df, x='Kolesterol', y='İstirahatKanBasıncı', hue='KalpHastalığı', ax=ax)
+            ax.set_title("Kolesterol ve Kan Basıncı İlişkisi")
+            ax.set_xlabel("Kolesterol (mg/dl)")
+            ax.set_ylabel("İstirahat Kan Basıncı (mm Hg)")
+        show_chart('kolesterol_kan_basinci', draw, version=data_version)
     
     elif health_param_option == "Kalp Hızı ve Egzersiz Angina":
         st.subheader("Kalp Hızı ve Egzersiz Angina Analizi")
@@ -333,43 +324,40 @@ elif visualization_category == "Sağlık Parametreleri":
         
         with col1:
             # Maksimum kalp hızı dağılımı
-            fig, ax = plt.subplots(figsize=(10, 6))
-            sns.histplot(data=df, x='MaksimumKalpHızı', bins=20, kde=True, ax=ax)
-            ax.set_title("Maksimum Kalp Hızı Dağılımı")
-            ax.set_xlabel("Maksimum Kalp Hızı")
-            ax.set_ylabel("Frekans")
-            st.pyplot(fig)
+            def draw(ax):
+                sns.histplot(data=df, x='MaksimumKalpHızı', bins=20, kde=True, ax=ax)
+                ax.set_title("Maksimum Kalp Hızı Dağılımı")
+                ax.set_xlabel("Maksimum Kalp Hızı")
+                ax.set_ylabel("Frekans")
+            show_chart('kalp_hizi_dagilimi', draw, version=data_version)
             
             # Maksimum kalp hızı istatistikleri
-            st.write(f"**Ortalama Maksimum Kalp Hızı:** {df['MaksimumKalpHızı'].mean():.1f}")
-            st.write(f"**Minimum Maksimum Kalp Hızı:** {df['MaksimumKalpHızı'].min()}")
-            st.write(f"**Maksimum Maksimum Kalp Hızı:** {df['MaksimumKalpHızı'].max()}")
+            st.write(f"**Ortalama Maksimum Kalp Hızı:** {cube.summary['MaksimumKalpHızı']['mean']:.1f}")
+            st.write(f"**Minimum Maksimum Kalp Hızı:** {cube.summary['MaksimumKalpHızı']['min']}")
+            st.write(f"**Maksimum Maksimum Kalp Hızı:** {cube.summary['MaksimumKalpHızı']['max']}")
         
         with col2:
             # Egzersiz angina dağılımı
-            df_temp = df.copy()
-            df_temp['EgzersizAngina_Label'] = df_temp['EgzersizAnginası'].map({1: 'Evet', 0: 'Hayır'})
-            
-            exercise_angina_count = df_temp['EgzersizAngina_Label'].value_counts()
-            fig, ax = plt.subplots(figsize=(8, 8))
-            ax.pie(exercise_angina_count, labels=exercise_angina_count.index, autopct='%1.1f%%', startangle=90, 
-                  colors=['#99ff99', '#ff9999'])
-            ax.set_title("Egzersiz Angina Dağılımı")
-            st.pyplot(fig)
+            exercise_angina_count = cube.totals('EgzersizAnginası')
+            def draw(ax):
+                ax.pie(exercise_angina_count, labels=exercise_angina_count.index, autopct='%1.1f%%', startangle=90, 
+                      colors=['#99ff99', '#ff9999'])
+                ax.set_title("Egzersiz Angina Dağılımı")
+            show_chart('egzersiz_angina_dagilimi', draw, version=data_version, figsize=(8, 8))
             
             # Egzersiz angina sayıları
             for angina, count in exercise_angina_count.items():
-                st.write(f"**{angina}:** {count} kişi ({count/len(df)*100:.1f}%)")
+                st.write(f"**{angina}:** {count} kişi ({count/cube.rows*100:.1f}%)")
         
         # Yaş ve maksimum kalp hızı ilişkisi
         st.subheader("Yaş ve Maksimum Kalp Hızı İlişkisi")
         
-        fig, ax = plt.subplots(figsize=(10, 6))
-        sns.scatterplot(data=df, x='Yaş', y='MaksimumKalpHızı', hue='KalpHastalığı', ax=ax)
-        ax.set_title("Yaş ve Maksimum Kalp Hızı İlişkisi")
-        ax.set_xlabel("Yaş")
-        ax.set_ylabel("Maksimum Kalp Hızı")
-        st.pyplot(fig)
+        def draw(ax):
+            sns.scatterplot(data=df, x='Yaş', y='MaksimumKalpHızı', hue='KalpHastalığı', ax=ax)
+            ax.set_title("Yaş ve Maksimum Kalp Hızı İlişkisi")
+            ax.set_xlabel("Yaş")
+            ax.set_ylabel("Maksimum Kalp Hızı")
+        show_chart('yas_kalp_hizi', draw, version=data_version)
     
     elif health_param_option == "ST Eğimi ve Oldpeak":
         st.subheader("ST Eğimi ve Oldpeak Analizi")
@@ -386,44 +374,39 @@ elif visualization_category == "Sağlık Parametreleri":
         """)
 
         
-        # Veri hazırlama
-        df_temp = df.copy()
-        st_slope_mapping = {0: 'Down', 1: 'Flat', 2: 'Up'}
-        df_temp['ST_Eğimi_Label'] = df_temp['ST_Eğimi'].map(st_slope_mapping)
-        
         col1, col2 = st.columns(2)
         
         with col1:
             # ST Eğimi dağılımı
-            st_slope_count = df_temp['ST_Eğimi_Label'].value_counts()
-            fig, ax = plt.subplots(figsize=(8, 8))
-            ax.pie(st_slope_count, labels=st_slope_count.index, autopct='%1.1f%%', startangle=90, 
-                  colors=['#99ff99', '#ffcc99', '#ff9999'])
-            ax.set_title("ST Eğimi Dağılımı")
-            st.pyplot(fig)
+            st_slope_count = cube.totals('ST_Eğimi')
+            def draw(ax):
+                ax.pie(st_slope_count, labels=st_slope_count.index, autopct='%1.1f%%', startangle=90, 
+                      colors=['#99ff99', '#ffcc99', '#ff9999'])
+                ax.set_title("ST Eğimi Dağılımı")
+            show_chart('st_egimi_dagilimi', draw, version=data_version, figsize=(8, 8))
             
             # ST Eğimi sayıları
             for slope, count in st_slope_count.items():
-                st.write(f"**{slope}:** {count} kişi ({count/len(df)*100:.1f}%)")
+                st.write(f"**{slope}:** {count} kişi ({count/cube.rows*100:.1f}%)")
         
         with col2:
             # ST Depresyonu dağılımı
-            fig, ax = plt.subplots(figsize=(10, 6))
-            sns.histplot(data=df, x='STDepresyonu', bins=20, kde=True, ax=ax)
-            ax.set_title("ST Depresyonu Dağılımı")
-            ax.set_xlabel("ST Depresyonu")
-            ax.set_ylabel("Frekans")
-            st.pyplot(fig)
+            def draw(ax):
+                sns.histplot(data=df, x='STDepresyonu', bins=20, kde=True, ax=ax)
+                ax.set_title("ST Depresyonu Dağılımı")
+                ax.set_xlabel("ST Depresyonu")
+                ax.set_ylabel("Frekans")
+            show_chart('st_depresyonu_dagilimi', draw, version=data_version)
             
             # ST Depresyonu istatistikleri
-            st.write(f"**Ortalama ST Depresyonu:** {df['STDepresyonu'].mean():.2f}")
-            st.write(f"**Minimum ST Depresyonu:** {df['STDepresyonu'].min():.2f}")
-            st.write(f"**Maksimum ST Depresyonu:** {df['STDepresyonu'].max():.2f}")
+            st.write(f"**Ortalama ST Depresyonu:** {cube.summary['STDepresyonu']['mean']:.2f}")
+            st.write(f"**Minimum ST Depresyonu:** {cube.summary['STDepresyonu']['min']:.2f}")
+            st.write(f"**Maksimum ST Depresyonu:** {cube.summary['STDepresyonu']['max']:.2f}")
         
         # ST Eğimi ve kalp hastalığı ilişkisi
         st.subheader("ST Eğimi ve Kalp Hastalığı İlişkisi")
         
-        st_slope_heart_disease = df_temp.groupby(['ST_Eğimi_Label', 'KalpHastalığı']).size().unstack()
+        st_slope_heart_disease = cube.table('ST_Eğimi')
         st_slope_heart_disease_percent = st_slope_heart_disease.div(st_slope_heart_disease.sum(axis=1), axis=0) * 100
         
         col1, col2 = st.columns(2)
@@ -437,18 +420,17 @@ elif visualization_category == "Sağlık Parametreleri":
             st.dataframe(st_slope_heart_disease_percent.round(1))
         
         # ST Eğimine göre kalp hastalığı oranı grafiği
-        fig, ax = plt.subplots(figsize=(10, 6))
-        st_slope_heart_disease_percent[1].plot(kind='bar', ax=ax, color='coral')
-        ax.set_title("ST Eğimine Göre Kalp Hastalığı Oranı (%)")
-        ax.set_xlabel("ST Eğimi")
-        ax.set_ylabel("Kalp Hastalığı Oranı (%)")
-        ax.set_ylim(0, 100)
-        
-        # Değerleri çubukların üzerine ekleme
-        for i, v in enumerate(st_slope_heart_disease_percent[1]):
-            ax.text(i, v + 2, f"{v:.1f}%", ha='center')
-            
-        st.pyplot(fig)
+        def draw(ax):
+            st_slope_heart_disease_percent[1].plot(kind='bar', ax=ax, color='coral')
+            ax.set_title("ST Eğimine Göre Kalp Hastalığı Oranı (%)")
+            ax.set_xlabel("ST Eğimi")
+            ax.set_ylabel("Kalp Hastalığı Oranı (%)")
+            ax.set_ylim(0, 100)
+
+            # Değerleri çubukların üzerine ekleme
+            for i, v in enumerate(st_slope_heart_disease_percent[1]):
+                ax.text(i, v + 2, f"{v:.1f}%", ha='center')
+        show_chart('st_egimi_oran', draw, version=data_version)
 # İlişki Analizleri
 elif visualization_category == "İlişki Analizleri":
     st.header("İlişki Analizleri")
@@ -462,39 +444,20 @@ elif visualization_category == "İlişki Analizleri":
     if relation_option == "Korelasyon Matrisi":
         st.subheader("Özellikler Arası Korelasyon Matrisi")
         
-        # Kategorik değişkenleri sayısallaştırma
-        df_corr = df.copy()
-        
-        # Türkçe sütun adlarına göre düzenleme
-        if 'Cinsiyet' in df_corr.columns:
-            df_corr['Cinsiyet'] = df_corr['Cinsiyet'].astype(int)
-        
-        if 'GöğüsAğrısıTürü' in df_corr.columns:
-            df_corr['GöğüsAğrısıTürü'] = df_corr['GöğüsAğrısıTürü'].astype(int)
-        
-        if 'İstirahatEKG' in df_corr.columns:
-            df_corr['İstirahatEKG'] = df_corr['İstirahatEKG'].astype(int)
-        
-        if 'EgzersizAnginası' in df_corr.columns:
-            df_corr['EgzersizAnginası'] = df_corr['EgzersizAnginası'].astype(int)
-        
-        if 'ST_Eğimi' in df_corr.columns:
-            df_corr['ST_Eğimi'] = df_corr['ST_Eğimi'].astype(int)
-        
-        # Sayısal sütunları seçme
-        numeric_df = df_corr.select_dtypes(include=[np.number])
+        # Sayısal sütunları seçme (kategorik sütunlar veri setinde zaten tamsayı kodludur)
+        numeric_df = df.select_dtypes(include=[np.number])
         
         # Korelasyon matrisini hesaplama
         corr = numeric_df.corr()
         
         # Korelasyon matrisini görselleştirme
-        fig, ax = plt.subplots(figsize=(12, 10))
-        mask = np.triu(np.ones_like(corr, dtype=bool))
-        cmap = sns.diverging_palette(230, 20, as_cmap=True)
-        sns.heatmap(corr, mask=mask, cmap=cmap, vmax=1, vmin=-1, center=0,
-                    square=True, linewidths=.5, cbar_kws={"shrink": .5}, annot=True, fmt=".2f")
-        ax.set_title("Özellikler Arası Korelasyon Matrisi")
-        st.pyplot(fig)
+        def draw(ax):
+            mask = np.triu(np.ones_like(corr, dtype=bool))
+            cmap = sns.diverging_palette(230, 20, as_cmap=True)
+            sns.heatmap(corr, mask=mask, cmap=cmap, vmax=1, vmin=-1, center=0,
+                        square=True, linewidths=.5, cbar_kws={"shrink": .5}, annot=True, fmt=".2f", ax=ax)
+            ax.set_title("Özellikler Arası Korelasyon Matrisi")
+        show_chart('korelasyon', draw, version=data_version, figsize=(12, 10))
         
         st.markdown("""
         **Korelasyon Matrisi Yorumu:**
@@ -514,48 +477,13 @@ elif visualization_category == "İlişki Analizleri":
         
         st.write("""
         Bu analiz, hangi özelliklerin kalp hastalığı tahmini için daha önemli olduğunu gösterir.
-        Özellik önem analizi için basit bir lojistik regresyon modeli kullanılmıştır.
+        Bir özelliğin önemi, test setinde o özelliğin değerleri hastalar arasında karıştırıldığında
+        modelin doğruluğundaki düşüştür (permütasyon önemi). Tahmin sayfasındaki eğitilmiş modeller kullanılır.
         """)
         
-        # Veri setini hazırlama
-        df_model = df.copy()
-        
-        # Bağımsız değişkenler ve hedef değişken
-        if 'KalpHastalığı' in df_model.columns:
-            X = df_model.drop('KalpHastalığı', axis=1)
-            y = df_model['KalpHastalığı']
-        else:
-            st.error("KalpHastalığı sütunu bulunamadı!")
-            st.stop()
-        
-        # Lojistik regresyon modeli
-        from sklearn.linear_model import LogisticRegression
-        from sklearn.preprocessing import StandardScaler
-        
-        # Verileri ölçeklendirme
-        scaler = StandardScaler()
-        X_scaled = scaler.fit_transform(X)
-        
-        # Modeli eğitme
-        model = LogisticRegression(max_iter=1000, random_state=42)
-        model.fit(X_scaled, y)
-        
-        # Özellik önemlerini hesaplama
-        feature_importance = pd.DataFrame({
-            'Feature': X.columns,
-            'Importance': np.abs(model.coef_[0])
-        })
-        
-        # Özellik önemlerini sıralama
-        feature_importance = feature_importance.sort_values('Importance', ascending=False)
-        
-        # Özellik önemlerini görselleştirme
-        fig, ax = plt.subplots(figsize=(12, 8))
-        sns.barplot(data=feature_importance, x='Importance', y='Feature', ax=ax)
-        ax.set_title("Özellik Önem Analizi")
-        ax.set_xlabel("Önem Derecesi")
-        ax.set_ylabel("Özellik")
-        st.pyplot(fig)
+        importance_model = st.selectbox("Model", MODEL_OPTIONS, index=MODEL_OPTIONS.index(DEFAULT_MODEL_OPTION),
+                                        key="importance_model")
+        show_importance(get_trained_model(importance_model))
         
         st.markdown("""
         **Özellik Önem Analizi Yorumu:**
@@ -586,28 +514,20 @@ elif visualization_category == "İlişki Analizleri":
         if multi_var_option == "Yaş, Cinsiyet ve Kalp Hastalığı":
             st.write("Bu analiz, yaş ve cinsiyet faktörlerinin kalp hastalığı riski üzerindeki etkisini gösterir.")
             
-            # Yaş grupları oluşturma
-            df['YaşGrubu'] = pd.cut(df['Yaş'], bins=[20, 30, 40, 50, 60, 70, 80], 
-                                   labels=['20-30', '30-40', '40-50', '50-60', '60-70', '70-80'])
-            
-            # Cinsiyet etiketleri
-            df['CinsiyetLabel'] = df['Cinsiyet'].map({1: 'Erkek', 0: 'Kadın'})
-            
             # Yaş grupları, cinsiyet ve kalp hastalığı dağılımı
-            age_sex_heart = pd.crosstab([df['YaşGrubu'], df['CinsiyetLabel']], df['KalpHastalığı'])
+            age_sex_heart = cube.table('YaşGrubu', 'Cinsiyet')
             age_sex_heart_percent = age_sex_heart.div(age_sex_heart.sum(axis=1), axis=0) * 100
             
             # Grafik
-            fig, ax = plt.subplots(figsize=(14, 8))
-            age_sex_heart_percent[1].unstack().plot(kind='bar', ax=ax)
-            ax.set_title("Yaş Grupları ve Cinsiyete Göre Kalp Hastalığı Oranı (%)")
-            ax.set_xlabel("Yaş Grubu ve Cinsiyet")
-            ax.set_ylabel("Kalp Hastalığı Oranı (%)")
-            ax.set_ylim(0, 100)
-            ax.legend(title="Cinsiyet")
-            plt.xticks(rotation=45)
-            
-            st.pyplot(fig)
+            def draw(ax):
+                age_sex_heart_percent[1].unstack().plot(kind='bar', ax=ax)
+                ax.set_title("Yaş Grupları ve Cinsiyete Göre Kalp Hastalığı Oranı (%)")
+                ax.set_xlabel("Yaş Grubu ve Cinsiyet")
+                ax.set_ylabel("Kalp Hastalığı Oranı (%)")
+                ax.set_ylim(0, 100)
+                ax.legend(title="Cinsiyet")
+                ax.tick_params(axis='x', labelrotation=45)
+            show_chart('yas_cinsiyet_oran', draw, version=data_version, figsize=(14, 8))
             
             st.markdown("""
             **Analiz Yorumu:**
@@ -621,27 +541,22 @@ elif visualization_category == "İlişki Analizleri":
             st.write("Bu analiz, göğüs ağrısı tipi ve egzersiz angina faktörlerinin kalp hastalığı riski üzerindeki etkisini gösterir.")
             
             # Göğüs ağrısı tipi etiketleri
-            chest_pain_labels = {0: 'Tip 0', 1: 'Tip 1', 2: 'Tip 2', 3: 'Tip 3'}
-            df['GöğüsAğrısıLabel'] = df['GöğüsAğrısıTürü'].map(chest_pain_labels)
-            
-            # Egzersiz angina etiketleri
-            df['EgzersizAnginasıLabel'] = df['EgzersizAnginası'].map({1: 'Evet', 0: 'Hayır'})
+            chest_pain_labels = {'ASY': 'Tip 0', 'ATA': 'Tip 1', 'NAP': 'Tip 2', 'TA': 'Tip 3'}
             
             # Göğüs ağrısı tipi, egzersiz angina ve kalp hastalığı dağılımı
-            chest_angina_heart = pd.crosstab([df['GöğüsAğrısıLabel'], df['EgzersizAnginasıLabel']], df['KalpHastalığı'])
+            chest_angina_heart = cube.table('GöğüsAğrısıTürü', 'EgzersizAnginası').rename(index=chest_pain_labels, level=0)
             chest_angina_heart_percent = chest_angina_heart.div(chest_angina_heart.sum(axis=1), axis=0) * 100
             
             # Grafik
-            fig, ax = plt.subplots(figsize=(14, 8))
-            chest_angina_heart_percent[1].unstack().plot(kind='bar', ax=ax)
-            ax.set_title("Göğüs Ağrısı Tipi ve Egzersiz Anginaya Göre Kalp Hastalığı Oranı (%)")
-            ax.set_xlabel("Göğüs Ağrısı Tipi ve Egzersiz Angina")
-            ax.set_ylabel("Kalp Hastalığı Oranı (%)")
-            ax.set_ylim(0, 100)
-            ax.legend(title="Egzersiz Angina")
-            plt.xticks(rotation=45)
-            
-            st.pyplot(fig)
+            def draw(ax):
+                chest_angina_heart_percent[1].unstack().plot(kind='bar', ax=ax)
+                ax.set_title("Göğüs Ağrısı Tipi ve Egzersiz Anginaya Göre Kalp Hastalığı Oranı (%)")
+                ax.set_xlabel("Göğüs Ağrısı Tipi ve Egzersiz Angina")
+                ax.set_ylabel("Kalp Hastalığı Oranı (%)")
+                ax.set_ylim(0, 100)
+                ax.legend(title="Egzersiz Angina")
+                ax.tick_params(axis='x', labelrotation=45)
+            show_chart('gogus_agrisi_angina_oran', draw, version=data_version, figsize=(14, 8))
             
             st.markdown("""
             **Analiz Yorumu:**
@@ -653,31 +568,20 @@ elif visualization_category == "İlişki Analizleri":
         elif multi_var_option == "Kolesterol, Kan Basıncı ve Kalp Hastalığı":
             st.write("Bu analiz, kolesterol ve kan basıncı faktörlerinin kalp hastalığı riski üzerindeki etkisini gösterir.")
             
-            # Kolesterol grupları oluşturma
-            df['KolesterolGrubu'] = pd.cut(df['Kolesterol'], 
-                                          bins=[0, 200, 240, 600], 
-                                          labels=['Normal (<200)', 'Sınırda (200-240)', 'Yüksek (>240)'])
-            
-            # Kan basıncı grupları oluşturma
-            df['KanBasıncıGrubu'] = pd.cut(df['İstirahatKanBasıncı'], 
-                                          bins=[0, 120, 140, 200], 
-                                          labels=['Normal (<120)', 'Prehipertansiyon (120-140)', 'Hipertansiyon (>140)'])
-            
             # Kolesterol, kan basıncı ve kalp hastalığı dağılımı
-            chol_bp_heart = pd.crosstab([df['KolesterolGrubu'], df['KanBasıncıGrubu']], df['KalpHastalığı'])
+            chol_bp_heart = cube.table('KolesterolGrubu', 'KanBasıncıGrubu')
             chol_bp_heart_percent = chol_bp_heart.div(chol_bp_heart.sum(axis=1), axis=0) * 100
             
             # Grafik
-            fig, ax = plt.subplots(figsize=(14, 8))
-            chol_bp_heart_percent[1].unstack().plot(kind='bar', ax=ax)
-            ax.set_title("Kolesterol ve Kan Basıncı Gruplarına Göre Kalp Hastalığı Oranı (%)")
-            ax.set_xlabel("Kolesterol ve Kan Basıncı Grupları")
-            ax.set_ylabel("Kalp Hastalığı Oranı (%)")
-            ax.set_ylim(0, 100)
-            ax.legend(title="Kan Basıncı")
-            plt.xticks(rotation=45)
-            
-            st.pyplot(fig)
+            def draw(ax):
+                chol_bp_heart_percent[1].unstack().plot(kind='bar', ax=ax)
+                ax.set_title("Kolesterol ve Kan Basıncı Gruplarına Göre Kalp Hastalığı Oranı (%)")
+                ax.set_xlabel("Kolesterol ve Kan Basıncı Grupları")
+                ax.set_ylabel("Kalp Hastalığı Oranı (%)")
+                ax.set_ylim(0, 100)
+                ax.legend(title="Kan Basıncı")
+                ax.tick_params(axis='x', labelrotation=45)
+            show_chart('kolesterol_kan_basinci_oran', draw, version=data_version, figsize=(14, 8))
             
             st.markdown("""
             **Analiz Yorumu:**
@@ -690,38 +594,28 @@ elif visualization_category == "İlişki Analizleri":
         elif multi_var_option == "Yaş, Maksimum Kalp Hızı ve Kalp Hastalığı":
             st.write("Bu analiz, yaş ve maksimum kalp hızı faktörlerinin kalp hastalığı riski üzerindeki etkisini gösterir.")
             
-            # Yaş grupları oluşturma
-            df['YaşGrubu'] = pd.cut(df['Yaş'], bins=[20, 40, 60, 80], 
-                                   labels=['Genç (20-40)', 'Orta Yaş (40-60)', 'Yaşlı (60-80)'])
-            
-            # Maksimum kalp hızı grupları oluşturma
-            df['KalpHızıGrubu'] = pd.cut(df['MaksimumKalpHızı'], 
-                                        bins=[0, 120, 150, 220], 
-                                        labels=['Düşük (<120)', 'Normal (120-150)', 'Yüksek (>150)'])
-            
             # Yaş, maksimum kalp hızı ve kalp hastalığı dağılımı
-            age_hr_heart = pd.crosstab([df['YaşGrubu'], df['KalpHızıGrubu']], df['KalpHastalığı'])
+            age_hr_heart = cube.table('YaşGrubuGeniş', 'KalpHızıGrubu')
             age_hr_heart_percent = age_hr_heart.div(age_hr_heart.sum(axis=1), axis=0) * 100
             
             # Grafik
-            fig, ax = plt.subplots(figsize=(14, 8))
-            age_hr_heart_percent[1].unstack().plot(kind='bar', ax=ax)
-            ax.set_title("Yaş ve Maksimum Kalp Hızı Gruplarına Göre Kalp Hastalığı Oranı (%)")
-            ax.set_xlabel("Yaş ve Maksimum Kalp Hızı Grupları")
-            ax.set_ylabel("Kalp Hastalığı Oranı (%)")
-            ax.set_ylim(0, 100)
-            ax.legend(title="Maksimum Kalp Hızı")
-            plt.xticks(rotation=45)
-            
-            st.pyplot(fig)
+            def draw(ax):
+                age_hr_heart_percent[1].unstack().plot(kind='bar', ax=ax)
+                ax.set_title("Yaş ve Maksimum Kalp Hızı Gruplarına Göre Kalp Hastalığı Oranı (%)")
+                ax.set_xlabel("Yaş ve Maksimum Kalp Hızı Grupları")
+                ax.set_ylabel("Kalp Hastalığı Oranı (%)")
+                ax.set_ylim(0, 100)
+                ax.legend(title="Maksimum Kalp Hızı")
+                ax.tick_params(axis='x', labelrotation=45)
+            show_chart('yas_kalp_hizi_oran', draw, version=data_version, figsize=(14, 8))
             
             # Yaş ve maksimum kalp hızı ilişkisi
-            fig, ax = plt.subplots(figsize=(10, 6))
-            sns.scatterplot(data=df, x='Yaş', y='MaksimumKalpHızı', hue='KalpHastalığı', ax=ax)
-            ax.set_title("Yaş ve Maksimum Kalp Hızı İlişkisi")
-            ax.set_xlabel("Yaş")
-            ax.set_ylabel("Maksimum Kalp Hızı")
-            st.pyplot(fig)
+            def draw(ax):
+                sns.scatterplot(data=df, x='Yaş', y='MaksimumKalpHızı', hue='KalpHastalığı', ax=ax)
+                ax.set_title("Yaş ve Maksimum Kalp Hızı İlişkisi")
+                ax.set_xlabel("Yaş")
+                ax.set_ylabel("Maksimum Kalp Hızı")
+            show_chart('yas_kalp_hizi', draw, version=data_version)
             
             st.markdown("""
             **Analiz Yorumu:**
@@ -1,14 +1,21 @@
+import io
+
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
-from sklearn.linear_model import LogisticRegression
-from sklearn.svm import SVC
+
+from core.batch import score_csv
+from core.figures import show_chart
+from core.models import MODEL_OPTIONS, TEST_SIZE, get_trained_model, load_split
+from core.explain import explain
+from core.importance import show_importance
+from core.metrics import ADMIN_PANEL, metrics
+from core.riskcache import prediction_cache
+from core.sensitivity import DEFAULT_STEPS, SWEEP_FEATURES, sensitivity_sweep
+from core.lazy import lazy_import
+
+# Yalnızca önbellekte olmayan bir grafik çizilirken içe aktarılır
+sns = lazy_import('seaborn')
 
 # Sayfa yapılandırması
 st.set_page_config(
@@ -21,132 +28,27 @@ st.set_page_config(
 st.title("🔮 Kalp Yetmezliği Tahmin Modeli")
 st.markdown("Bu sayfada kalp hastalığı riskini tahmin etmek için makine öğrenmesi modelleri kullanabilirsiniz.")
 
-# Veri setini yükleme
-@st.cache_data
-def load_data():
-    data = pd.read_csv('heart_cleaned.csv')
-    return data
-
-df = load_data()
-
 # Sidebar oluşturma
 st.sidebar.header("Model Seçenekleri")
 
 # Model seçimi
 model_option = st.sidebar.selectbox(
     "Tahmin Modeli Seçin",
-    ["Lojistik Regresyon", "Rastgele Orman", "Destek Vektör Makinesi"]
+    MODEL_OPTIONS
 )
 
-# Test veri seti boyutu ve random state değerleri
-test_size = 0.20
-random_state = 40
-
-# Veri ön işleme fonksiyonu - VERİ SETİNİZLE UYUMLU HALE GETİRİLDİ
-def preprocess_data(df, is_training=True, reference_columns=None):
-    """
-    Veri ön işleme fonksiyonu
-    """
-    df_processed = df.copy()
-    
-    # Cinsiyet dönüşümü (1: Erkek, 0: Kadın)
-    if 'Cinsiyet' in df_processed.columns:
-        # Zaten sayısal format, sadece eksik değerleri kontrol et
-        if df_processed['Cinsiyet'].isnull().any():
-            df_processed['Cinsiyet'] = df_processed['Cinsiyet'].fillna(1)
-    
-    # Göğüs ağrısı tipi dönüşümü
-    if 'GöğüsAğrısıTürü' in df_processed.columns:
-        # Eksik değerleri doldurma
-        if df_processed['GöğüsAğrısıTürü'].isnull().any():
-            df_processed['GöğüsAğrısıTürü'] = df_processed['GöğüsAğrısıTürü'].fillna(0)
-        
-        # One-hot encoding
-        chest_pain_dummies = pd.get_dummies(df_processed['GöğüsAğrısıTürü'], prefix='GöğüsAğrısıTürü')
-        df_processed = pd.concat([df_processed, chest_pain_dummies], axis=1)
-        df_processed = df_processed.drop('GöğüsAğrısıTürü', axis=1)
-    
-    # İstirahat EKG dönüşümü
-    if 'İstirahatEKG' in df_processed.columns:
-        # Eksik değerleri doldurma
-        if df_processed['İstirahatEKG'].isnull().any():
-            df_processed['İstirahatEKG'] = df_processed['İstirahatEKG'].fillna(0)
-        
-        # One-hot encoding
-        ecg_dummies = pd.get_dummies(df_processed['İstirahatEKG'], prefix='İstirahatEKG')
-        df_processed = pd.concat([df_processed, ecg_dummies], axis=1)
-        df_processed = df_processed.drop('İstirahatEKG', axis=1)
-    
-    # Egzersiz angina dönüşümü (1: Var, 0: Yok)
-    if 'EgzersizAnginası' in df_processed.columns:
-        if df_processed['EgzersizAnginası'].isnull().any():
-            df_processed['EgzersizAnginası'] = df_processed['EgzersizAnginası'].fillna(0)
-    
-    # ST eğimi dönüşümü
-    if 'ST_Eğimi' in df_processed.columns:
-        # Eksik değerleri doldurma
-        if df_processed['ST_Eğimi'].isnull().any():
-            df_processed['ST_Eğimi'] = df_processed['ST_Eğimi'].fillna(1)
-        
-        # One-hot encoding
-        st_slope_dummies = pd.get_dummies(df_processed['ST_Eğimi'], prefix='ST_Eğimi')
-        df_processed = pd.concat([df_processed, st_slope_dummies], axis=1)
-        df_processed = df_processed.drop('ST_Eğimi', axis=1)
-    
-    # Sayısal değişkenlerdeki eksik değerleri doldurma
-    numeric_cols = ['Yaş', 'İstirahatKanBasıncı', 'Kolesterol', 'AçlıkKanŞekeri', 'MaksimumKalpHızı', 'STDepresyonu']
-    for col in numeric_cols:
-        if col in df_processed.columns and df_processed[col].isnull().any():
-            df_processed[col] = df_processed[col].fillna(df_processed[col].mean() if len(df_processed) > 1 else 0)
-    
-    # Eğitim verisi değilse, referans sütunlara göre düzenleme
-    if not is_training and reference_columns is not None:
-        # Eksik sütunları ekle
-        for col in reference_columns:
-            if col not in df_processed.columns:
-                df_processed[col] = 0
-        
-        # Sütun sırasını düzenle
-        df_processed = df_processed[reference_columns]
-    
-    return df_processed
-
-# Veri setini ön işleme
-df_processed = preprocess_data(df, is_training=True)
-
-# Bağımsız değişkenler ve hedef değişken
-X = df_processed.drop('KalpHastalığı', axis=1)
-feature_names = X.columns.tolist()
-y = df_processed['KalpHastalığı']
-
-# Veri setini eğitim ve test olarak bölme
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=random_state)
-
-# Veri ölçeklendirme
-scaler = StandardScaler()
-X_train_scaled = scaler.fit_transform(X_train)
-X_test_scaled = scaler.transform(X_test)
-
-# Model seçimi ve eğitimi
-def train_model(model_option, X_train, y_train):
-    if model_option == "Lojistik Regresyon":
-        model = LogisticRegression(max_iter=1000, random_state=random_state)
-    elif model_option == "Rastgele Orman":
-        model = RandomForestClassifier(n_estimators=100, random_state=random_state)
-    elif model_option == "Destek Vektör Makinesi":
-        model = SVC(probability=True, random_state=random_state)
-    
-    model.fit(X_train, y_train)
-    return model
+# Eğitilmiş model (süreç genelinde önbellekten gelir; veri dosyası değişirse yeniden eğitilir)
+trained = get_trained_model(model_option)
+model = trained.model
+feature_names = trained.feature_names
 
-# Modeli eğitme
-model = train_model(model_option, X_train_scaled, y_train)
+# Model grafikleri (model, hiperparametreler, veri özeti) başına bir kez çizilir
+model_params = {'model': model_option, 'params': trained.params}
 
-# Model performansını değerlendirme
-y_pred = model.predict(X_test_scaled)
-accuracy = accuracy_score(y_test, y_pred)
-conf_matrix = confusion_matrix(y_test, y_pred)
-class_report = classification_report(y_test, y_pred, output_dict=True)
+# Model performansı (test seti üzerinde, eğitim sırasında hesaplandı)
+accuracy = trained.metrics['accuracy']
+conf_matrix = trained.metrics['confusion_matrix']
+class_report = trained.metrics['classification_report']
 
 # Model sonuçlarını gösterme
 st.header("Model Performansı")
@@ -156,8 +58,8 @@ col1, col2 = st.columns(2)
 with col1:
     st.subheader("Model Bilgileri")
     st.write(f"**Seçilen Model:** {model_option}")
-    st.write(f"**Eğitim Veri Seti Boyutu:** {len(X_train)} örnek ({(1-test_size)*100:.0f}%)")
-    st.write(f"**Test Veri Seti Boyutu:** {len(X_test)} örnek ({test_size*100:.0f}%)")
+    st.write(f"**Eğitim Veri Seti Boyutu:** {trained.metrics['n_train']} örnek ({(1-TEST_SIZE)*100:.0f}%)")
+    st.write(f"**Test Veri Seti Boyutu:** {trained.metrics['n_test']} örnek ({TEST_SIZE*100:.0f}%)")
     st.write(f"**Doğruluk (Accuracy):** {accuracy:.4f} ({accuracy*100:.2f}%)")
     
     # Sınıflandırma raporu
@@ -186,31 +88,31 @@ with col2:
     # Karmaşıklık matrisi
     st.subheader("Karmaşıklık Matrisi (Confusion Matrix)")
     
-    fig, ax = plt.subplots(figsize=(8, 6))
-    sns.heatmap(conf_matrix, annot=True, fmt='d', cmap='Blues', ax=ax)
-    ax.set_xlabel('Tahmin Edilen Sınıf')
-    ax.set_ylabel('Gerçek Sınıf')
-    ax.set_title('Karmaşıklık Matrisi')
-    ax.set_xticklabels(['Kalp Hastalığı Yok (0)', 'Kalp Hastalığı Var (1)'])
-    ax.set_yticklabels(['Kalp Hastalığı Yok (0)', 'Kalp Hastalığı Var (1)'])
-    st.pyplot(fig)
+    def draw(ax):
+        sns.heatmap(conf_matrix, annot=True, fmt='d', cmap='Blues', ax=ax)
+        ax.set_xlabel('Tahmin Edilen Sınıf')
+        ax.set_ylabel('Gerçek Sınıf')
+        ax.set_title('Karmaşıklık Matrisi')
+        ax.set_xticklabels(['Kalp Hastalığı Yok (0)', 'Kalp Hastalığı Var (1)'])
+        ax.set_yticklabels(['Kalp Hastalığı Yok (0)', 'Kalp Hastalığı Var (1)'])
+    show_chart('karmasiklik_matrisi', draw, params=model_params, version=trained.fingerprint, figsize=(8, 6))
     
-    # Özellik önemleri (Rastgele Orman için)
-    if model_option == "Rastgele Orman":
-        st.subheader("Özellik Önemleri")
-        
-        feature_importances = model.feature_importances_
-        feature_importance_df = pd.DataFrame({
-            'Özellik': feature_names,
-            'Önem': feature_importances
-        }).sort_values('Önem', ascending=False)
-        
-        fig, ax = plt.subplots(figsize=(10, 8))
-        sns.barplot(data=feature_importance_df, x='Önem', y='Özellik', ax=ax)
-        ax.set_title("Özellik Önemleri (Rastgele Orman)")
-        ax.set_xlabel("Önem Derecesi")
-        ax.set_ylabel("Özellik")
-        st.pyplot(fig)
+    # Permütasyon önemi (tüm modeller için, görselleştirme sayfasıyla ortak)
+    st.subheader("Özellik Önemleri")
+    show_importance(trained)
+
+# Test setindeki tüm hastaların risk faktörlerinin özeti
+st.subheader("Test Seti Risk Faktörleri Özeti")
+st.markdown("Test setindeki her hasta için hesaplanan hastaya özgü katkıların ortalama mutlak değeri.")
+
+def draw(ax):
+    attribution = explain(trained, trained.encode(load_split().raw_test))
+    summary = attribution.mean_abs().iloc[::-1]
+    ax.barh(summary.index, summary.to_numpy(), color='steelblue', edgecolor='black')
+    ax.set_xlabel(f"Ortalama |Katkı| ({attribution.unit})")
+    ax.set_title(f"Test Seti Risk Faktörleri ({model_option}, {attribution.method})")
+    ax.grid(axis='x', alpha=0.3)
+show_chart('test_risk_faktorleri', draw, params=model_params, version=trained.fingerprint, figsize=(10, 6))
 
 # Tahmin bölümü
 st.header("Kalp Hastalığı Riski Tahmini")
@@ -290,64 +192,51 @@ with row6_col1:
 # Tahmin butonu
 if st.button("🔮 Tahmin Et", key="predict_button", type="primary"):
     try:
-        # Kullanıcı verilerini bir DataFrame'e dönüştürme (VERİ SETİNİZLE UYUMLU)
-        user_df = pd.DataFrame({
-            'Yaş': [age],
-            'Cinsiyet': [sex_value],
-            'GöğüsAğrısıTürü': [chest_pain_value],
-            'İstirahatKanBasıncı': [resting_bp],
-            'Kolesterol': [cholesterol],
-            'AçlıkKanŞekeri': [fasting_bs_value],
-            'İstirahatEKG': [resting_ecg_value],
-            'MaksimumKalpHızı': [max_hr],
-            'EgzersizAnginası': [exercise_angina_value],
-            'STDepresyonu': [st_depression],
-            'ST_Eğimi': [st_slope_value]
-        })
+        # Kullanıcı verileri (VERİ SETİNİZLE UYUMLU)
+        user_record = {
+            'Yaş': age,
+            'Cinsiyet': sex_value,
+            'GöğüsAğrısıTürü': chest_pain_value,
+            'İstirahatKanBasıncı': resting_bp,
+            'Kolesterol': cholesterol,
+            'AçlıkKanŞekeri': fasting_bs_value,
+            'İstirahatEKG': resting_ecg_value,
+            'MaksimumKalpHızı': max_hr,
+            'EgzersizAnginası': exercise_angina_value,
+            'STDepresyonu': st_depression,
+            'ST_Eğimi': st_slope_value
+        }
         
-        # Kullanıcı verilerini ön işleme (referans sütunlarla)
-        user_data_processed = preprocess_data(user_df, is_training=False, reference_columns=X.columns)
+        # Duyarlılık analizi form tekrar gönderilmeden bu kayıt üzerinde çalışır
+        st.session_state['prediction_record'] = user_record
+
+        # Kullanıcı verilerini eğitim sütunlarına göre kodlama (eksik değerler doldurulur)
+        user_data_processed = trained.encoder.encode(user_record)
         
         # Debug bilgisi
         if st.checkbox("Debug bilgilerini göster"):
             st.write("**Orijinal veri:**")
-            st.dataframe(user_df)
+            st.dataframe(pd.DataFrame([user_record]))
             st.write("**İşlenmiş veri:**")
-            st.dataframe(user_data_processed)
+            st.dataframe(pd.DataFrame([user_data_processed], columns=feature_names))
             st.write("**Beklenen sütunlar:**")
-            st.write(X.columns.tolist())
-            st.write("**Mevcut sütunlar:**")
-            st.write(user_data_processed.columns.tolist())
-        
-        # Veri kontrolü
-        if user_data_processed.shape[1] != X.shape[1]:
-            st.error(f"Sütun sayısı uyuşmazlığı! Beklenen: {X.shape[1]}, Mevcut: {user_data_processed.shape[1]}")
-            st.stop()
-        
-        # NaN kontrolü
-        if user_data_processed.isnull().values.any():
-            st.warning("Eksik değerler tespit edildi ve 0 ile dolduruldu.")
-            user_data_processed = user_data_processed.fillna(0)
+            st.write(feature_names)
         
         # Verileri ölçeklendirme
-        user_data_scaled = scaler.transform(user_data_processed)
+        user_data_scaled = trained.transform(user_data_processed[np.newaxis, :])
         
         # Ölçeklendirme sonrası NaN kontrolü
         if np.isnan(user_data_scaled).any():
             st.warning("Ölçeklendirme sonrası NaN değerler tespit edildi ve 0 ile dolduruldu.")
             user_data_scaled = np.nan_to_num(user_data_scaled)
         
-        # Tahmin yapma
-        prediction = model.predict(user_data_scaled)
-        prediction_proba = model.predict_proba(user_data_scaled)
+        # Tahmin yapma (aynı kayıt ve model için süreç geneli önbellekten)
+        prob_heart_disease = float(prediction_cache.predict(trained, [user_record])[0])
+        prob_no_heart_disease = 1.0 - prob_heart_disease
         
         # Sonuçları gösterme
         st.subheader("🎯 Tahmin Sonucu")
         
-        # Sonuç kartı
-        prob_heart_disease = prediction_proba[0][1]
-        prob_no_heart_disease = prediction_proba[0][0]
-        
         # Renk kodlamalı sonuç
         if prob_heart_disease >= 0.50:
             st.error(f"🚨 **YÜKSEK RİSK** - Kalp hastalığı riski: {prob_heart_disease:.1%}")
@@ -369,46 +258,53 @@ if st.button("🔮 Tahmin Et", key="predict_button", type="primary"):
         st.write(f"Sağlıklı Olma Oranı: {prob_no_heart_disease:.2%}")
         
         # Olasılık grafiği
-        fig, ax = plt.subplots(figsize=(10, 6))
-        
         categories = ['Sağlıklı', 'Kalp Hastalığı']
-        probabilities = [prob_no_heart_disease, prob_heart_disease]
+        probabilities = [float(prob_no_heart_disease), float(prob_heart_disease)]
         colors = ['lightgreen', 'lightcoral']
         
-        bars = ax.bar(categories, probabilities, color=colors, alpha=0.7, edgecolor='black')
-        
-        # Değerleri çubukların üzerine yazma
-        for bar, prob in zip(bars, probabilities):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 0.01,
-                   f'{prob:.1%}', ha='center', va='bottom', fontweight='bold')
-        
-        ax.set_ylabel('Olasılık')
-        ax.set_title('Kalp Hastalığı Risk Analizi')
-        ax.set_ylim(0, 1)
-        ax.grid(axis='y', alpha=0.3)
-        
-        # Eşik çizgisi
-        ax.axhline(y=0.5, color='red', linestyle='--', alpha=0.7, label='Risk Eşiği (%50)')
-        ax.legend()
-        
-        st.pyplot(fig)
-        
-        # Risk faktörleri analizi (sadece Random Forest için)
-        if model_option == "Rastgele Orman":
-            st.subheader("🔍 Risk Faktörleri Analizi")
-            
-            # En önemli özellikleri göster
-            feature_importances = model.feature_importances_
-            feature_importance_df = pd.DataFrame({
-                'Özellik': feature_names,
-                'Önem': feature_importances
-            }).sort_values('Önem', ascending=False).head(5)
-            
-            st.write("**En Önemli 5 Risk Faktörü:**")
-            for idx, row in feature_importance_df.iterrows():
-                st.write(f"• {row['Özellik']}: {row['Önem']:.3f}")
+        def draw(ax):
+            bars = ax.bar(categories, probabilities, color=colors, alpha=0.7, edgecolor='black')
+
+            # Değerleri çubukların üzerine yazma
+            for bar, prob in zip(bars, probabilities):
+                height = bar.get_height()
+                ax.text(bar.get_x() + bar.get_width()/2., height + 0.01,
+                       f'{prob:.1%}', ha='center', va='bottom', fontweight='bold')
+
+            ax.set_ylabel('Olasılık')
+            ax.set_title('Kalp Hastalığı Risk Analizi')
+            ax.set_ylim(0, 1)
+            ax.grid(axis='y', alpha=0.3)
+
+            # Eşik çizgisi
+            ax.axhline(y=0.5, color='red', linestyle='--', alpha=0.7, label='Risk Eşiği (%50)')
+            ax.legend()
+        show_chart('risk_olasiligi', draw, params=probabilities)
         
+        # Hastaya özgü risk faktörleri (tüm modeller için)
+        st.subheader("🔍 Risk Faktörleri Analizi")
+        attribution = explain(trained, user_data_scaled)
+        unit_text = "yüzde puan" if attribution.unit == 'olasılık' else "log-odds"
+        st.write(f"**Bu tahminde en etkili 5 faktör** ({attribution.method} yöntemi, {unit_text}):")
+        for feature, contribution in attribution.top(0, 5):
+            direction = "riski artırıyor" if contribution > 0 else "riski azaltıyor"
+            value = contribution * 100 if attribution.unit == 'olasılık' else contribution
+            st.write(f"• {feature}: {value:+.2f} ({direction})")
+
+        contributions = attribution.contributions[0].tolist()
+
+        def draw(ax):
+            order = np.argsort(np.abs(contributions))
+            values = [contributions[i] for i in order]
+            ax.barh([attribution.features[i] for i in order], values,
+                    color=['lightcoral' if v > 0 else 'lightgreen' for v in values], edgecolor='black')
+            ax.axvline(x=0, color='black', linewidth=0.8)
+            ax.set_xlabel(f"Riske Katkı ({attribution.unit})")
+            ax.set_title(f"Hastaya Özgü Risk Faktörleri ({model_option})")
+            ax.grid(axis='x', alpha=0.3)
+        show_chart('hasta_risk_faktorleri', draw, params={'contributions': contributions, 'model': model_params},
+                   figsize=(10, 6))
+
         # Uyarı mesajı
         st.warning("""
         ⚠️ **ÖNEMLİ UYARI:** 
@@ -422,6 +318,98 @@ if st.button("🔮 Tahmin Et", key="predict_button", type="primary"):
         st.write(f"Hata tipi: {type(e).__name__}")
         st.write("Lütfen girdiğiniz değerlerin doğru formatta olduğundan emin olun ve tekrar deneyin.")
 
+# Duyarlılık (what-if) analizi: son tahmin edilen kayıt üzerinde
+prediction_record = st.session_state.get('prediction_record')
+if prediction_record is not None:
+    st.header("🧪 Duyarlılık Analizi")
+    st.markdown("Son tahmindeki değerlerden bir ya da ikisi farklı olsaydı riskin nasıl değişeceğini gösterir. "
+                "Diğer tüm değerler sabit tutulur.")
+
+    sweep_col1, sweep_col2 = st.columns(2)
+    with sweep_col1:
+        sweep_features = st.multiselect("Değiştirilecek özellikler (en fazla 2)", options=list(SWEEP_FEATURES),
+                                        default=['Kolesterol'], max_selections=2, key="sweep_features")
+    with sweep_col2:
+        sweep_steps = st.slider("Özellik başına nokta sayısı", min_value=20, max_value=DEFAULT_STEPS,
+                                value=DEFAULT_STEPS, step=10, key="sweep_steps")
+
+    if sweep_features:
+        sweep = sensitivity_sweep(trained, prediction_record, sweep_features, sweep_steps)
+        st.caption(f"{sweep.risk.size:,} senaryo tek seferde puanlandı ({sweep.seconds * 1000:.0f} ms). "
+                   f"Risk aralığı: {sweep.risk.min():.1%} – {sweep.risk.max():.1%}, mevcut değerlerle: {sweep.baseline:.1%}")
+
+        current = [prediction_record[feature] for feature in sweep_features]
+
+        def draw(ax):
+            if len(sweep_features) == 1:
+                ax.plot(sweep.grids[0], sweep.risk, color='steelblue', linewidth=2)
+                ax.axhline(y=0.5, color='red', linestyle='--', alpha=0.7, label='Risk Eşiği (%50)')
+                ax.axvline(x=current[0], color='gray', linestyle=':', label='Mevcut Değer')
+                ax.scatter(current, [sweep.baseline], color='black', zorder=3)
+                ax.set_ylim(0, 1)
+                ax.set_xlabel(sweep_features[0])
+                ax.set_ylabel('Kalp Hastalığı Riski')
+                ax.grid(alpha=0.3)
+                ax.legend()
+            else:
+                mesh = ax.pcolormesh(sweep.grids[1], sweep.grids[0], sweep.risk,
+                                     cmap='RdYlGn_r', vmin=0, vmax=1, shading='auto')
+                if sweep.risk.min() < 0.5 < sweep.risk.max():
+                    ax.contour(sweep.grids[1], sweep.grids[0], sweep.risk, levels=[0.5], colors='black', linewidths=1.5)
+                ax.scatter([current[1]], [current[0]], color='black', marker='x', s=80, label='Mevcut Değerler')
+                ax.figure.colorbar(mesh, ax=ax, label='Kalp Hastalığı Riski')
+                ax.set_xlabel(sweep_features[1])
+                ax.set_ylabel(sweep_features[0])
+                ax.legend(loc='upper right')
+            ax.set_title(f"Duyarlılık Analizi ({model_option})")
+        show_chart('duyarlilik_analizi', draw,
+                   params={'record': prediction_record, 'features': sweep_features, 'steps': sweep_steps,
+                           'model': model_params},
+                   version=trained.fingerprint)
+
+# Toplu tahmin bölümü
+st.header("Toplu Risk Tahmini")
+st.markdown("`heart_cleaned.csv` ile aynı sütunlara sahip bir CSV dosyası yükleyerek çok sayıda hastanın riskini tek seferde tahmin edebilirsiniz.")
+
+uploaded_file = st.file_uploader("CSV dosyası yükleyin", type="csv", key="batch_file")
+
+if uploaded_file is not None and st.button("📄 Toplu Tahmin Et", key="batch_button"):
+    try:
+        # Dosya parça parça okunup puanlanır
+        output = io.StringIO()
+        progress_text = st.empty()
+        stats = score_csv(uploaded_file, output, trained,
+                          progress=lambda rows: progress_text.write(f"{rows} satır puanlandı..."))
+        progress_text.empty()
+        st.session_state['batch_result'] = {
+            'csv': output.getvalue().encode('utf-8'),
+            'stats': stats,
+            'model': model_option,
+        }
+    except Exception as e:
+        st.error(f"❌ Toplu tahmin yapılırken bir hata oluştu: {str(e)}")
+
+batch_result = st.session_state.get('batch_result')
+if batch_result is not None:
+    stats = batch_result['stats']
+    st.write(f"**Kullanılan Model:** {batch_result['model']}")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Puanlanan Satır", stats['rows'])
+    with col2:
+        st.metric("Süre", f"{stats['seconds']:.2f} s")
+    with col3:
+        st.metric("Satır / Saniye", f"{stats['rows_per_second']:,.0f}")
+
+    st.download_button(
+        "📥 Sonuçları İndir",
+        data=batch_result['csv'],
+        file_name="risk_tahminleri.csv",
+        mime="text/csv",
+        key="batch_download"
+    )
+
 # Açıklama bölümü
 st.header("📚 Model Hakkında Bilgi")
 
@@ -434,6 +422,8 @@ st.markdown("""
 
 3. **Destek Vektör Makinesi (SVM):** Veri noktaları arasındaki en iyi ayırma sınırını bulan bir algoritma.
 
+4. **Histogram Gradyan Artırma:** Ağaçları sırayla, bir öncekinin hatalarını düzeltecek şekilde ekleyen ve sayısal değerleri kutulara bölerek büyük veri setlerinde hızlı eğitilen bir topluluk algoritması. Göğüs ağrısı türü, istirahat EKG ve ST eğimi doğrudan kategorik özellik olarak kullanılır.
+
 **Değerlendirme Metrikleri:**
 
 - **Doğruluk (Accuracy):** Doğru tahmin edilen örneklerin toplam örnek sayısına oranı.
@@ -456,6 +446,26 @@ st.markdown("""
 - **ST_Eğimi:** ST eğimi (0: Düşük, 1: Düz, 2: Yüksek)
 """)
 
+# Aşama süreleri (salt okunur yönetici paneli, PIPELINE_METRICS_PANEL=1 ile gösterilir)
+if ADMIN_PANEL:
+    with st.expander("⏱️ Aşama Süreleri"):
+        summary = metrics.summary()
+        if not metrics.enabled:
+            st.write("Ölçüm kapalı; açmak için uygulamayı PIPELINE_METRICS=1 ile başlatın.")
+        elif not summary:
+            st.write("Henüz ölçüm yok. Önbellekteki modeller ve grafikler yeniden hesaplanmaz.")
+        else:
+            st.dataframe(pd.DataFrame(summary).rename(columns={
+                'stage': 'Aşama', 'count': 'Adet', 'total_s': 'Toplam (s)', 'mean_ms': 'Ortalama (ms)',
+                'p50_ms': 'Ortanca (ms)', 'p95_ms': '%95 (ms)'}), hide_index=True)
+            recent = pd.DataFrame(metrics.recent(50)[::-1], columns=['Zaman', 'Aşama', 'Süre (ms)'])
+            recent['Zaman'] = pd.to_datetime(recent['Zaman'], unit='s').dt.strftime('%H:%M:%S')
+            recent['Süre (ms)'] = recent['Süre (ms)'] * 1000
+            st.write("**Son ölçümler:**")
+            st.dataframe(recent, hide_index=True)
+            st.download_button("📥 Prometheus metni", data=metrics.prometheus(), file_name="metrics.prom",
+                               mime="text/plain", key="metrics_download")
+
 # Footer
 st.markdown("---")
 st.markdown("© 2024 Kalp Hastalığı Analiz Platformu | Streamlit ile geliştirilmiştir.")
@@ -1,7 +1,12 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+
+from core.data import data_fingerprint, load_data
+from core.figures import show_chart
+from core.lazy import lazy_import
+
+# Yalnızca önbellekte olmayan bir grafik çizilirken içe aktarılır
+sns = lazy_import('seaborn')
 
 # Sayfa yapılandırması
 st.set_page_config(
@@ -99,16 +104,15 @@ with tab2:
     risk_factors = ['Yüksek Tansiyon', 'Yüksek Kolesterol', 'Sigara', 'Diyabet', 'Obezite', 'Hareketsizlik']
     risk_impact = [75, 70, 65, 60, 55, 50]  # Örnek etki yüzdeleri
     
-    fig, ax = plt.subplots(figsize=(10, 6))
-    bars = ax.barh(risk_factors, risk_impact, color=sns.color_palette("Blues_r"))
-    ax.set_xlabel('Kalp Hastalığı Riskine Etkisi (%)')
-    ax.set_xlim(0, 100)
-    
-    # Değerleri çubukların üzerine ekleme
-    for i, v in enumerate(risk_impact):
-        ax.text(v + 1, i, f"{v}%", va='center')
-    
-    st.pyplot(fig)
+    def draw(ax):
+        bars = ax.barh(risk_factors, risk_impact, color=sns.color_palette("Blues_r"))
+        ax.set_xlabel('Kalp Hastalığı Riskine Etkisi (%)')
+        ax.set_xlim(0, 100)
+
+        # Değerleri çubukların üzerine ekleme
+        for i, v in enumerate(risk_impact):
+            ax.text(v + 1, i, f"{v}%", va='center')
+    show_chart('risk_faktorleri', draw)
     
     st.markdown("""
     **Not:** Yukarıdaki grafik, risk faktörlerinin kalp hastalığı üzerindeki tahmini etkisini göstermektedir. 
@@ -170,29 +174,29 @@ with tab3:
     effectiveness = [85, 80, 90, 75, 70, 60]  # Örnek etkinlik yüzdeleri
     
     # Pasta grafiği
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
-    # Renk paleti
-    colors = sns.color_palette('Blues', len(prevention_methods))
-    
-    # Pasta dilimlerini oluşturma
-    wedges, texts, autotexts = ax.pie(
-        effectiveness, 
-        labels=prevention_methods,
-        autopct='%1.1f%%',
-        startangle=90,
-        colors=colors,
-        wedgeprops={'edgecolor': 'white', 'linewidth': 1}
-    )
-    
-    # Pasta grafiğini çembere dönüştürme
-    ax.axis('equal')
-    
-    # Metin özelliklerini ayarlama
-    plt.setp(autotexts, size=10, weight='bold')
-    plt.setp(texts, size=10)
-    
-    st.pyplot(fig)
+    def draw(ax):
+        # Renk paleti
+        colors = sns.color_palette('Blues', len(prevention_methods))
+
+        # Pasta dilimlerini oluşturma
+        wedges, texts, autotexts = ax.pie(
+            effectiveness, 
+            labels=prevention_methods,
+            autopct='%1.1f%%',
+            startangle=90,
+            colors=colors,
+            wedgeprops={'edgecolor': 'white', 'linewidth': 1}
+        )
+
+        # Pasta grafiğini çembere dönüştürme
+        ax.axis('equal')
+
+        # Metin özelliklerini ayarlama
+        for text in autotexts:
+            text.set(size=10, weight='bold')
+        for text in texts:
+            text.set(size=10)
+    show_chart('korunma_yontemleri', draw)
     
     st.markdown("""
     **Not:** Yukarıdaki grafik, korunma yöntemlerinin kalp hastalığı riskini azaltmadaki tahmini etkinliğini göstermektedir. 
@@ -206,13 +210,9 @@ with tab4:
     Bu uygulamada kullanılan veri seti, kalp hastalığı teşhisi için çeşitli klinik parametreleri içermektedir.
     """)
     
-    # Veri setini yükleme
-    @st.cache_data
-    def load_data():
-        data = pd.read_csv('heart_cleaned.csv')
-        return data
-    
+    # Veri setini yükleme (sütunlu kopyadan, süreç içinde paylaşılır)
     df = load_data()
+    data_version = data_fingerprint()
     
     # Veri seti özellikleri açıklaması
     st.subheader("Veri Seti Özellikleri")
@@ -274,24 +274,24 @@ with tab4:
     
     with col1:
         # Yaş dağılımı
-        fig, ax = plt.subplots(figsize=(10, 6))
-        sns.histplot(data=df, x='Yaş', hue='KalpHastalığı', multiple='stack', bins=20, ax=ax)
-        ax.set_title('Yaş Dağılımı ve Kalp Hastalığı İlişkisi')
-        ax.set_xlabel('Yaş')
-        ax.set_ylabel('Hasta Sayısı')
-        ax.legend(['Normal', 'Kalp Hastalığı'])
-        st.pyplot(fig)
+        def draw(ax):
+            sns.histplot(data=df, x='Yaş', hue='KalpHastalığı', multiple='stack', bins=20, ax=ax)
+            ax.set_title('Yaş Dağılımı ve Kalp Hastalığı İlişkisi')
+            ax.set_xlabel('Yaş')
+            ax.set_ylabel('Hasta Sayısı')
+            ax.legend(['Normal', 'Kalp Hastalığı'])
+        show_chart('yas_dagilimi_hedef_yigin', draw, version=data_version)
     
     with col2:
         # Cinsiyet ve kalp hastalığı ilişkisi
-        fig, ax = plt.subplots(figsize=(10, 6))
-        sns.countplot(data=df, x='Cinsiyet', hue='KalpHastalığı', ax=ax)
-        ax.set_title('Cinsiyet ve Kalp Hastalığı İlişkisi')
-        ax.set_xlabel('Cinsiyet')
-        ax.set_ylabel('Hasta Sayısı')
-        ax.set_xticklabels(['Kadın', 'Erkek'])
-        ax.legend(['Normal', 'Kalp Hastalığı'])
-        st.pyplot(fig)
+        def draw(ax):
+            sns.countplot(data=df, x='Cinsiyet', hue='KalpHastalığı', ax=ax)
+            ax.set_title('Cinsiyet ve Kalp Hastalığı İlişkisi')
+            ax.set_xlabel('Cinsiyet')
+            ax.set_ylabel('Hasta Sayısı')
+            ax.set_xticklabels(['Kadın', 'Erkek'])
+            ax.legend(['Normal', 'Kalp Hastalığı'])
+        show_chart('cinsiyet_hedef_sayim', draw, version=data_version)
 
 # Footer
 st.markdown("---")
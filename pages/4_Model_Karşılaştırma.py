@@ -0,0 +1,87 @@
+import streamlit as st
+
+from core.comparison import CV_FOLDS, RF_PARAM_GRID, candidate_models, collect_results, leaderboard, run_comparison
+from core.figures import show_chart
+
+# Sayfa yapılandırması
+st.set_page_config(
+    page_title="Model Karşılaştırma - Kalp Yetmezliği Analiz Platformu",
+    page_icon="🏆",
+    layout="wide"
+)
+
+# Sayfa başlığı
+st.title("🏆 Model Karşılaştırma")
+st.markdown("""
+Bu sayfada uygulamadaki modeller k-katlı çapraz doğrulama ile karşılaştırılır.
+Katlar tüm işlemci çekirdeklerinde paralel olarak puanlanır ve sonuçlar diske kaydedilir;
+daha önce puanlanmış katlar tekrar hesaplanmaz.
+""")
+
+# Sidebar oluşturma
+st.sidebar.header("Karşılaştırma Seçenekleri")
+
+grid_size = 1
+for values in RF_PARAM_GRID.values():
+    grid_size *= len(values)
+
+include_grid = st.sidebar.checkbox(f"Rastgele Orman parametre ızgarasını dahil et ({grid_size} aday)", value=False)
+n_splits = st.sidebar.slider("Kat Sayısı", min_value=3, max_value=10, value=CV_FOLDS)
+
+candidates = candidate_models(include_grid=include_grid)
+results, pending = collect_results(candidates, n_splits)
+
+st.write(f"**Aday Model Sayısı:** {len(candidates)}")
+st.write(f"**Puanlanmış Kat:** {len(results)} / {len(results) + len(pending)}")
+
+if pending:
+    st.info(f"{len(pending)} kat henüz puanlanmadı. Karşılaştırmayı çalıştırarak eksik katları hesaplayabilirsiniz.")
+
+    if st.button("▶️ Karşılaştırmayı Çalıştır", key="run_comparison", type="primary"):
+        progress_bar = st.progress(0.0)
+        results = run_comparison(
+            candidates, n_splits,
+            progress=lambda done, total: progress_bar.progress(done / total, text=f"{done} / {total} kat")
+        )
+        progress_bar.empty()
+        st.success("✅ Tüm katlar puanlandı.")
+
+table = leaderboard(results)
+
+if table.empty:
+    st.warning("Henüz puanlanmış kat yok.")
+    st.stop()
+
+# Sıralama tablosu
+st.header("Sıralama Tablosu")
+
+display_table = table.rename(columns={
+    'accuracy_ort': 'Doğruluk (ort.)', 'accuracy_std': 'Doğruluk (std)',
+    'f1_ort': 'F1 (ort.)', 'f1_std': 'F1 (std)',
+    'roc_auc_ort': 'ROC AUC (ort.)', 'roc_auc_std': 'ROC AUC (std)',
+    'eğitim_s': 'Eğitim Süresi (s)',
+})
+st.dataframe(display_table.round(4))
+
+best = table.iloc[0]
+st.success(f"**En iyi model:** {best['Model']} {best['Parametreler']} — "
+           f"F1: {best['f1_ort']:.4f} ± {best['f1_std']:.4f}, Doğruluk: {best['accuracy_ort']:.4f}")
+
+# En iyi adayların F1 skorları
+st.subheader("F1 Skoru (Katlar Arası Ortalama ± Standart Sapma)")
+
+top = table.head(15).iloc[::-1]
+labels = [f"{row['Model']} {row['Parametreler']}" if include_grid else row['Model'] for _, row in top.iterrows()]
+chart_params = {'labels': labels, 'f1': top['f1_ort'].tolist(), 'std': top['f1_std'].tolist()}
+
+def draw(ax):
+    ax.barh(labels, top['f1_ort'], xerr=top['f1_std'], color='coral', alpha=0.8, capsize=4)
+    ax.set_xlabel("F1 Skoru")
+    ax.set_xlim(max(0.0, top['f1_ort'].min() - 0.1), 1.0)
+    ax.grid(axis='x', alpha=0.3)
+show_chart('f1_siralama', draw, params=chart_params, figsize=(12, max(4, 0.5 * len(top))))
+
+# Footer
+st.markdown("---")
+st.markdown("© 2024 Kalp Hastalığı Analiz Platformu | Streamlit ile geliştirilmiştir.")
+st.markdown("*Bu uygulama sadece eğitim ve bilgilendirme amaçlıdır.*")
@@ -0,0 +1,12 @@
+"""
+Testler depo kökünden çalışır (veri ve model dosyaları göreli yollarla açılır).
+
+Kullanım:
+    python -m pytest tests
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
@@ -0,0 +1,84 @@
+"""Histogram gradyan artırmanın kategori kodlarını (core.boosting) doğru işlemesi."""
+import numpy as np
+import pytest
+
+from core.data import load_data
+from core.models import fit_scaler, get_trained_model, load_split, model_feature_names
+from core.portable import export_model
+from core.preprocessing import ONE_HOT_FEATURES, RAW_FEATURES, FeatureEncoder, category_columns
+from core.runtime import load_portable
+
+MODEL_OPTION = "Histogram Gradyan Artırma"
+TOLERANCE = 1e-12
+# Veri setindeki kategori kodları
+CATEGORIES = {'GöğüsAğrısıTürü': range(4), 'İstirahatEKG': range(3), 'ST_Eğimi': range(3)}
+
+
+@pytest.fixture(scope='module')
+def trained():
+    return get_trained_model(MODEL_OPTION)
+
+
+@pytest.fixture(scope='module')
+def record():
+    return load_data()[RAW_FEATURES].iloc[0].astype(np.float64).to_dict()
+
+
+def _category_records(record):
+    return [(name, code, {**record, name: float(code)})
+            for name, codes in CATEGORIES.items() for code in codes]
+
+
+def test_layout_has_unscaled_code_columns(trained):
+    columns = category_columns(trained.feature_names)
+    assert [trained.feature_names[i] for i in columns] == list(ONE_HOT_FEATURES)
+    assert not any(name.rpartition('_')[0] in ONE_HOT_FEATURES for name in trained.feature_names)
+    np.testing.assert_array_equal(trained.scaler.mean_[columns], 0.0)
+    np.testing.assert_array_equal(trained.scaler.scale_[columns], 1.0)
+
+
+def test_each_category_reaches_the_model_as_known_code(trained, record):
+    model = trained.model.model_
+    encoder = model._preprocessor.named_transformers_['encoder']
+    known = dict(zip(ONE_HOT_FEATURES, encoder.categories_))
+    for name, code, categorical in _category_records(record):
+        X = trained.encode([categorical])
+        assert X[0, trained.feature_names.index(name)] == code
+        # Bilinmeyen kodlar eksik değer sayılırdı; eğitimde her kategori görülmüş olmalı
+        assert code in known[name], (name, code)
+        proba = trained.predict_proba(X)
+        assert np.isfinite(proba).all() and np.allclose(proba.sum(axis=1), 1.0)
+
+
+def test_unknown_code_is_treated_as_missing(trained, record):
+    unknown = trained.encode([{**record, 'GöğüsAğrısıTürü': 7.0}])
+    missing = unknown.copy()
+    missing[0, trained.feature_names.index('GöğüsAğrısıTürü')] = np.nan
+    np.testing.assert_array_equal(trained.predict_proba(unknown), trained.predict_proba(missing))
+
+
+def test_categories_change_the_prediction(trained):
+    # Her kategorik özellik için en az bir hastanın riski kategoriye göre değişir
+    records = load_split().raw_test.astype(np.float64).to_dict('records')
+    for name, codes in CATEGORIES.items():
+        risks = np.stack([trained.predict_proba(trained.encode([{**r, name: float(c)} for r in records]))[:, 1]
+                          for c in codes])
+        assert np.ptp(risks, axis=0).max() > 0, name
+
+
+def test_portable_runtime_matches_each_category(trained, record, tmp_path):
+    portable = load_portable(export_model(trained, directory=tmp_path))
+    records = [categorical for _, _, categorical in _category_records(record)]
+    records.append({**record, 'ST_Eğimi': 7.0})
+    expected = trained.predict_proba(trained.encode(records))[:, 1]
+    np.testing.assert_allclose(portable.predict_risk(records), expected, rtol=0, atol=TOLERANCE)
+
+
+def test_constant_category_keeps_its_code():
+    # Tek kategorili bir eğitim alt kümesinde kod sütunu sabittir; ölçekleme onu 0'a çekmemeli
+    names = model_feature_names(MODEL_OPTION)
+    raw = load_split().raw_train
+    raw = raw[raw['ST_Eğimi'] == 2]
+    X = FeatureEncoder(names).encode_batch(raw)
+    X_scaled = fit_scaler(X, names).transform(X)
+    np.testing.assert_array_equal(X_scaled[:, names.index('ST_Eğimi')], 2.0)
@@ -0,0 +1,69 @@
+"""FeatureEncoder'ın preprocess_data ile aynı özellik matrisini ürettiğinin kontrolü."""
+import numpy as np
+import pytest
+
+from core.data import load_data
+from core.models import load_split
+from core.preprocessing import RAW_FEATURES, FeatureEncoder, preprocess_data
+
+
+@pytest.fixture(scope='module')
+def feature_names():
+    return load_split().feature_names
+
+
+@pytest.fixture(scope='module')
+def raw():
+    return load_data()[RAW_FEATURES].reset_index(drop=True)
+
+
+def _expected(df, feature_names):
+    return preprocess_data(df, True)[feature_names].to_numpy(dtype=np.float64)
+
+
+def test_encode_batch_matches_preprocess(raw, feature_names):
+    encoder = FeatureEncoder(feature_names)
+    np.testing.assert_array_equal(encoder.encode_batch(raw), _expected(raw, feature_names))
+
+
+def test_encode_batch_fills_missing_and_unseen_categories(raw, feature_names):
+    df = raw.copy()
+    # Kategorik eksik değerler FILL_VALUES ile doldurulur
+    df.loc[0, 'GöğüsAğrısıTürü'] = np.nan
+    df.loc[1, 'İstirahatEKG'] = np.nan
+    df.loc[2, 'ST_Eğimi'] = np.nan
+    df.loc[3, ['Cinsiyet', 'EgzersizAnginası']] = np.nan
+    df.loc[4, ['GöğüsAğrısıTürü', 'İstirahatEKG', 'ST_Eğimi']] = np.nan
+    # Eğitimde görülmeyen kodların one-hot sütunları 0 kalır
+    df.loc[5, 'GöğüsAğrısıTürü'] = 7
+    df.loc[6, 'İstirahatEKG'] = 9
+    df.loc[7, 'ST_Eğimi'] = 5
+
+    encoder = FeatureEncoder(feature_names)
+    np.testing.assert_array_equal(encoder.encode_batch(df), _expected(df, feature_names))
+
+
+def test_encode_batch_fills_missing_numeric_like_single_rows(raw, feature_names):
+    # Sayısal eksik değerler preprocess_data'nın tek satırlık davranışındaki gibi 0 ile
+    # doldurulur (çok satırlı çerçevede preprocess_data sütun ortalamasını kullanır)
+    df = raw.head(6).copy()
+    for i, name in enumerate(['Yaş', 'İstirahatKanBasıncı', 'Kolesterol', 'AçlıkKanŞekeri',
+                              'MaksimumKalpHızı', 'STDepresyonu']):
+        df.loc[i, name] = np.nan
+    df.loc[5, 'GöğüsAğrısıTürü'] = np.nan
+
+    encoder = FeatureEncoder(feature_names)
+    expected = np.vstack([
+        preprocess_data(df.iloc[[i]], False, feature_names).to_numpy(dtype=np.float64) for i in range(len(df))
+    ])
+    np.testing.assert_array_equal(encoder.encode_batch(df), expected)
+    np.testing.assert_array_equal(np.vstack([encoder.encode(row) for row in df.to_numpy()]), expected)
+
+
+def test_encode_accepts_records(raw, feature_names):
+    encoder = FeatureEncoder(feature_names)
+    df = raw.head(20)
+    records = df.to_dict('records')
+    expected = encoder.encode_batch(df)
+    np.testing.assert_array_equal(encoder.encode_batch(records), expected)
+    np.testing.assert_array_equal(np.vstack([encoder.encode(r) for r in records]), expected)
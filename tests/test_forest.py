@@ -0,0 +1,76 @@
+"""Derlenmiş ormanın (core.forest) RandomForestClassifier.predict_proba ile bit düzeyinde eşitliği."""
+import numpy as np
+import pytest
+
+from core import forest
+from core.forest import CHUNK_ROWS, FLAT_MAX_ROWS, FlatForest
+from core.models import RANDOM_STATE, get_trained_model, load_split
+
+
+def _with_missing(X, rng, fraction=0.2):
+    X = np.array(X, dtype=np.float64)
+    X[rng.random(X.shape) < fraction] = np.nan
+    return X
+
+
+def _rows(X, n_rows, rng):
+    return X[rng.integers(0, len(X), size=n_rows)]
+
+
+@pytest.fixture(scope='module')
+def split():
+    return load_split()
+
+
+@pytest.fixture(scope='module')
+def app_forest(split):
+    trained = get_trained_model("Rastgele Orman")
+    return trained.model, trained.transform(split.X_test)
+
+
+@pytest.fixture(scope='module')
+def missing_forest(split):
+    # Eğitimde eksik değer görmüş orman: düğümlerde eksik değerin yönü (missing_go_to_left) öğrenilir
+    from sklearn.ensemble import RandomForestClassifier
+
+    rng = np.random.default_rng(RANDOM_STATE)
+    X_train = _with_missing(split.X_train.to_numpy(np.float64), rng)
+    model = RandomForestClassifier(n_estimators=50, random_state=RANDOM_STATE).fit(X_train, split.y_train)
+    return model, split.X_test.to_numpy(np.float64)
+
+
+@pytest.fixture(params=['app_forest', 'missing_forest'])
+def model_and_X(request):
+    return request.getfixturevalue(request.param)
+
+
+def _assert_equal(model, X):
+    expected = model.predict_proba(X)
+    np.testing.assert_array_equal(forest.predict_proba(model, X), expected)
+    np.testing.assert_array_equal(FlatForest.from_sklearn(model).predict_proba(X), expected)
+
+
+def test_test_split(model_and_X):
+    model, X = model_and_X
+    assert len(X) <= FLAT_MAX_ROWS
+    _assert_equal(model, X)
+
+
+@pytest.mark.parametrize('n_rows', [1, 7, FLAT_MAX_ROWS, FLAT_MAX_ROWS + 1, CHUNK_ROWS + 100])
+def test_rows_with_missing_values(model_and_X, n_rows):
+    model, X = model_and_X
+    rng = np.random.default_rng(n_rows)
+    _assert_equal(model, _with_missing(_rows(X, n_rows, rng), rng))
+
+
+def test_single_row_vector(app_forest):
+    model, X = app_forest
+    np.testing.assert_array_equal(FlatForest.from_sklearn(model).predict_proba(X[0]), model.predict_proba(X[:1]))
+
+
+def test_compiled_once_and_only_for_forests(app_forest):
+    from sklearn.linear_model import LogisticRegression
+
+    model, X = app_forest
+    assert forest.compile_forest(model) is forest.compile_forest(model)
+    assert forest.compile_forest(LogisticRegression()) is None
@@ -0,0 +1,55 @@
+"""Taşınabilir modellerin (core.portable, core.runtime) scikit-learn modelleriyle eşitliği."""
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from core.data import load_data
+from core.models import MODEL_OPTIONS, get_trained_model, load_split
+from core.portable import export_model
+from core.preprocessing import RAW_FEATURES
+from core.runtime import load_portable
+
+# Ölçülen en büyük fark ~1e-14 (toplama sırasındaki yuvarlama)
+TOLERANCE = 1e-12
+
+
+@pytest.fixture(scope='module')
+def split():
+    return load_split()
+
+
+@pytest.fixture(scope='module', params=MODEL_OPTIONS)
+def exported(request, tmp_path_factory):
+    trained = get_trained_model(request.param)
+    path = export_model(trained, directory=tmp_path_factory.mktemp('portable'))
+    return trained, load_portable(path)
+
+
+def test_test_split_parity(exported, split):
+    trained, portable = exported
+    X_scaled = trained.encode(split.raw_test)
+    np.testing.assert_allclose(portable.predict_proba(X_scaled), trained.model.predict_proba(X_scaled),
+                               rtol=0, atol=TOLERANCE)
+
+
+def test_raw_records_parity(exported):
+    trained, portable = exported
+    df = load_data()[RAW_FEATURES].sample(200, random_state=0).reset_index(drop=True).astype(np.float64)
+    df.loc[0, 'Kolesterol'] = np.nan
+    df.loc[1, 'ST_Eğimi'] = np.nan
+    records = df.to_dict('records')
+
+    expected = trained.predict_proba(trained.encode(records))[:, 1]
+    np.testing.assert_allclose(portable.predict_risk(records), expected, rtol=0, atol=TOLERANCE)
+    np.testing.assert_allclose(portable.predict_risk(df), expected, rtol=0, atol=TOLERANCE)
+    assert portable.feature_names == trained.feature_names
+    assert portable.fingerprint == trained.fingerprint
+
+
+def test_runtime_does_not_import_pandas_or_sklearn():
+    code = ("import sys, core.runtime; "
+            "print(','.join(m for m in ('pandas', 'sklearn', 'streamlit') if m in sys.modules))")
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ''
@@ -0,0 +1,30 @@
+"""Duyarlılık analizinin (core.sensitivity) ızgaranın satır satır puanlanmasıyla eşitliği."""
+import numpy as np
+import pytest
+
+from core.data import load_data
+from core.models import MODEL_OPTIONS, get_trained_model
+from core.preprocessing import RAW_FEATURES
+from core.sensitivity import sensitivity_sweep, sweep_matrix
+
+# RBF çekirdeğinin çarpanlara ayrılması toplama sırasını değiştirir (~1e-14)
+TOLERANCE = 1e-12
+
+
+@pytest.fixture(scope='module')
+def records():
+    return load_data()[RAW_FEATURES].sample(3, random_state=0).astype(np.float64).to_dict('records')
+
+
+@pytest.mark.parametrize('model_option', MODEL_OPTIONS)
+@pytest.mark.parametrize('features', [['Kolesterol'], ['Kolesterol', 'MaksimumKalpHızı'],
+                                      ['MaksimumKalpHızı', 'İstirahatKanBasıncı']])
+def test_sweep_matches_grid_predict_proba(model_option, features, records):
+    trained = get_trained_model(model_option)
+    for record in records:
+        result = sensitivity_sweep(trained, record, features, steps=60)
+        assert result.risk.shape == tuple(len(grid) for grid in result.grids)
+        expected = trained.model.predict_proba(sweep_matrix(trained, record, features, result.grids))[:, 1]
+        np.testing.assert_allclose(result.risk.ravel(), expected, rtol=0, atol=TOLERANCE)
+        np.testing.assert_allclose(result.baseline, trained.predict_proba(trained.encode([record]))[0, 1],
+                                   rtol=0, atol=TOLERANCE)
@@ -0,0 +1,57 @@
+"""HTTP tahmin servisinin (core.service) hatalı isteklere yanıtları."""
+import asyncio
+import json
+
+import pytest
+
+from core.service import MAX_BODY_SIZE, PredictionService
+
+
+async def _exchange(request):
+    """İsteği geçici bir sunucuya gönderir; (durum kodu, başlıklar, JSON gövde) döndürür."""
+    service = PredictionService(workers=1)
+    server = await asyncio.start_server(service.handle_connection, '127.0.0.1', 0)
+    try:
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(request)
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), timeout=30)
+        writer.close()
+    finally:
+        server.close()
+        await server.wait_closed()
+        service.executor.shutdown()
+
+    head, _, body = response.partition(b'\r\n\r\n')
+    status_line, *header_lines = head.decode('latin-1').split('\r\n')
+    headers = {name.lower(): value.strip() for name, _, value in (line.partition(':') for line in header_lines)}
+    return int(status_line.split()[1]), headers, json.loads(body)
+
+
+def _request(content_length, body=b'{}', version=b'HTTP/1.1'):
+    return (b"POST /predict " + version + b"\r\nHost: localhost\r\n"
+            b"Content-Length: " + content_length + b"\r\n\r\n" + body)
+
+
+@pytest.mark.parametrize('content_length', [b'abc', b'-5', b'1.5', b'0x10', b'+3'])
+def test_malformed_content_length(content_length):
+    status, headers, body = asyncio.run(_exchange(_request(content_length)))
+    assert status == 400
+    assert headers['content-type'].startswith('application/json')
+    assert headers['connection'] == 'close'
+    assert 'Content-Length' in body['error']
+
+
+def test_oversized_body():
+    status, headers, body = asyncio.run(_exchange(_request(str(MAX_BODY_SIZE + 1).encode())))
+    assert status == 413
+    assert headers['connection'] == 'close'
+    assert 'error' in body
+
+
+def test_invalid_json():
+    # HTTP/1.0: yanıttan sonra bağlantı kapanır
+    status, _, body = asyncio.run(_exchange(_request(b'3', b'{x}', b'HTTP/1.0')))
+    assert status == 400
+    assert body == {'error': "Geçersiz JSON"}